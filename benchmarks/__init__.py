@@ -0,0 +1,10 @@
+# --------------------------------------------------------------------------------------------
+#  Copyright (c) 2024 Bentley Systems, Incorporated. All rights reserved.
+# --------------------------------------------------------------------------------------------
+
+"""Benchmarks for pure_interface hot paths.  Only the standard library is required.
+
+Run from the repository root:
+    python -m benchmarks run [-o results.json] [--width 5] [--depth 3]
+    python -m benchmarks compare baseline.json results.json [--threshold 0.1]
+"""
@@ -0,0 +1,67 @@
+# --------------------------------------------------------------------------------------------
+#  Copyright (c) 2024 Bentley Systems, Incorporated. All rights reserved.
+# --------------------------------------------------------------------------------------------
+
+import argparse
+import json
+import sys
+
+from . import compare, suite
+
+
+def _run(args: argparse.Namespace) -> int:
+    config = suite.Config(
+        width=args.width, depth=args.depth, number=args.number, repeat=args.repeat, development=not args.production
+    )
+    names = None
+    if args.filter:
+        names = [name for name in suite.benchmark_names() if any(f in name for f in args.filter)]
+    results = suite.run(config, names, log=print)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+def _compare(args: argparse.Namespace) -> int:
+    with open(args.old) as f:
+        old = json.load(f)
+    with open(args.new) as f:
+        new = json.load(f)
+    comparisons = compare.compare(old, new)
+    print(compare.report(comparisons, args.threshold))
+    regressions = [c.name for c in comparisons if c.is_regression(args.threshold)]
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) greater than {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="pure_interface benchmarks")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="run the benchmarks")
+    run_parser.add_argument("-o", "--output", help="write JSON results to this file")
+    run_parser.add_argument("--width", type=int, default=5, help="methods and attributes per interface")
+    run_parser.add_argument("--depth", type=int, default=3, help="interface inheritance depth")
+    run_parser.add_argument("--number", type=int, default=10000, help="operations per timing run")
+    run_parser.add_argument("--repeat", type=int, default=5, help="timing runs (fastest is reported)")
+    run_parser.add_argument("--production", action="store_true", help="run with set_is_development(False)")
+    run_parser.add_argument("-k", "--filter", action="append", help="only run benchmarks containing this text")
+    run_parser.set_defaults(func=_run)
+
+    compare_parser = subparsers.add_parser("compare", help="compare two result files")
+    compare_parser.add_argument("old")
+    compare_parser.add_argument("new")
+    compare_parser.add_argument(
+        "--threshold", type=float, default=0.1, help="flag slow downs greater than this fraction (default 0.1)"
+    )
+    compare_parser.set_defaults(func=_compare)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,61 @@
+# --------------------------------------------------------------------------------------------
+#  Copyright (c) 2024 Bentley Systems, Incorporated. All rights reserved.
+# --------------------------------------------------------------------------------------------
+
+"""Compares two benchmark result files."""
+
+from typing import List, NamedTuple
+
+
+class Comparison(NamedTuple):
+    name: str
+    unit: str
+    old: float
+    new: float
+
+    @property
+    def ratio(self) -> float:
+        """new / old, or NaN if old is not positive (e.g. a zero memory delta) and the results differ"""
+        if self.new == self.old:
+            return 1.0
+        return self.new / self.old if self.old > 0 else float("nan")
+
+    def _delta_limit(self, threshold: float) -> float:
+        """Results with no ratio are compared by absolute difference, which must exceed this to count"""
+        return threshold * max(abs(self.old), abs(self.new), 1.0)
+
+    def is_regression(self, threshold: float) -> bool:
+        if self.old > 0 or self.new == self.old:
+            return self.ratio > 1.0 + threshold
+        return self.new - self.old > self._delta_limit(threshold)
+
+    def is_improvement(self, threshold: float) -> bool:
+        if self.old > 0 or self.new == self.old:
+            return self.ratio < 1.0 / (1.0 + threshold)
+        return self.old - self.new > self._delta_limit(threshold)
+
+
+def compare(old: dict, new: dict) -> List[Comparison]:
+    """Returns comparisons for benchmarks that are in both results"""
+    old_results, new_results = old["results"], new["results"]
+    comparisons = []
+    for name, new_result in new_results.items():
+        old_result = old_results.get(name)
+        if old_result is None or old_result["unit"] != new_result["unit"]:
+            continue
+        comparisons.append(Comparison(name, new_result["unit"], old_result["value"], new_result["value"]))
+    return comparisons
+
+
+def report(comparisons: List[Comparison], threshold: float) -> str:
+    lines = [f"{'benchmark':40} {'old':>14} {'new':>14} {'ratio':>7}"]
+    for c in comparisons:
+        scale, unit = (1e9, "ns") if c.unit == "s" else (1, c.unit)
+        if c.is_regression(threshold):
+            flag = "  REGRESSION"
+        elif c.is_improvement(threshold):
+            flag = "  improved"
+        else:
+            flag = ""
+        lines.append(f"{c.name:40} {c.old * scale:11.1f} {unit:2} {c.new * scale:11.1f} {unit:2} {c.ratio:7.2f}{flag}")
+    return "\n".join(lines)
@@ -0,0 +1,242 @@
+# --------------------------------------------------------------------------------------------
+#  Copyright (c) 2024 Bentley Systems, Incorporated. All rights reserved.
+# --------------------------------------------------------------------------------------------
+
+"""Generates Python source for large synthetic interface hierarchies and measures the cost of importing it.
+
+The import is done in a fresh interpreter so that nothing is cached.  For example, to see how import time scales
+with the number of interfaces:
+
+    python -m benchmarks.generate --scale interfaces=100,200,400,800
+
+or to look at the generated source:
+
+    python -m benchmarks.generate --interfaces 10 --implementations 4 --source -
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from typing import Dict, List, NamedTuple, Optional
+
+# Executed in the child process. Only class creation is timed, importing pure_interface is not.
+_HARNESS = """
+import gc, importlib, json, sys, time, tracemalloc, warnings
+sys.path.insert(0, {directory!r})
+import pure_interface
+pure_interface.set_is_development({development!r})
+warnings.simplefilter("ignore")
+trace = {trace!r}
+gc.collect()
+if trace:
+    tracemalloc.start()
+start = time.perf_counter()
+importlib.import_module({module!r})
+seconds = time.perf_counter() - start
+size = tracemalloc.get_traced_memory()[0] if trace else 0
+print(json.dumps({{"seconds": seconds, "bytes": size}}))
+"""
+
+
+class Shape(NamedTuple):
+    interfaces: int = 100  # total number of interfaces
+    implementations: int = 100  # concrete classes, each implementing one of the most derived interfaces
+    methods: int = 5  # methods declared by each interface
+    attributes: int = 2  # attributes declared by each interface
+    depth: int = 3  # inheritance levels, interfaces are divided evenly between levels
+    diamond: int = 1  # number of parent interfaces of each interface below the first level
+    generic_every: int = 0  # every nth interface is Generic[T] (0 for none)
+    dataclass_every: int = 0  # every nth implementation is a dataclass (0 for none)
+    singledispatch_every: int = 0  # every nth interface's first method is a singledispatchmethod (0 for none)
+    async_every: int = 0  # every nth interface has async methods (0 for none)
+
+    @property
+    def classes(self) -> int:
+        return self.interfaces + self.implementations
+
+
+def _every(n: int, every: int) -> bool:
+    return every > 0 and n % every == 0
+
+
+def _level_sizes(shape: Shape) -> List[int]:
+    depth = max(min(shape.depth, shape.interfaces), 1)
+    sizes = [shape.interfaces // depth] * depth
+    sizes[0] += shape.interfaces - sum(sizes)
+    return sizes
+
+
+class _InterfaceInfo(NamedTuple):
+    name: str
+    generic: bool
+    methods: Dict[str, str]  # name -> "def" | "async" | "dispatch", including inherited
+    attributes: List[str]  # including inherited
+
+
+def generate_source(shape: Shape) -> str:
+    """Returns the source of a module defining the interfaces and implementations described by shape."""
+    lines = [
+        "# generated by benchmarks.generate",
+        "import dataclasses",
+        "import functools",
+        "from typing import Generic, TypeVar",
+        "",
+        "from pure_interface import Interface",
+        "",
+        'T = TypeVar("T")',
+        "",
+    ]
+    levels: List[List[_InterfaceInfo]] = []
+    n = 0
+    for level, size in enumerate(_level_sizes(shape)):
+        infos = []
+        for i in range(size):
+            name = f"I{n}"
+            generic = _every(n, shape.generic_every)
+            parents: List[_InterfaceInfo] = []
+            if level > 0:
+                previous = levels[-1]
+                indexes = sorted({(i + j) % len(previous) for j in range(max(shape.diamond, 1))})
+                parents = [previous[index] for index in indexes]
+            methods: Dict[str, str] = {}
+            attributes: List[str] = []
+            for parent in reversed(parents):
+                methods.update(parent.methods)
+                attributes.extend(a for a in parent.attributes if a not in attributes)
+            own_methods = {}
+            for k in range(shape.methods):
+                if k == 0 and _every(n, shape.singledispatch_every):
+                    kind = "dispatch"
+                elif _every(n, shape.async_every):
+                    kind = "async"
+                else:
+                    kind = "def"
+                own_methods[f"i{n}_m{k}"] = kind
+            own_attributes = [f"i{n}_a{k}" for k in range(shape.attributes)]
+            methods.update(own_methods)
+            attributes.extend(own_attributes)
+
+            bases = [parent.name for parent in parents] + ["Interface"]
+            if generic:
+                bases.append("Generic[T]")
+            lines.append(f"class {name}({', '.join(bases)}):")
+            for attribute in own_attributes:
+                lines.append(f"    {attribute}: int")
+            for method, kind in own_methods.items():
+                lines.extend(_method_lines(method, kind, "pass"))
+            if not own_attributes and not own_methods:
+                lines.append("    pass")
+            lines.append("")
+            infos.append(_InterfaceInfo(name, generic, methods, attributes))
+            n += 1
+        levels.append(infos)
+
+    leaves = levels[-1]
+    for m in range(shape.implementations):
+        leaf = leaves[m % len(leaves)]
+        base = f"{leaf.name}[int]" if leaf.generic else leaf.name
+        if _every(m, shape.dataclass_every):
+            lines.append("@dataclasses.dataclass")
+            lines.append(f"class Impl{m}({base}):")
+        else:
+            lines.append(f"class Impl{m}({base}):")
+            lines.append("    def __init__(self):")
+            for attribute in leaf.attributes:
+                lines.append(f"        self.{attribute} = 0")
+            if not leaf.attributes:
+                lines.append("        pass")
+        for method, kind in leaf.methods.items():
+            lines.extend(_method_lines(method, kind, "return x"))
+        if not leaf.methods and _every(m, shape.dataclass_every):
+            lines.append("    pass")
+        lines.append("")
+    return "\n".join(lines)
+
+
+def _method_lines(name: str, kind: str, body: str) -> List[str]:
+    if kind == "dispatch":
+        return ["    @functools.singledispatchmethod", f"    def {name}(self, x, y=None):", f"        {body}"]
+    prefix = "async " if kind == "async" else ""
+    return [f"    {prefix}def {name}(self, x, y=None):", f"        {body}"]
+
+
+def _run_child(directory: str, module: str, development: bool, trace: bool) -> dict:
+    code = _HARNESS.format(directory=directory, module=module, development=development, trace=trace)
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def measure(shape: Shape, development: bool = True, repeat: int = 3) -> dict:
+    """Imports the generated source in a fresh interpreter and returns the timings.
+    The fastest of repeat runs is reported.  Memory is measured in a separate run with tracemalloc.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        module = "pi_generated"
+        with open(os.path.join(directory, module + ".py"), "w") as f:
+            f.write(generate_source(shape))
+        seconds = min(_run_child(directory, module, development, False)["seconds"] for _ in range(max(repeat, 1)))
+        size = _run_child(directory, module, development, True)["bytes"]
+    return {
+        "shape": shape._asdict(),
+        "development": development,
+        "classes": shape.classes,
+        "seconds": seconds,
+        "seconds_per_class": seconds / shape.classes,
+        "bytes": size,
+        "bytes_per_class": size / shape.classes,
+    }
+
+
+def _parse_scale(text: str) -> Dict[str, List[int]]:
+    name, _, values = text.partition("=")
+    if name not in Shape._fields or not values:
+        raise argparse.ArgumentTypeError(f"expected <shape-field>=<n>,<n>,... not {text}")
+    return {name: [int(v) for v in values.split(",")]}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.generate", description=__doc__.splitlines()[0])
+    for field, default in Shape._field_defaults.items():
+        parser.add_argument("--" + field.replace("_", "-"), type=int, default=default)
+    parser.add_argument("--source", help="write the generated source to this file ('-' for stdout) and exit")
+    parser.add_argument("--scale", type=_parse_scale, help="measure each value of a shape field, e.g. depth=1,2,4")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--production", action="store_true", help="import with set_is_development(False)")
+    parser.add_argument("-o", "--output", help="write JSON results to this file")
+    args = parser.parse_args(argv)
+
+    shape = Shape(**{field: getattr(args, field) for field in Shape._fields})
+    if args.source:
+        source = generate_source(shape)
+        if args.source == "-":
+            sys.stdout.write(source)
+        else:
+            with open(args.source, "w") as f:
+                f.write(source)
+        return 0
+
+    shapes = [shape]
+    if args.scale:
+        ((field, values),) = args.scale.items()
+        shapes = [shape._replace(**{field: value}) for value in values]
+    results = []
+    print(f"{'classes':>8} {'total ms':>10} {'us/class':>10} {'bytes/class':>12}  shape")
+    for s in shapes:
+        result = measure(s, development=not args.production, repeat=args.repeat)
+        results.append(result)
+        changed = {k: v for k, v in s._asdict().items() if v != Shape._field_defaults[k]}
+        print(
+            f"{result['classes']:8d} {result['seconds'] * 1e3:10.2f} {result['seconds_per_class'] * 1e6:10.1f} "
+            f"{result['bytes_per_class']:12.0f}  {changed or 'default'}"
+        )
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
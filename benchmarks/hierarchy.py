@@ -0,0 +1,86 @@
+# --------------------------------------------------------------------------------------------
+#  Copyright (c) 2024 Bentley Systems, Incorporated. All rights reserved.
+# --------------------------------------------------------------------------------------------
+
+"""Builds synthetic interface hierarchies at runtime for the benchmarks."""
+
+import abc
+import itertools
+from typing import Any, Dict, List, Type
+
+from pure_interface import Interface
+
+_counter = itertools.count()
+
+
+def method_names(width: int, level: int) -> List[str]:
+    return [f"method_{level}_{i}" for i in range(width)]
+
+
+def attribute_names(width: int, level: int) -> List[str]:
+    return [f"attr_{level}_{i}" for i in range(width)]
+
+
+def _interface_method():
+    def method(self, x, y=None):
+        pass
+
+    return method
+
+
+def _implementation_method():
+    def method(self, x, y=None):
+        return x
+
+    return method
+
+
+def make_interfaces(width: int, depth: int, prefix: str = "I") -> List[Type[Interface]]:
+    """Returns a chain of depth interfaces, each adding width methods and width attributes to its parent.
+    The most derived interface is last.
+    """
+    interfaces: List[Type[Interface]] = []
+    base: Type[Interface] = Interface
+    suffix = next(_counter)
+    for level in range(depth):
+        namespace: Dict[str, Any] = {name: _interface_method() for name in method_names(width, level)}
+        namespace["__annotations__"] = {name: int for name in attribute_names(width, level)}
+        namespace["__module__"] = __name__
+        namespace["__slots__"] = ()  # so that slotted composed types have no __dict__
+        bases = (Interface,) if base is Interface else (base, Interface)
+        base = type(Interface)(f"{prefix}{level}_{suffix}", bases, namespace)
+        interfaces.append(base)
+    return interfaces
+
+
+def make_abc(width: int) -> type:
+    """Returns an empty ABC class with width abstract methods, which interfaces can use as a base"""
+    namespace: Dict[str, Any] = {f"abc_method_{i}": abc.abstractmethod(_interface_method()) for i in range(width)}
+    namespace["__module__"] = __name__
+    return abc.ABCMeta(f"ABC{next(_counter)}", (), namespace)
+
+
+def implementation_namespace(width: int, depth: int) -> Dict[str, Any]:
+    namespace: Dict[str, Any] = {"__module__": __name__}
+    names = [name for level in range(depth) for name in attribute_names(width, level)]
+    for level in range(depth):
+        for name in method_names(width, level):
+            namespace[name] = _implementation_method()
+
+    def __init__(self):
+        for name in names:
+            setattr(self, name, 1)
+
+    namespace["__init__"] = __init__
+    return namespace
+
+
+def make_implementation(interface: Type[Interface], width: int, depth: int, name: str = "") -> type:
+    """Returns a concrete class implementing interface (as created by make_interfaces)"""
+    name = name or f"{interface.__name__}Impl{next(_counter)}"
+    return type(interface)(name, (interface,), implementation_namespace(width, depth))
+
+
+def make_structural(width: int, depth: int) -> type:
+    """Returns a class that structurally provides the interfaces created by make_interfaces"""
+    return type(f"Structural{next(_counter)}", (), implementation_namespace(width, depth))
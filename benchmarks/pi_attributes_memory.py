@@ -0,0 +1,84 @@
+# --------------------------------------------------------------------------------------------
+#  Copyright (c) 2024 Bentley Systems, Incorporated. All rights reserved.
+# --------------------------------------------------------------------------------------------
+
+"""Measures the memory used by the _PIAttributes of generated implementation classes.
+
+Usage:
+    python -m benchmarks.pi_attributes_memory [num_classes]
+"""
+
+import sys
+import tracemalloc
+
+from pure_interface import Interface
+
+
+class IShape(Interface):
+    name: str
+
+    def area(self) -> float:
+        pass
+
+    def perimeter(self) -> float:
+        pass
+
+    def scale(self, factor: float) -> "IShape":
+        pass
+
+
+class Shape(IShape):
+    def area(self):
+        return 0.0
+
+    def perimeter(self):
+        return 0.0
+
+    def scale(self, factor):
+        return self
+
+
+def pi_attributes_size(pi_attributes) -> int:
+    """Approximate the bytes owned by a single _PIAttributes instance"""
+    seen = set()
+
+    def size_of(obj):
+        if id(obj) in seen:
+            return 0
+        seen.add(id(obj))
+        return sys.getsizeof(obj)
+
+    total = size_of(pi_attributes)
+    if hasattr(pi_attributes, "__dict__"):
+        total += size_of(pi_attributes.__dict__)
+        values = list(pi_attributes.__dict__.values())
+    else:
+        values = [getattr(pi_attributes, name, None) for name in type(pi_attributes).__slots__]
+    for value in values:
+        total += size_of(value)
+    return total
+
+
+def measure(num_classes: int) -> None:
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    classes = [type(f"Shape{i}", (Shape,), {"__module__": __name__}) for i in range(num_classes)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # a class without _PIAttributes for comparison
+    tracemalloc.start()
+    plain_before, _ = tracemalloc.get_traced_memory()
+    plain = [type(f"Plain{i}", (object,), {"__module__": __name__}) for i in range(num_classes)]
+    plain_after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    per_class = (after - before) / num_classes
+    plain_per_class = (plain_after - plain_before) / num_classes
+    print(f"classes created:              {len(classes)}")
+    print(f"bytes per interface class:    {per_class:.0f}")
+    print(f"bytes per plain class:        {plain_per_class:.0f}  ({len(plain)} classes)")
+    print(f"pure_interface overhead:      {per_class - plain_per_class:.0f}")
+    print(f"_PIAttributes size (shared):  {pi_attributes_size(classes[-1]._pi)}")
+
+
+if __name__ == "__main__":
+    measure(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
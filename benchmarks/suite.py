@@ -0,0 +1,480 @@
+# --------------------------------------------------------------------------------------------
+#  Copyright (c) 2024 Bentley Systems, Incorporated. All rights reserved.
+# --------------------------------------------------------------------------------------------
+
+"""The benchmarks.  Each benchmark returns a value where lower is better (seconds or bytes per operation)."""
+
+import functools
+import gc
+import platform
+import sys
+import time
+import timeit
+import tracemalloc
+import warnings
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Protocol,
+    Tuple,
+    TypeVar,
+)
+
+import pure_interface
+from pure_interface import (
+    Delegate,
+    Interface,
+    adapt_args,
+    from_protocol,
+    get_type_interfaces,
+    implementation_dataclass,
+    interface_dispatch,
+    interface_multimethod,
+    register_adapter,
+)
+from pure_interface.delegation import composed_type
+
+from . import hierarchy
+
+
+class Config(NamedTuple):
+    width: int = 5  # methods and attributes added by each interface
+    depth: int = 3  # length of the interface inheritance chain
+    number: int = 10000  # operations per timing run
+    repeat: int = 5  # timing runs, the fastest is reported
+    development: bool = True
+
+    @property
+    def class_number(self) -> int:
+        """Class creation is much slower than other operations, so do fewer."""
+        return max(self.number // 100, 1)
+
+
+_Benchmark = Callable[[Config], float]
+_T = TypeVar("_T")
+_benchmarks: Dict[str, Tuple[_Benchmark, str]] = {}
+
+
+def benchmark(name: str, unit: str = "s") -> Callable[[_Benchmark], _Benchmark]:
+    def decorator(func: _Benchmark) -> _Benchmark:
+        _benchmarks[name] = (func, unit)
+        return func
+
+    return decorator
+
+
+def benchmark_names() -> List[str]:
+    return list(_benchmarks)
+
+
+def time_per_op(func: Callable[[], Any], config: Config, number: Optional[int] = None) -> float:
+    number = config.number if number is None else number
+    timer = timeit.Timer(func)
+    return min(timer.repeat(repeat=config.repeat, number=number)) / number
+
+
+def time_each(func: Callable[[Any], Any], items: Iterable[Any]) -> float:
+    """Time calling func once for each item, returning the time per call"""
+    items = list(items)
+    start = time.perf_counter()
+    for item in items:
+        func(item)
+    return (time.perf_counter() - start) / len(items)
+
+
+def bytes_per_op(func: Callable[[], Any], number: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        keep = [func() for _ in range(number)]
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del keep
+    return (after - before) / number
+
+
+class _Fixture:
+    """Classes and objects shared by the benchmarks"""
+
+    def __init__(self, config: Config):
+        width, depth = config.width, config.depth
+        self.interfaces = hierarchy.make_interfaces(width, depth)
+        self.interface = self.interfaces[-1]
+        self.impl_type = hierarchy.make_implementation(self.interface, width, depth)
+        self.impl = self.impl_type()
+        self.abc_base = hierarchy.make_abc(width)
+        namespace = hierarchy.implementation_namespace(width, depth)
+        del namespace["__init__"]
+        dataclass_type = implementation_dataclass(type(self.interface)("DataclassImpl", (self.interface,), namespace))
+        self.new_dataclass = functools.partial(dataclass_type, *[1] * (width * depth))
+        self.structural = hierarchy.make_structural(width, depth)()
+        self.attr = hierarchy.attribute_names(width, 0)[0]
+        self.method = hierarchy.method_names(width, 0)[0]
+        self.wrapper = self.interface.interface_only(self.impl)
+
+        class Adaptee:
+            pass
+
+        impl = self.impl
+        register_adapter(lambda obj: impl, Adaptee, self.interface)
+        self.adaptee = Adaptee()
+
+        class IGeneric(Interface, Generic[_T]):
+            def get(self) -> _T:
+                pass
+
+        class GenericImpl(IGeneric[int]):
+            def get(self) -> int:
+                return 1
+
+        generic_impl = GenericImpl()
+        register_adapter(lambda obj: generic_impl, Adaptee, IGeneric[int])
+        self.generic_interface = IGeneric[int]
+
+        class Getter(Protocol):
+            def get(self) -> int: ...
+
+        class StructuralGetter:
+            def get(self) -> int:
+                return 1
+
+        self.protocol_interface = from_protocol(Getter)
+        self.structural_getter = StructuralGetter()
+
+        interface = self.interface
+        attr = self.attr
+
+        class Inner:
+            pass
+
+        inner = Inner()
+        setattr(inner, attr, 1)
+        impl.inner = inner
+
+        class DelegateType(Delegate, interface):  # type: ignore[valid-type, misc]
+            pi_attr_delegates = {"impl": interface}
+            pi_attr_mapping = {"dotted": f"impl.inner.{attr}"}
+
+            def __init__(self, impl):
+                self.impl = impl
+
+        self.delegate = DelegateType(impl)
+
+        class CachingDelegateType(Delegate, interface):  # type: ignore[valid-type, misc]
+            pi_attr_fallback = "impl"
+            pi_cache_methods = True
+
+            def __init__(self, impl):
+                self.impl = impl
+
+        self.caching_delegate = CachingDelegateType(impl)
+
+        other_interfaces = hierarchy.make_interfaces(width, 1, prefix="J")
+        self.other_interface = other_interfaces[0]
+        self.other_impl = hierarchy.make_implementation(self.other_interface, width, 1)()
+        self.composed_type = composed_type(self.interface, self.other_interface)
+        self.composed = self.composed_type(self.impl, self.other_impl)
+        self.slots_composed_type = composed_type(self.interface, self.other_interface, slots=True)
+        self.slots_composed = self.slots_composed_type(self.impl, self.other_impl)
+
+        def func(x: interface) -> Any:  # type: ignore[valid-type]
+            return x
+
+        self.adapt_args_func = adapt_args(func)
+
+        @interface_dispatch
+        def dispatched(x: Any) -> Any:
+            return None
+
+        dispatched.register(interface, func)
+        self.dispatch_func = dispatched
+
+        @interface_multimethod
+        def multimethod(x: Any, y: Any) -> Any:
+            return None
+
+        for other in self.interfaces[:-1]:
+            multimethod.register(other, other, lambda x, y: y)
+        multimethod.register(interface, interface, lambda x, y: x)
+        self.multimethod = multimethod
+
+
+_fixture: Optional[_Fixture] = None
+
+
+@benchmark("class_creation.interface")
+def _interface_creation(config: Config) -> float:
+    width, depth = config.width, config.depth
+    return time_per_op(lambda: hierarchy.make_interfaces(width, depth), config, config.class_number) / depth
+
+
+@benchmark("class_creation.interface_abc_base")
+def _interface_abc_base_creation(config: Config) -> float:
+    abc_base = _fixture.abc_base
+    return time_per_op(lambda: type(Interface)("IFromABC", (abc_base, Interface), {}), config, config.class_number)
+
+
+@benchmark("class_creation.implementation")
+def _implementation_creation(config: Config) -> float:
+    interface, width, depth = _fixture.interface, config.width, config.depth
+    return time_per_op(lambda: hierarchy.make_implementation(interface, width, depth), config, config.class_number)
+
+
+@benchmark("memory.implementation_class", "bytes")
+def _implementation_class_memory(config: Config) -> float:
+    interface, width, depth = _fixture.interface, config.width, config.depth
+    return bytes_per_op(lambda: hierarchy.make_implementation(interface, width, depth), config.class_number)
+
+
+@benchmark("instantiate")
+def _instantiate(config: Config) -> float:
+    return time_per_op(_fixture.impl_type, config)
+
+
+@benchmark("instantiate.dataclass")
+def _instantiate_dataclass(config: Config) -> float:
+    return time_per_op(_fixture.new_dataclass, config)
+
+
+@benchmark("memory.instance", "bytes")
+def _instance_memory(config: Config) -> float:
+    return bytes_per_op(_fixture.impl_type, config.number)
+
+
+@benchmark("memory.instance_dataclass", "bytes")
+def _instance_dataclass_memory(config: Config) -> float:
+    return bytes_per_op(_fixture.new_dataclass, config.number)
+
+
+@benchmark("type_is_interface")
+def _type_is_interface(config: Config) -> float:
+    impl_type = _fixture.impl_type
+    return time_per_op(lambda: pure_interface.type_is_interface(impl_type), config)
+
+
+@benchmark("get_type_interfaces")
+def _get_type_interfaces(config: Config) -> float:
+    impl_type = _fixture.impl_type
+    return time_per_op(lambda: get_type_interfaces(impl_type), config)
+
+
+@benchmark("adapt.provided")
+def _adapt_provided(config: Config) -> float:
+    interface, impl = _fixture.interface, _fixture.impl
+    return time_per_op(lambda: interface.adapt(impl, interface_only=False), config)
+
+
+@benchmark("adapt.interface_only")
+def _adapt_interface_only(config: Config) -> float:
+    interface, impl = _fixture.interface, _fixture.impl
+    return time_per_op(lambda: interface.adapt(impl, interface_only=True), config)
+
+
+@benchmark("adapt.registered")
+def _adapt_registered(config: Config) -> float:
+    interface, adaptee = _fixture.interface, _fixture.adaptee
+    return time_per_op(lambda: interface.adapt(adaptee, interface_only=False), config)
+
+
+@benchmark("adapt.generic_registered")
+def _adapt_generic_registered(config: Config) -> float:
+    interface, adaptee = _fixture.generic_interface, _fixture.adaptee
+    return time_per_op(lambda: interface.adapt(adaptee, interface_only=False), config)
+
+
+@benchmark("adapt.implicit")
+def _adapt_implicit(config: Config) -> float:
+    interface, structural = _fixture.interface, _fixture.structural
+    return time_per_op(lambda: interface.adapt(structural, allow_implicit=True, interface_only=False), config)
+
+
+@benchmark("provided_by.structural")
+def _provided_by_structural(config: Config) -> float:
+    interface, structural = _fixture.interface, _fixture.structural
+    return time_per_op(lambda: interface.provided_by(structural), config)
+
+
+@benchmark("from_protocol.provided_by")
+def _from_protocol_provided_by(config: Config) -> float:
+    interface, obj = _fixture.protocol_interface, _fixture.structural_getter
+    return time_per_op(lambda: interface.provided_by(obj), config)
+
+
+@benchmark("interface_only.getattr")
+def _interface_only_getattr(config: Config) -> float:
+    wrapper, attr = _fixture.wrapper, _fixture.attr
+    return time_per_op(lambda: getattr(wrapper, attr), config)
+
+
+@benchmark("interface_only.call")
+def _interface_only_call(config: Config) -> float:
+    method = _fixture.method
+    wrapper = _fixture.wrapper
+    return time_per_op(lambda: getattr(wrapper, method)(1), config)
+
+
+@benchmark("delegate.getattr")
+def _delegate_getattr(config: Config) -> float:
+    delegate, attr = _fixture.delegate, _fixture.attr
+    return time_per_op(lambda: getattr(delegate, attr), config)
+
+
+@benchmark("delegate.getattr_dotted")
+def _delegate_getattr_dotted(config: Config) -> float:
+    delegate = _fixture.delegate
+    return time_per_op(lambda: delegate.dotted, config)
+
+
+@benchmark("delegate.setattr")
+def _delegate_setattr(config: Config) -> float:
+    delegate, attr = _fixture.delegate, _fixture.attr
+    return time_per_op(lambda: setattr(delegate, attr, 2), config)
+
+
+@benchmark("delegate.call")
+def _delegate_call(config: Config) -> float:
+    delegate, method = _fixture.delegate, _fixture.method
+    return time_per_op(lambda: getattr(delegate, method)(1), config)
+
+
+@benchmark("delegate.call_cached")
+def _delegate_call_cached(config: Config) -> float:
+    delegate, method = _fixture.caching_delegate, _fixture.method
+    return time_per_op(lambda: getattr(delegate, method)(1), config)
+
+
+@benchmark("composed_type.lookup")
+def _composed_type_lookup(config: Config) -> float:
+    interface, other = _fixture.interface, _fixture.other_interface
+    return time_per_op(lambda: composed_type(interface, other), config)
+
+
+@benchmark("composed_type.create")
+def _composed_type_create(config: Config) -> float:
+    interface = _fixture.interface
+    others = [hierarchy.make_interfaces(config.width, 1, prefix="K")[0] for _ in range(config.class_number)]
+    return time_each(lambda other: composed_type(interface, other), others)
+
+
+@benchmark("composed_type.instantiate")
+def _composed_type_instantiate(config: Config) -> float:
+    c_type, impl, other_impl = _fixture.composed_type, _fixture.impl, _fixture.other_impl
+    return time_per_op(lambda: c_type(impl, other_impl), config)
+
+
+@benchmark("composed_type.instantiate_unchecked")
+def _composed_type_instantiate_unchecked(config: Config) -> float:
+    interface, other = _fixture.interface, _fixture.other_interface
+    c_type, impl, other_impl = composed_type(interface, other, check=False), _fixture.impl, _fixture.other_impl
+    return time_per_op(lambda: c_type(impl, other_impl), config)
+
+
+@benchmark("memory.composed_instance", "bytes")
+def _composed_instance_memory(config: Config) -> float:
+    c_type, impl, other_impl = _fixture.composed_type, _fixture.impl, _fixture.other_impl
+    return bytes_per_op(lambda: c_type(impl, other_impl), config.number)
+
+
+@benchmark("memory.composed_instance_slots", "bytes")
+def _slots_composed_instance_memory(config: Config) -> float:
+    c_type, impl, other_impl = _fixture.slots_composed_type, _fixture.impl, _fixture.other_impl
+    return bytes_per_op(lambda: c_type(impl, other_impl), config.number)
+
+
+@benchmark("composed_type.getattr")
+def _composed_type_getattr(config: Config) -> float:
+    composed, attr = _fixture.composed, _fixture.attr
+    return time_per_op(lambda: getattr(composed, attr), config)
+
+
+@benchmark("composed_type.getattr_slots")
+def _slots_composed_type_getattr(config: Config) -> float:
+    composed, attr = _fixture.slots_composed, _fixture.attr
+    return time_per_op(lambda: getattr(composed, attr), config)
+
+
+@benchmark("composed_type.provided_by")
+def _composed_type_provided_by(config: Config) -> float:
+    c_type, composed = _fixture.composed_type, _fixture.composed
+    return time_per_op(lambda: c_type.provided_by(composed), config)
+
+
+@benchmark("composed_type.provided_by_permutation")
+def _composed_type_provided_by_permutation(config: Config) -> float:
+    c_type = composed_type(_fixture.other_interface, _fixture.interface)
+    composed = _fixture.composed
+    return time_per_op(lambda: c_type.provided_by(composed), config)
+
+
+@benchmark("to_columns.per_object")
+def _to_columns(config: Config) -> float:
+    interface, objects = _fixture.interface, [_fixture.impl] * 1000
+    return time_per_op(lambda: interface.to_columns(objects), config, config.class_number) / len(objects)
+
+
+@benchmark("adapt_args.call")
+def _adapt_args_call(config: Config) -> float:
+    func, impl = _fixture.adapt_args_func, _fixture.impl
+    return time_per_op(lambda: func(impl), config)
+
+
+@benchmark("interface_dispatch.call")
+def _interface_dispatch_call(config: Config) -> float:
+    func, impl = _fixture.dispatch_func, _fixture.impl
+    return time_per_op(lambda: func(impl), config)
+
+
+@benchmark("interface_multimethod.call")
+def _interface_multimethod_call(config: Config) -> float:
+    func, impl = _fixture.multimethod, _fixture.impl
+    return time_per_op(lambda: func(impl, impl), config)
+
+
+def run(config: Config, names: Optional[Iterable[str]] = None, log: Optional[Callable[[str], Any]] = None) -> dict:
+    """Runs the named benchmarks (default all) and returns the results as a JSON serialisable dictionary"""
+    global _fixture
+    names = list(_benchmarks) if names is None else list(names)
+    unknown = set(names).difference(_benchmarks)
+    if unknown:
+        raise ValueError("Unknown benchmarks: {}".format(", ".join(sorted(unknown))))
+    was_development = pure_interface.get_is_development()
+    pure_interface.set_is_development(config.development)
+    results = {}
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            _fixture = _Fixture(config)
+            for name in names:
+                func, unit = _benchmarks[name]
+                value = func(config)
+                results[name] = {"value": value, "unit": unit}
+                if log is not None:
+                    log(format_result(name, value, unit))
+    finally:
+        _fixture = None
+        pure_interface.set_is_development(was_development)
+    return {
+        "meta": {
+            "pure_interface": pure_interface.__version__,
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "config": config._asdict(),
+        },
+        "results": results,
+    }
+
+
+def format_result(name: str, value: float, unit: str) -> str:
+    if unit == "s":
+        return f"{name:40} {value * 1e9:14.1f} ns"
+    return f"{name:40} {value:14.1f} {unit}"
@@ -2,21 +2,42 @@
 #  Copyright (c) 2024 Bentley Systems, Incorporated. All rights reserved.
 # --------------------------------------------------------------------------------------------
 
+from ._dataclass import implementation_dataclass
+from ._profiling import (
+    clear_profile,
+    disable_profiling,
+    dump_profile_stats,
+    enable_profiling,
+    get_profile_report,
+)
+from ._protocol import from_protocol
 from ._sub_interface import sub_interface_of
+from ._warm_up import warm_up
 from .adaption import AdapterTracker, adapt_args, adapts, register_adapter
 from .delegation import Delegate
+from .dispatch import interface_dispatch, interface_multimethod
 from .errors import AdaptionError, InterfaceError, PureInterfaceError
 from .interface import (
     Interface,
     InterfaceType,
+    MissingMethodWarning,
+    clear_missing_method_warnings,
+    freeze_registries,
     get_interface_attribute_names,
     get_interface_method_names,
     get_interface_names,
     get_is_development,
+    get_missing_method_warning_records,
     get_missing_method_warnings,
+    get_registries_frozen,
+    get_strip_signatures,
     get_type_interfaces,
     set_is_development,
+    set_missing_method_warnings_limit,
+    set_strip_signatures,
+    set_warn_missing_methods_once,
     type_is_interface,
+    unfreeze_registries,
 )
 
 __version__ = "8.2.0"  # Don't change this manually - run `bump-my-version bump [major|minor|patch]` instead
@@ -0,0 +1,143 @@
+# --------------------------------------------------------------------------------------------
+#  Copyright (c) 2024 Bentley Systems, Incorporated. All rights reserved.
+# --------------------------------------------------------------------------------------------
+
+"""Conversion between sequences of interface implementations and columns of attribute values
+
+Columns are array.array instances for array type codes, NumPy arrays for other dtypes (NumPy is only imported
+if such a dtype is used) and lists for attributes without a dtype.
+"""
+
+import array
+import itertools
+import weakref
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+)
+
+from . import interface as _interface
+from .errors import InterfaceError
+
+# interface -> function returning the attribute values of a sequence of objects
+_extractors: "weakref.WeakKeyDictionary[type, Callable[[Sequence[Any]], tuple]]" = weakref.WeakKeyDictionary()
+# interface -> row view type
+_row_view_types: "weakref.WeakKeyDictionary[type, type]" = weakref.WeakKeyDictionary()
+
+
+def _make_column(values: List[Any], dtype: Any) -> Any:
+    if dtype is None:
+        return values
+    if isinstance(dtype, str) and dtype in array.typecodes:
+        return array.array(dtype, values)
+    try:
+        import numpy  # type: ignore[import-not-found]
+    except ImportError:
+        raise InterfaceError(f"dtype {dtype!r} is not an array type code and NumPy is not installed") from None
+    return numpy.array(values, dtype=dtype)
+
+
+def _make_extractor(names: Sequence[str]) -> Callable[[Sequence[Any]], tuple]:
+    """Returns a function that returns a tuple of lists of the values of each named attribute of a sequence of
+    objects.  The function is generated with a list comprehension per attribute so that the attribute lookups are
+    specialised by the interpreter for the concrete types.
+    """
+    lists = ", ".join(f"[obj.{name} for obj in objects]" for name in names)
+    namespace: Dict[str, Any] = {}
+    exec(f"def extract(objects):\n    return ({lists},)", namespace)
+    return namespace["extract"]
+
+
+def _get_extractor(interface: type) -> Callable[[Sequence[Any]], tuple]:
+    try:
+        return _extractors[interface]
+    except KeyError:
+        pass
+    extract = _make_extractor(interface._pi.interface_attribute_names)  # type: ignore[attr-defined]
+    if not _interface.registries_frozen:
+        _extractors[interface] = extract
+    return extract
+
+
+def to_columns(
+    interface: type, objects: Iterable[Any], dtype_map: Optional[Mapping[str, Any]] = None
+) -> Dict[str, Any]:
+    names = interface._pi.interface_attribute_names  # type: ignore[attr-defined]
+    if not names:
+        raise InterfaceError(f"{interface.__name__} has no attributes")
+    dtype_map = dtype_map or {}
+    unknown = set(dtype_map).difference(names)
+    if unknown:
+        raise InterfaceError(f"{interface.__name__} has no attributes {', '.join(sorted(unknown))}")
+    if not isinstance(objects, (list, tuple)):
+        objects = list(objects)
+    values = _get_extractor(interface)(objects)
+    return {name: _make_column(column, dtype_map.get(name)) for name, column in zip(names, values)}
+
+
+def _get_row_view_type(interface: type) -> type:
+    try:
+        return _row_view_types[interface]
+    except KeyError:
+        pass
+    names = interface._pi.interface_attribute_names  # type: ignore[attr-defined]
+    attributes: Dict[str, Any] = {
+        "__slots__": ("_pi_columns", "_pi_index"),
+        "__module__": interface.__module__,
+        "_pi_names": tuple(names),
+        "__init__": _row_init,
+        "__repr__": _row_repr,
+    }
+    for i, name in enumerate(names):
+        attributes[name] = property(_column_getter(i), _column_setter(i))
+    view_type = type(f"_{interface.__name__}Row", (), attributes)
+    if not _interface.registries_frozen:
+        _row_view_types[interface] = view_type
+    return view_type
+
+
+def _row_init(self, columns: tuple, index: int) -> None:
+    self._pi_columns = columns
+    self._pi_index = index
+
+
+def _row_repr(self) -> str:
+    values = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._pi_names)
+    return f"{type(self).__name__}({values})"
+
+
+def _column_getter(i: int) -> Callable[[Any], Any]:
+    def get(self):
+        return self._pi_columns[i][self._pi_index]
+
+    return get
+
+
+def _column_setter(i: int) -> Callable[[Any, Any], None]:
+    def set_value(self, value):
+        self._pi_columns[i][self._pi_index] = value
+
+    return set_value
+
+
+def from_columns(interface: type, columns: Mapping[str, Sequence[Any]]) -> Iterator[Any]:
+    names = interface._pi.interface_attribute_names  # type: ignore[attr-defined]
+    if not names:
+        raise InterfaceError(f"{interface.__name__} has no attributes")
+    missing = [name for name in names if name not in columns]
+    if missing:
+        raise InterfaceError(f"Missing columns for {interface.__name__} attributes: {', '.join(missing)}")
+    ordered = tuple(columns[name] for name in names)
+    lengths = set(map(len, ordered))
+    if len(lengths) > 1:
+        raise InterfaceError("Columns must all have the same length")
+    length = lengths.pop() if lengths else 0
+    view_type = _get_row_view_type(interface)
+    return map(view_type, itertools.repeat(ordered, length), range(length))
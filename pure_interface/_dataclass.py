@@ -0,0 +1,52 @@
+# --------------------------------------------------------------------------------------------
+#  Copyright (c) 2024 Bentley Systems, Incorporated. All rights reserved.
+# --------------------------------------------------------------------------------------------
+
+"""Slotted dataclass implementations of interfaces"""
+
+import dataclasses
+from typing import Any, Optional, TypeVar, cast
+
+from . import interface
+from .errors import InterfaceError
+
+_T = TypeVar("_T", bound=type)
+
+
+def _guaranteed_fields(cls: type) -> frozenset:
+    """Returns the names of the fields that the dataclass __init__ always sets"""
+    return frozenset(
+        field.name
+        for field in dataclasses.fields(cls)
+        if field.init or field.default is not dataclasses.MISSING or field.default_factory is not dataclasses.MISSING
+    )
+
+
+def implementation_dataclass(
+    cls: Optional[_T] = None, *, slots: bool = True, frozen: bool = False, **kwargs: Any
+) -> Any:
+    """Class decorator that makes a concrete implementation of an interface into a dataclass with a field for each
+    interface attribute.  The dataclass has __slots__ unless slots is False (instances still have a __dict__ if the
+    interfaces do not define __slots__).  frozen and the other keyword arguments are passed to dataclasses.dataclass.
+
+    Instances of the class are not checked for the interface attributes on creation, as the dataclass __init__
+    sets them.
+    """
+
+    def decorator(klass: _T) -> _T:
+        if not isinstance(klass, interface.InterfaceType) or interface.type_is_interface(klass):
+            raise InterfaceError(f"{klass} is not an implementation of an interface")
+        # dataclass(slots=True) re-creates the class, which would record its missing method warnings a second time
+        rebuilding = interface.missing_method_warnings.rebuilding
+        rebuilding.add(klass._pi)
+        try:
+            data_class = dataclasses.dataclass(klass, slots=slots, frozen=frozen, **kwargs)  # type: ignore
+        finally:
+            rebuilding.discard(klass._pi)
+        pi_attributes = data_class._pi
+        pi_attributes.abstractproperties = pi_attributes.abstractproperties.difference(_guaranteed_fields(data_class))
+        return cast(_T, data_class)
+
+    if cls is None:
+        return decorator
+    return decorator(cls)
@@ -0,0 +1,153 @@
+# --------------------------------------------------------------------------------------------
+#  Copyright (c) 2024 Bentley Systems, Incorporated. All rights reserved.
+# --------------------------------------------------------------------------------------------
+
+"""Opt-in timing of the phases of InterfaceType.__new__
+
+Enable with enable_profiling() or by setting the PURE_INTERFACE_PROFILE environment variable before
+pure_interface is imported.  The variable is either "1" to print a report to stderr at exit, or a file name
+to write the report to.  If the file name ends with ".prof" the file is written in the marshalled format
+read by pstats.Stats (and tools like snakeviz) instead of as text.
+"""
+
+import atexit
+import marshal
+import os
+import sys
+import time
+from typing import Dict, Optional, Tuple
+
+PROFILE_ENV_VAR = "PURE_INTERFACE_PROFILE"
+
+# phases in the order they occur in InterfaceType.__new__
+PHASES = ("bases", "signatures", "abstract", "empty", "properties", "type", "annotations", "warnings")
+
+_ClassKey = Tuple[str, str]  # module, qualname
+
+
+class _ClassRecord:
+    __slots__ = ("count", "phases")
+
+    def __init__(self):
+        self.count = 0
+        self.phases: Dict[str, float] = {}
+
+    @property
+    def total(self) -> float:
+        return sum(self.phases.values())
+
+
+class _ClassTimer:
+    """Accumulates the time since the previous mark against the named phase"""
+
+    __slots__ = ("_record", "_last")
+
+    def __init__(self, record: _ClassRecord):
+        record.count += 1
+        self._record = record
+        self._last = time.perf_counter()
+
+    def mark(self, phase: str) -> None:
+        now = time.perf_counter()
+        phases = self._record.phases
+        phases[phase] = phases.get(phase, 0.0) + now - self._last
+        self._last = now
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def mark(self, phase: str) -> None:
+        pass
+
+
+_null_timer = _NullTimer()
+_records: Dict[_ClassKey, _ClassRecord] = {}
+_enabled = False
+_report_file: Optional[str] = None
+_atexit_registered = False
+
+
+def class_timer(module: str, qualname: str):
+    """Returns a timer for a class being created. This is a no-op unless profiling is enabled."""
+    if not _enabled:
+        return _null_timer
+    key = (module, qualname)
+    record = _records.get(key)
+    if record is None:
+        record = _records[key] = _ClassRecord()
+    return _ClassTimer(record)
+
+
+def enable_profiling(report_file: Optional[str] = None) -> None:
+    """Start recording the time taken to create each interface and implementation class.
+    If report_file is given the report is written to it when the process exits ("-" for stderr).
+    """
+    global _enabled, _report_file, _atexit_registered
+    _enabled = True
+    if report_file is not None:
+        _report_file = report_file
+        if not _atexit_registered:
+            atexit.register(_report_at_exit)
+            _atexit_registered = True
+
+
+def disable_profiling() -> None:
+    """Stop recording class creation times.  Recorded times are kept."""
+    global _enabled
+    _enabled = False
+
+
+def clear_profile() -> None:
+    _records.clear()
+
+
+def get_profile_report(limit: Optional[int] = None) -> str:
+    """Returns a text table of class creation times in milliseconds, slowest classes first."""
+    records = sorted(_records.items(), key=lambda item: item[1].total, reverse=True)
+    grand_total = sum(record.total for _, record in records)
+    lines = [
+        "pure_interface class creation profile: {} classes, {:.3f} ms".format(len(records), grand_total * 1000),
+        " ".join(["{:>11}".format(name) for name in ("total",) + PHASES] + ["{:>6}".format("count"), "class"]),
+    ]
+    if limit is not None:
+        records = records[:limit]
+    for (module, qualname), record in records:
+        times = [record.total] + [record.phases.get(phase, 0.0) for phase in PHASES]
+        columns = ["{:11.3f}".format(t * 1000) for t in times]
+        columns.append("{:6d}".format(record.count))
+        columns.append("{}.{}".format(module, qualname))
+        lines.append(" ".join(columns))
+    return "\n".join(lines) + "\n"
+
+
+def dump_profile_stats(filename: str) -> None:
+    """Writes the recorded times in the format read by pstats.Stats.
+    Each class has an entry with its total (cumulative) time and an entry for each phase.
+    """
+    stats: Dict[Tuple[str, int, str], Tuple[int, int, float, float, dict]] = {}
+    for (module, qualname), record in _records.items():
+        count = record.count
+        stats[(module, 0, qualname)] = (count, count, 0.0, record.total, {})
+        for phase, seconds in record.phases.items():
+            key = (module, 0, "{} [{}]".format(qualname, phase))
+            stats[key] = (count, count, seconds, seconds, {(module, 0, qualname): (count, count, seconds, seconds)})
+    with open(filename, "wb") as f:
+        marshal.dump(stats, f)
+
+
+def _report_at_exit() -> None:
+    if _report_file is None:
+        return
+    if _report_file == "-":
+        sys.stderr.write(get_profile_report())
+    elif _report_file.endswith(".prof"):
+        dump_profile_stats(_report_file)
+    else:
+        with open(_report_file, "w") as f:
+            f.write(get_profile_report())
+
+
+_env_value = os.environ.get(PROFILE_ENV_VAR)
+if _env_value:
+    enable_profiling("-" if _env_value == "1" else _env_value)
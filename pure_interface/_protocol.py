@@ -0,0 +1,131 @@
+# --------------------------------------------------------------------------------------------
+#  Copyright (c) 2024 Bentley Systems, Incorporated. All rights reserved.
+# --------------------------------------------------------------------------------------------
+
+"""Converts typing.Protocol classes to interfaces
+
+isinstance checks against runtime_checkable protocols look up every protocol member on every call, whereas the
+structural checks of interfaces are cached per type.
+"""
+
+import inspect
+import types
+import weakref
+from typing import Any, Callable, Dict, Generic, Protocol, Tuple, cast
+
+from . import interface
+from .errors import InterfaceError
+
+# attributes that typing adds to Protocol classes
+_PROTOCOL_ATTRS = frozenset(
+    (
+        "__annotations__",
+        "__annotations_cache__",
+        "__callable_proto_members_only__",
+        "__class_getitem__",
+        "__init__",
+        "__init_subclass__",
+        "__new__",
+        "__non_callable_proto_members__",
+        "__parameters__",
+        "__protocol_attrs__",
+        "_is_protocol",
+        "_is_runtime_protocol",
+    )
+)
+
+_protocol_interfaces: "weakref.WeakKeyDictionary[type, interface.InterfaceType]" = weakref.WeakKeyDictionary()
+
+
+def _make_stub(func: Callable, qualname: str) -> Callable:
+    """Returns an empty function with the name and signature of func"""
+
+    def stub(*args, **kwargs):
+        pass
+
+    stub.__name__ = func.__name__
+    stub.__qualname__ = f"{qualname}.{func.__name__}"
+    stub.__doc__ = func.__doc__
+    stub.__module__ = func.__module__
+    stub.__signature__ = inspect.signature(func)  # type: ignore[attr-defined]
+    return stub
+
+
+def _protocol_subclass_hook(protocol: type) -> classmethod:
+    """Returns a __subclasshook__ that makes explicit sub-classes of protocol nominal implementations.
+    The protocol is not registered with the interface, as ABCMeta.register refuses protocols on some Python versions
+    and isinstance checks would then go through the protocol's uncached __instancecheck__.
+    """
+
+    def __subclasshook__(cls, subclass):
+        if "__subclasshook__" in cls.__dict__ and protocol in getattr(subclass, "__mro__", ()):
+            return True
+        return NotImplemented  # sub-interfaces of the protocol interface do not inherit the hook
+
+    return classmethod(__subclasshook__)
+
+
+def _protocol_members(protocol: type) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Returns the members of protocol and its protocol bases, with annotation-only attributes mapped to None,
+    and their annotations.
+    """
+    members: Dict[str, Any] = {}
+    annotations: Dict[str, Any] = {}
+    for base in reversed(protocol.__mro__):
+        if base in (Protocol, Generic, object) or not getattr(base, "_is_protocol", False):
+            continue
+        base_annotations = inspect.get_annotations(base)
+        annotations.update(base_annotations)
+        for name in base_annotations:
+            members.setdefault(name, None)
+        for name, value in base.__dict__.items():
+            if name in _PROTOCOL_ATTRS or name.startswith("_abc_") or interface._is_builtin_attr(name):
+                continue
+            members[name] = value
+    return members, annotations
+
+
+def from_protocol(protocol: type) -> interface.InterfaceType:
+    """Returns an interface with the same methods (and signatures) and attributes as the typing.Protocol protocol.
+
+    Interface checks are cached, so IFoo.provided_by(obj) is much faster than isinstance(obj, Foo) for a
+    runtime_checkable protocol Foo.  Classes that explicitly sub-class the protocol are nominal implementations of
+    the interface.  The same interface is returned each time for a given protocol.
+
+    Raises InterfaceError if the registries are frozen and the protocol has not been converted before, as the new
+    interface is stored for later calls.
+    """
+    try:
+        return _protocol_interfaces[protocol]
+    except (KeyError, TypeError):
+        pass
+    if not (isinstance(protocol, type) and getattr(protocol, "_is_protocol", False)) or protocol is Protocol:
+        raise InterfaceError(f"{protocol} is not a typing.Protocol class")
+    interface._check_registries_not_frozen("convert protocols")
+    qualname = protocol.__qualname__
+    namespace: Dict[str, Any] = {
+        "__module__": protocol.__module__,
+        "__qualname__": qualname,
+        "__doc__": protocol.__doc__,
+        "__subclasshook__": _protocol_subclass_hook(protocol),
+    }
+    attribute_annotations: Dict[str, Any] = {}
+    members, annotations = _protocol_members(protocol)
+    for name, value in members.items():
+        if isinstance(value, (staticmethod, classmethod)):
+            namespace[name] = type(value)(_make_stub(value.__func__, qualname))
+        elif isinstance(value, types.FunctionType):
+            namespace[name] = _make_stub(value, qualname)
+        elif isinstance(value, property) and value.fget is not None:
+            return_annotation = inspect.signature(value.fget).return_annotation
+            attribute_annotations[name] = Any if return_annotation is inspect.Signature.empty else return_annotation
+        else:
+            attribute_annotations[name] = annotations.get(name, Any)
+    namespace["__annotations__"] = attribute_annotations
+    parameters = getattr(protocol, "__parameters__", ())
+    bases = (interface.Interface, Generic[parameters]) if parameters else (interface.Interface,)  # type: ignore
+    new_interface = cast(
+        interface.InterfaceType, types.new_class(protocol.__name__, bases, exec_body=lambda ns: ns.update(namespace))
+    )
+    _protocol_interfaces[protocol] = new_interface
+    return new_interface
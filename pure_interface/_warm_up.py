@@ -0,0 +1,57 @@
+# --------------------------------------------------------------------------------------------
+#  Copyright (c) 2024 Bentley Systems, Incorporated. All rights reserved.
+# --------------------------------------------------------------------------------------------
+
+"""Eagerly builds the state that pure_interface otherwise creates lazily.
+
+Pre-fork servers call warm_up in the parent process so that the state is created once and shared, copy-on-write,
+with the child processes instead of being built separately in each child.
+"""
+
+import gc
+from typing import Iterable, Sequence
+
+from . import interface
+from .delegation import composed_type
+from .errors import InterfaceError
+
+
+def warm_up(
+    interfaces: Iterable[interface.AnInterfaceType] = (),
+    types: Iterable[type] = (),
+    composed: Iterable[Sequence[interface.AnInterfaceType]] = (),
+    freeze: bool = False,
+) -> None:
+    """Builds the cached state for the given interfaces and types.
+
+    For each interface the name sets, the interfaces in its MRO and (in development mode) the interface_only
+    wrapper type are created.
+    For each type its interfaces are found, and it is checked against every interface for subclassing, structural
+    implementation and adapters, so those results are cached.
+    Each item of composed is a sequence of interfaces passed to composed_type.
+
+    If freeze is True the registries are then frozen (see freeze_registries) and gc.freeze() is called so that
+    the garbage collector does not touch the objects created so far.
+    """
+    interfaces = list(interfaces)
+    for iface in interfaces:
+        if not interface.type_is_interface(iface):
+            raise InterfaceError(f"{iface} is not an interface")
+        pi_attributes = iface._pi
+        pi_attributes.interface_attribute_name_set
+        pi_attributes.interface_names
+        interface._get_type_interface_set(iface)
+        if interface.is_development:
+            interface._get_impl_wrapper_type(iface)
+    for cls in types:
+        interface._get_type_interface_set(cls)
+        for iface in interfaces:
+            if issubclass(cls, iface):
+                continue
+            if not interface._class_structural_type_check(iface, cls):
+                interface._get_adapter(iface, cls)
+    for interface_types in composed:
+        composed_type(*interface_types)
+    if freeze:
+        interface.freeze_registries()
+        gc.freeze()
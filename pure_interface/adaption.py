@@ -16,6 +16,10 @@ from .interface import (
     AnInterface,
     Interface,
     InterfaceType,
+    _check_registries_not_frozen,
+    _GenericInterfaceAlias,
+    _get_generic_adapters,
+    _registries_changed,
     get_pi_attribute,
     get_type_interfaces,
     type_is_interface,
@@ -68,19 +72,25 @@ def register_adapter(
 
     :param adapter: callable that takes an instance of from_type and returns an object providing to_interface.
     :param from_type: a type to adapt from
-    :param to_interface: an Interface class to adapt to.
+    :param to_interface: an Interface class, or a parametrised generic interface such as IFoo[int], to adapt to.
     """
     if not callable(adapter):
         raise AdaptionError("adapter must be callable")
     if not isinstance(from_type, type):
         raise AdaptionError("{} must be a type".format(from_type))
-    if not (isinstance(to_interface, type) and get_pi_attribute(to_interface, "type_is_interface", False)):
+    if isinstance(to_interface, _GenericInterfaceAlias):
+        _check_registries_not_frozen("register adapters")
+        adapters = _get_generic_adapters(to_interface)
+    elif isinstance(to_interface, type) and get_pi_attribute(to_interface, "type_is_interface", False):
+        _check_registries_not_frozen("register adapters")
+        adapters = get_pi_attribute(to_interface, "adapters")
+    else:
         raise AdaptionError("{} is not an interface".format(to_interface))
-    adapters = get_pi_attribute(to_interface, "adapters")
     if from_type in adapters:
         raise AdaptionError("{} already has an adapter to {}".format(from_type, to_interface))
 
     adapters[from_type] = adapter
+    _registries_changed()
 
 
 class AdapterTracker(object):
@@ -131,12 +141,14 @@ def _interface_from_anno(annotation: Any) -> Optional[InterfaceType]:
             return annotation
     except TypeError:
         pass
+    if isinstance(annotation, _GenericInterfaceAlias):
+        return annotation  # type: ignore[return-value]
     if hasattr(annotation, "__origin__") and hasattr(annotation, "__args__"):
         # could be a Union
         if annotation.__origin__ is not Union:
             return None
         for arg_type in annotation.__args__:
-            if type_is_interface(arg_type):
+            if type_is_interface(arg_type) or isinstance(arg_type, _GenericInterfaceAlias):
                 return arg_type
 
     return None
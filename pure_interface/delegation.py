@@ -4,35 +4,201 @@
 
 from __future__ import absolute_import, division, print_function
 
+import asyncio
+import inspect
 import operator
-from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, Type, Union
+import threading
+import weakref
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 
 from .errors import InterfaceError
 from .interface import (
     AnInterface,
     AnInterfaceType,
+    InterfaceType,
+    _get_type_interface_set,
+    _unique_list,
+    get_interface_method_names,
     get_interface_names,
     get_type_interfaces,
     type_is_interface,
 )
 
-_composed_types_map: Dict[Tuple[Type, ...], Type] = {}
+# composed types are only kept while they are in use elsewhere
+_composed_types_map: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+_broadcast_types_map: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
 _letters = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
 
 
-class _Delegated:
+def _composed_attr_name(i: int) -> str:
+    """Name of the attribute holding the implementation of the i'th interface of a composed type"""
+    if i < len(_letters):
+        return "_" + _letters[i]
+    return f"_i{i}"
+
+
+def _attr_setter(impl_name: str, attr_name: str) -> Callable[[Any, Any], None]:
+    if "." in impl_name:
+        get_impl = operator.attrgetter(impl_name)
+
+        def set_path(obj, value):
+            setattr(get_impl(obj), attr_name, value)
+
+        return set_path
+
+    def set_attr(obj, value):
+        setattr(getattr(obj, impl_name), attr_name, value)
+
+    return set_attr
+
+
+class _Delegated(property):
+    """Descriptor that routes attribute access on the delegate to dotted_name.
+    This is a property with an operator.attrgetter getter so that reads do not execute any python code.
+    The setter is specialised for single level (impl.attr) and deeper (impl.a.b.attr) paths.
+    """
+
     def __init__(self, dotted_name: str):
-        self._getter = operator.attrgetter(dotted_name)
         self._impl_name, self._attr_name = dotted_name.rsplit(".", 1)
+        super().__init__(
+            operator.attrgetter(dotted_name), _attr_setter(self._impl_name, self._attr_name), doc=dotted_name
+        )
+        # the class docstring hides the doc stored by property, so set it on the instance as well
+        self.__doc__ = dotted_name
+
+
+class _DelegatedMethod:
+    """Non-data descriptor used for delegated methods when pi_cache_methods is True.
+    The first access stores the bound method in the instance __dict__, which then takes precedence over this
+    descriptor.  The stored method is discarded when the implementation attribute is assigned or deleted.
+    """
+
+    def __init__(self, dotted_name: str, name: str):
+        self._getter = operator.attrgetter(dotted_name)
+        self._impl_name = dotted_name.split(".", 1)[0]
+        self._name = name
 
     def __get__(self, obj, cls):
         if obj is None:
             return self
-        return self._getter(obj)
+        value = obj.__dict__[self._name] = self._getter(obj)
+        return value
 
-    def __set__(self, obj, value):
-        impl = operator.attrgetter(self._impl_name)(obj)
-        setattr(impl, self._attr_name, value)
+
+def _cached_method_invalidators(owner: Type[Any]) -> Tuple[Callable, Callable]:
+    """Returns __setattr__ and __delattr__ methods for owner that discard cached methods of an implementation
+    when the implementation attribute is changed.  If owner defines __setattr__ or __delattr__ itself, the
+    returned methods call them rather than the base class methods.
+    """
+    own_setattr = owner.__dict__.get("__setattr__")
+    own_delattr = owner.__dict__.get("__delattr__")
+
+    def __setattr__(self, name, value):
+        if own_setattr is None:
+            super(owner, self).__setattr__(name, value)
+        else:
+            own_setattr(self, name, value)
+        method_names = type(self)._pi_cached_methods.get(name)
+        if method_names:
+            instance_dict = self.__dict__
+            for method_name in method_names:
+                instance_dict.pop(method_name, None)
+
+    def __delattr__(self, name):
+        if own_delattr is None:
+            super(owner, self).__delattr__(name)
+        else:
+            own_delattr(self, name)
+        method_names = type(self)._pi_cached_methods.get(name)
+        if method_names:
+            instance_dict = self.__dict__
+            for method_name in method_names:
+                instance_dict.pop(method_name, None)
+
+    return __setattr__, __delattr__
+
+
+class _LazyImplementation:
+    """Non-data descriptor that creates an implementation with factory(delegate) on first access.
+    The implementation is stored in the instance __dict__ so later accesses do not call this descriptor.
+    Creation is done under a lock for each delegate so that factory is called once even when the first
+    accesses are from several threads.  If factory raises, the next access tries again.
+    """
+
+    def __init__(self, factory: Callable[[Any], Any]):
+        self._factory = factory
+        self._name = ""
+        self._lock = threading.Lock()
+        self._creating: Dict[int, threading.Lock] = {}  # id(delegate) -> lock held while creating
+
+    def __set_name__(self, owner, name):
+        self._name = name
+
+    def __get__(self, obj, cls):
+        if obj is None:
+            return self
+        instance_dict = obj.__dict__
+        with self._lock:
+            if self._name in instance_dict:
+                return instance_dict[self._name]
+            creating = self._creating.setdefault(id(obj), threading.Lock())
+        try:
+            with creating:
+                if self._name in instance_dict:  # created by another thread while we waited
+                    return instance_dict[self._name]
+                value = instance_dict[self._name] = self._factory(obj)
+                return value
+        finally:
+            with self._lock:
+                self._creating.pop(id(obj), None)
+
+
+def lazy_delegate(factory: Callable[[Any], Any]) -> Any:
+    """Declares a Delegate implementation attribute that is created by calling factory(delegate) when it is first
+    accessed.  e.g.
+
+    class MyDelegate(Delegate, IFoo):
+        pi_attr_fallback = 'impl'
+        impl = lazy_delegate(lambda self: ExpensiveFoo(self.path))
+
+        def __init__(self, path):
+            self.path = path
+    """
+    return _LazyImplementation(factory)
+
+
+def _delegate_slots(bases: Tuple[type, ...], namespace: Dict[str, Any]) -> Tuple[str, ...]:
+    """Returns __slots__ for a Delegate sub-class with pi_slots = True.
+    The slots are the implementation attributes named by pi_attr_delegates, pi_attr_fallback and pi_attr_mapping
+    that are not already slots of a base class, plus __weakref__ if no base supports weak references.
+    """
+    declared = namespace.get("__slots__", ())
+    names = [declared] if isinstance(declared, str) else list(declared)
+    names.extend(namespace.get("pi_attr_delegates", {}))
+    fallback = namespace.get("pi_attr_fallback")
+    if fallback is not None:
+        names.append(fallback)
+    names.extend(dotted_name.split(".", 1)[0] for dotted_name in namespace.get("pi_attr_mapping", {}).values())
+    inherited: Set[str] = set()
+    for base in bases:
+        for klass in base.__mro__:
+            base_slots = klass.__dict__.get("__slots__", ())
+            inherited.update([base_slots] if isinstance(base_slots, str) else base_slots)
+    slots = [name for name in _unique_list(names) if name not in inherited]
+    if "__weakref__" not in slots and not any(base.__weakrefoffset__ for base in bases):
+        slots.append("__weakref__")
+    return tuple(slots)
 
 
 class Delegate:
@@ -119,13 +285,49 @@ class Delegate:
                 self.impl = impl
                 self.foo = 3
 
+    If pi_cache_methods is True, delegated interface methods are looked up once per delegate instance and the
+    bound method is stored in the instance __dict__.  The stored methods are discarded when the implementation
+    attribute (e.g. 'impl') is assigned to.
+
+    If pi_slots is True, the implementation attributes named by pi_attr_delegates, pi_attr_fallback and
+    pi_attr_mapping are stored in __slots__ rather than an instance __dict__.  This saves memory and makes
+    delegated attribute access a little faster.  Because __slots__ must be known when the class is created,
+    pi_slots is only available on delegates that also inherit from an interface.  The interfaces and every other
+    base class must define __slots__ too, otherwise instances still get a __dict__.  pi_slots cannot be used with pi_cache_methods.
+
+        class MyDelegate(Delegate, IFoo):
+            pi_attr_fallback = 'impl'
+            pi_slots = True  # instances have an 'impl' slot and no __dict__
+
+    Implementation attributes that are expensive to create can be declared with lazy_delegate(factory).
+    The implementation is created by factory(delegate) on first use and then stored on the delegate.
+
     """
 
+    __slots__ = ()
     pi_attr_fallback: Optional[str] = None
     pi_attr_delegates: Dict[str, Union[List[str], type]] = {}
     pi_attr_mapping: Dict[str, Sequence[str]] = {}
+    pi_cache_methods: bool = False
+    pi_slots: bool = False
+    # implementation attribute name -> names of methods cached from it
+    _pi_cached_methods: Dict[str, Tuple[str, ...]] = {}
+
+    @staticmethod
+    def _pi_prepare_namespace(bases: Tuple[type, ...], namespace: Dict[str, Any]) -> None:
+        """Called by InterfaceType with the namespace of a sub-class before the class is created."""
+        if namespace.get("pi_slots", False):
+            namespace["__slots__"] = _delegate_slots(bases, namespace)
 
     def __init_subclass__(cls, **kwargs):
+        if cls.__dict__.get("pi_slots", False) and "__slots__" not in cls.__dict__:
+            raise InterfaceError(f"{cls.__name__}: pi_slots can only be used on delegates that inherit an interface")
+        if not cls.__dictoffset__:
+            if cls.pi_cache_methods:
+                raise InterfaceError(f"{cls.__name__}: pi_cache_methods requires instances to have a __dict__")
+            lazy = [name for name, value in cls.__dict__.items() if isinstance(value, _LazyImplementation)]
+            if lazy:
+                raise InterfaceError(f"{cls.__name__}: lazy_delegate {lazy[0]} requires instances to have a __dict__")
         # get non-interface base class ignoring abc.ABC and object.
         non_interface_bases = [base for base in cls.mro()[:-2] if not type_is_interface(base)]
 
@@ -135,6 +337,25 @@ class Delegate:
                     return True
             return False
 
+        method_names: Set[str] = set()
+        delegated: Set[str] = set()
+        cached_methods: Dict[str, List[str]] = {}
+        if cls.pi_cache_methods:
+            for interface in get_type_interfaces(cls):
+                method_names.update(get_interface_method_names(interface))
+            for attr_list in cls.__dict__.get("pi_attr_delegates", {}).values():
+                if isinstance(attr_list, type):
+                    method_names.update(get_interface_method_names(attr_list))
+
+        def delegate_attribute(attr: str, dotted_name: str) -> None:
+            delegated.add(attr)
+            if attr in method_names:
+                descriptor = _DelegatedMethod(dotted_name, attr)
+                cached_methods.setdefault(descriptor._impl_name, []).append(attr)
+                setattr(cls, attr, descriptor)
+            else:
+                setattr(cls, attr, _Delegated(dotted_name))
+
         for delegate, attr_list in cls.__dict__.get("pi_attr_delegates", {}).items():
             if isinstance(attr_list, type):
                 attr_list = list(get_interface_names(attr_list))
@@ -145,19 +366,32 @@ class Delegate:
                     raise ValueError(f"{attr} in pi_attr_map and handled by delegate {delegate}")
                 if i_have_attribute(attr):
                     continue
-                dotted_name = f"{delegate}.{attr}"
-                setattr(cls, attr, _Delegated(dotted_name))
+                delegate_attribute(attr, f"{delegate}.{attr}")
         for attr, dotted_name in cls.__dict__.get("pi_attr_mapping", {}).items():
             if not i_have_attribute(attr):
-                setattr(cls, attr, _Delegated(dotted_name))
+                delegate_attribute(attr, dotted_name)
         fallback = cls.__dict__.get("pi_attr_fallback", None)
         if fallback is not None:
             for interface in get_type_interfaces(cls):
                 interface_names = get_interface_names(interface)
                 for attr in interface_names:
                     if not i_have_attribute(attr):
-                        dotted_name = f"{fallback}.{attr}"
-                        setattr(cls, attr, _Delegated(dotted_name))
+                        delegate_attribute(attr, f"{fallback}.{attr}")
+        # base classes with cached methods have already installed the invalidators, unless this class overrides them
+        install_invalidators = (
+            not cls._pi_cached_methods or "__setattr__" in cls.__dict__ or "__delattr__" in cls.__dict__
+        )
+        if cached_methods:
+            all_cached = {name: list(names) for name, names in cls._pi_cached_methods.items()}
+            for impl_name, names in cached_methods.items():
+                all_cached.setdefault(impl_name, []).extend(names)
+            cls._pi_cached_methods = {name: tuple(names) for name, names in all_cached.items()}
+        if cls._pi_cached_methods and install_invalidators:
+            cls.__setattr__, cls.__delattr__ = _cached_method_invalidators(cls)  # type: ignore[method-assign]
+        pi_attributes = cls.__dict__.get("_pi")
+        if pi_attributes is not None and delegated:
+            # delegated attributes are provided by the class so InterfaceType.__call__ need not check for them
+            pi_attributes.abstractproperties = pi_attributes.abstractproperties.difference(delegated)
 
     @classmethod
     def provided_by(cls, obj: Any):
@@ -165,22 +399,46 @@ class Delegate:
             raise InterfaceError("provided_by() can only be called on composed types")
         if isinstance(obj, cls):
             return True
-        other_mro = [c for c in type(obj).mro() if type_is_interface(c)]
-        my_mro = [c for c in cls.mro() if type_is_interface(c)]
-        if set(my_mro) <= set(other_mro):
-            return True
-        return False
+        return _get_type_interface_set(cls) <= _get_type_interface_set(type(obj))
+
+
+def _make_composed_init(interface_types: Tuple[type, ...], attr_names: Sequence[str], check: bool) -> Callable:
+    """Returns an __init__ taking one argument per interface that stores each argument in its attribute.
+    The function is generated so that there is no per-argument loop or lookup of the interfaces at call time.
+    If check is True each argument is checked to be an instance of its interface.
+    """
+    arg_names = [attr.lstrip("_") for attr in attr_names]
+    lines = [f"def __init__(self, {', '.join(arg_names)}):"]
+    for i, (arg, attr) in enumerate(zip(arg_names, attr_names)):
+        if check:
+            lines.append(f"    if not isinstance({arg}, _i{i}):")
+            lines.append(f'        raise ValueError(f"Expected {{_i{i}}} got {{type({arg})}} instead")')
+        lines.append(f"    self.{attr} = {arg}")
+    namespace: Dict[str, Any] = {f"_i{i}": interface for i, interface in enumerate(interface_types)}
+    exec("\n".join(lines), namespace)
+    return namespace["__init__"]
 
 
-def __composed_init__(self, *args):
-    for i, impl in enumerate(args):
-        attr = "_" + _letters[i]
-        if not isinstance(impl, type(self).pi_composed_interfaces[i]):
-            raise ValueError(f"Expected {type(self).pi_composed_interfaces[i]} got {type(impl)} instead")
-        setattr(self, attr, impl)
+def _make_composed_reduce(attr_names: Sequence[str]) -> Callable:
+    get_impls = operator.attrgetter(*attr_names)
 
+    def __reduce_ex__(self, protocol):
+        cls = type(self)
+        if "pi_composed_interfaces" not in cls.__dict__:  # a sub-class defined in a module
+            return object.__reduce_ex__(self, protocol)
+        # composed types are created at runtime, so pickle the arguments to composed_type and the implementations.
+        return _restore_composed, (cls.pi_composed_interfaces, cls.pi_slots, cls.pi_composed_check, get_impls(self))
 
-def composed_type(*interface_types: AnInterfaceType) -> Type[Delegate]:
+    return __reduce_ex__
+
+
+def _restore_composed(
+    interface_types: Tuple[InterfaceType, ...], slots: bool, check: bool, impls: Tuple[Any, ...]
+) -> Any:
+    return composed_type(*interface_types, slots=slots, check=check)(*impls)
+
+
+def composed_type(*interface_types: AnInterfaceType, slots: bool = False, check: bool = True) -> Type[Delegate]:
     """Returns a new class which implements all the passed interfaces.
     If the interfaces have duplicate attribute or method names, the first enountered implementation is used.
     Instances of the returned type are passed implementations of the given interfaces in the same order.
@@ -201,13 +459,18 @@ def composed_type(*interface_types: AnInterfaceType) -> Type[Delegate]:
     t = T(a, b)
     t.foo -> 4
     t.bar -> 1
+
+    If slots is True the implementations are stored in __slots__, so instances have no __dict__ provided that the
+    interfaces define __slots__.
+    If check is False the constructor does not check that its arguments provide the interfaces.
+
+    Composed types are cached, so passing the same arguments returns the same type while it is still referenced.
     """
     if len(interface_types) < 2:
         raise ValueError("2 or more interfaces required")
-    if len(interface_types) > len(_letters):
-        raise ValueError(f"Too many interfaces.  Use {len(_letters)} or fewer.")
     interface_types = tuple(interface_types)
-    c_type = _composed_types_map.get(interface_types)
+    key = (interface_types, slots, check)
+    c_type = _composed_types_map.get(key)
     if c_type is not None:
         return c_type
     delegates = {}
@@ -215,7 +478,7 @@ def composed_type(*interface_types: AnInterfaceType) -> Type[Delegate]:
     for i, interface in enumerate(interface_types):
         if not type_is_interface(interface):
             raise ValueError("all arguments to composed_type must be Interface classes")
-        attr = "_" + _letters[i]
+        attr = _composed_attr_name(i)
         int_names = get_interface_names(interface)
         delegates[attr] = [name for name in int_names if name not in all_names]
         all_names.update(int_names)
@@ -223,12 +486,114 @@ def composed_type(*interface_types: AnInterfaceType) -> Type[Delegate]:
     name = "".join((cls.__name__ for cls in interface_types))
     arg_names = ", ".join((cls.__name__.lower() for cls in interface_types))
     bases = (Delegate,) + interface_types
+    init = _make_composed_init(interface_types, list(delegates), check)
+    init.__qualname__ = f"{name}.__init__"
     cls_attrs = {
-        "__init__": __composed_init__,
+        "__init__": init,
         "__doc__": f"{name}({arg_names})",
         "pi_attr_delegates": delegates,
         "pi_composed_interfaces": interface_types,
+        "pi_composed_check": check,
+        "pi_slots": slots,
+        "__reduce_ex__": _make_composed_reduce(list(delegates)),
     }
     c_type = type(name, bases, cls_attrs)
-    _composed_types_map[interface_types] = c_type
+    _get_type_interface_set(c_type)  # so that provided_by doesn't have to compute it
+    _composed_types_map[key] = c_type
     return c_type
+
+
+def _broadcast_method(name: str, is_async: bool) -> Callable:
+    if is_async:
+
+        async def broadcast_async(self, *args, **kwargs):
+            results = await asyncio.gather(*[getattr(impl, name)(*args, **kwargs) for impl in self._pi_impls])
+            return self._pi_reduce(list(results))
+
+        method = broadcast_async
+    else:
+
+        def broadcast(self, *args, **kwargs):
+            executor = self._pi_executor
+            if executor is None:
+                results = [getattr(impl, name)(*args, **kwargs) for impl in self._pi_impls]
+            else:
+                futures = [executor.submit(getattr(impl, name), *args, **kwargs) for impl in self._pi_impls]
+                results = [future.result() for future in futures]
+            return self._pi_reduce(results)
+
+        method = broadcast
+    method.__name__ = name
+    return method
+
+
+def _broadcast_property(name: str) -> property:
+    def fget(self):
+        return self._pi_reduce([getattr(impl, name) for impl in self._pi_impls])
+
+    def fset(self, value):
+        for impl in self._pi_impls:
+            setattr(impl, name, value)
+
+    return property(fget, fset)
+
+
+def _broadcast_init(self, implementations, executor=None):
+    implementations = tuple(implementations)
+    interface = type(self).pi_broadcast_interface
+    for impl in implementations:
+        if not isinstance(impl, interface):
+            raise ValueError(f"Expected {interface} got {type(impl)} instead")
+    self._pi_impls = implementations
+    self._pi_executor = executor
+
+
+def _no_reduce(results: List[Any]) -> List[Any]:
+    return results
+
+
+def broadcast_type(interface: AnInterfaceType, reduce: Optional[Callable[[List[Any]], Any]] = None) -> Type[Delegate]:
+    """Returns a new class implementing interface that forwards every method call and attribute access to
+    a sequence of implementations.  The result is a list with one value per implementation, or reduce(list).
+    e.g.
+    class IListener(Interface):
+        def notify(self, event):
+            pass
+
+    Broadcaster = broadcast_type(IListener)
+    b = Broadcaster([listener1, listener2])
+    b.notify(event) -> [listener1.notify(event), listener2.notify(event)]
+
+    Instances may be given a concurrent.futures.Executor, e.g. Broadcaster(listeners, executor=pool), to call the
+    implementations concurrently.  Interface methods that are coroutine functions are awaited together with
+    asyncio.gather.  Setting an attribute sets it on all the implementations.
+    """
+    if not type_is_interface(interface):
+        raise ValueError("broadcast_type argument must be an Interface class")
+    key = (interface, reduce)
+    b_type = _broadcast_types_map.get(key)
+    if b_type is not None:
+        return b_type
+    name = f"{interface.__name__}Broadcast"
+    method_names = get_interface_method_names(interface)
+    cls_attrs: Dict[str, Any] = {
+        "__module__": __name__,
+        "__init__": _broadcast_init,
+        "__doc__": f"{name}(implementations, executor=None)",
+        "__slots__": ("_pi_impls", "_pi_executor", "__weakref__"),
+        "pi_broadcast_interface": interface,
+        "_pi_reduce": staticmethod(_no_reduce if reduce is None else reduce),
+    }
+    for attr in sorted(get_interface_names(interface)):
+        if attr in method_names:
+            member = inspect.getattr_static(interface, attr)
+            func = getattr(member, "__func__", member)  # static and class methods
+            method = _broadcast_method(attr, inspect.iscoroutinefunction(func))
+            method.__qualname__ = f"{name}.{attr}"
+            method.__signature__ = inspect.signature(func)  # type: ignore[attr-defined]
+            cls_attrs[attr] = method
+        else:
+            cls_attrs[attr] = _broadcast_property(attr)
+    b_type = type(name, (Delegate, interface), cls_attrs)
+    _broadcast_types_map[key] = b_type
+    return b_type
@@ -0,0 +1,267 @@
+# --------------------------------------------------------------------------------------------
+#  Copyright (c) 2024 Bentley Systems, Incorporated. All rights reserved.
+# --------------------------------------------------------------------------------------------
+
+"""Single and multiple dispatch on interfaces
+
+interface_dispatch is like functools.singledispatch but an implementation registered for an interface can also be
+selected for classes that implement the interface structurally, or that can be adapted to it.
+interface_multimethod dispatches on the types of all the positional arguments.
+"""
+
+import abc
+import functools
+import types
+import typing
+import weakref
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, cast
+
+from . import interface
+
+
+def _most_specific(cls: type, matches: Sequence[type]) -> Optional[type]:
+    """Returns the most specific of matches, all of which cls is a sub-class of.
+    Raises RuntimeError if there is no single most specific class.
+    """
+    best = [m for m in matches if not any(other is not m and issubclass(other, m) for other in matches)]
+    if not best:
+        return None
+    if len(best) > 1:
+        mro = cls.__mro__
+        if all(m in mro for m in best):
+            best.sort(key=mro.index)
+        else:
+            names = " and ".join(sorted(m.__name__ for m in best))
+            raise RuntimeError(f"Ambiguous dispatch for {cls.__name__}: {names}")
+    return best[0]
+
+
+def _adapting(func: Callable, adapter: Callable) -> Callable:
+    def adapt_and_call(obj, *args, **kwargs):
+        return func(adapter(obj), *args, **kwargs)
+
+    return adapt_and_call
+
+
+_MULTIMETHOD_CACHE_SIZE = 4096
+
+
+def _signature_types(func: Callable) -> Tuple[type, ...]:
+    """Returns the annotated types of the positional parameters of func, using object for those without one."""
+    hints = typing.get_type_hints(func)
+    code = func.__code__
+    names = code.co_varnames[: code.co_argcount]
+    if not any(name in hints for name in names):
+        raise TypeError(f"Use register(*types) or annotate the positional parameters of {func.__qualname__}")
+    required = code.co_argcount - len(func.__defaults__ or ())
+    return tuple(hints.get(name, object) for name in names[:required])
+
+
+def _mro_key(types_: Tuple[type, ...], signature: Tuple[type, ...]) -> Optional[Tuple[int, ...]]:
+    """Returns the position of each signature type in the MRO of the matching argument type,
+    or None if any of them is not in the MRO (e.g. it is a registered ABC).
+    """
+    key = []
+    for cls, sig_type in zip(types_, signature):
+        mro = cls.__mro__
+        if sig_type not in mro:
+            return None
+        key.append(mro.index(sig_type))
+    return tuple(key)
+
+
+def _le(key: Tuple[int, ...], other: Tuple[int, ...]) -> bool:
+    return all(k <= o for k, o in zip(key, other))
+
+
+def _most_specific_signature(types_: Tuple[type, ...], matches: List[Tuple[type, ...]]) -> Optional[Tuple[type, ...]]:
+    """Returns the most specific of the matching signatures for argument types types_.
+    Raises RuntimeError if there is no single most specific signature.
+    """
+
+    def more_specific(sig: Tuple[type, ...], other: Tuple[type, ...]) -> bool:
+        return sig != other and all(issubclass(s, o) for s, o in zip(sig, other))
+
+    best = [m for m in matches if not any(more_specific(other, m) for other in matches)]
+    if not best:
+        return None
+    if len(best) > 1:
+        keys = [key for key in (_mro_key(types_, m) for m in best) if key is not None]
+        if len(keys) == len(best):
+            # the signature earliest in the MRO of every argument type wins
+            winners = [m for m, key in zip(best, keys) if all(_le(key, other) for other in keys)]
+            if len(winners) == 1:
+                return winners[0]
+        names = " and ".join(f"({', '.join(t.__name__ for t in m)})" for m in best)
+        arg_names = ", ".join(t.__name__ for t in types_)
+        raise RuntimeError(f"Ambiguous dispatch for ({arg_names}): {names}")
+    return best[0]
+
+
+def interface_dispatch(func: Optional[Callable] = None, *, allow_implicit: bool = False, allow_adapt: bool = False):
+    """Single-dispatch generic function decorator that dispatches on the type of the first argument.
+
+    Implementations are registered for classes or interfaces with the register() attribute of the
+    decorated function, as for functools.singledispatch.  An implementation for the most specific class or
+    interface the first argument is an instance of is called.  If there is no such implementation then:
+
+    * if allow_implicit is True, an implementation for an interface that the argument's class provides
+      structurally is used.  The interface attributes must be on the class for this, not just on instances.
+    * if allow_adapt is True, an implementation for an interface that the argument's class has an adapter to is
+      called with the adapted argument.
+
+    The implementation chosen for each class is cached, so dispatch is a single dictionary lookup unless
+    implementations, adapters or registrations change.
+    """
+    if func is None:
+        return functools.partial(interface_dispatch, allow_implicit=allow_implicit, allow_adapt=allow_adapt)
+
+    registry: Dict[type, Callable] = {}
+    dispatch_cache: "weakref.WeakKeyDictionary[type, Callable]" = weakref.WeakKeyDictionary()
+    cache_token: Any = None
+
+    def find_impl(cls: type) -> Callable:
+        best = _most_specific(cls, [t for t in registry if issubclass(cls, t)])
+        if best is not None and best is not object:
+            return registry[best]
+        registered_interfaces = [cast(interface.InterfaceType, t) for t in registry if interface.type_is_interface(t)]
+        if allow_implicit:
+            matches = [i for i in registered_interfaces if interface._class_structural_type_check(i, cls)]
+            best = _most_specific(cls, matches)
+            if best is not None:
+                return registry[best]
+        if allow_adapt:
+            adapters: Dict[type, Callable] = {}
+            for i in registered_interfaces:
+                adapter = interface._get_adapter(i, cls)
+                if adapter is not None:
+                    adapters[i] = adapter
+            best = _most_specific(cls, list(adapters))
+            if best is not None:
+                return _adapting(registry[best], adapters[best])
+        return registry[object]
+
+    def dispatch(cls: type) -> Callable:
+        """Returns the implementation for cls"""
+        nonlocal cache_token
+        current_token = (interface.registry_version, abc.get_cache_token())
+        if cache_token != current_token:
+            dispatch_cache.clear()
+            cache_token = current_token
+        try:
+            return dispatch_cache[cls]
+        except KeyError:
+            impl = find_impl(cls)
+            if not interface.registries_frozen:
+                dispatch_cache[cls] = impl
+            return impl
+
+    def register(cls: Any, func: Optional[Callable] = None) -> Callable:
+        """Registers func as the implementation for cls.  Can be used as a decorator with or without cls, in which
+        case the class is taken from the annotation of the first parameter.
+        """
+        if func is None:
+            if isinstance(cls, type):
+                return lambda f: register(cls, f)
+            func = cls
+            hints = typing.get_type_hints(func)
+            params = [name for name in func.__code__.co_varnames[: func.__code__.co_argcount] if name in hints]
+            if not params:
+                raise TypeError(f"Use register(cls, func) or annotate the first parameter of {func.__qualname__}")
+            cls = hints[params[0]]
+        if not isinstance(cls, type):
+            raise TypeError(f"Invalid class {cls!r} to register {func.__qualname__} for")
+        registry[cls] = func
+        dispatch_cache.clear()
+        return func
+
+    def wrapper(*args, **kwargs):
+        if not args:
+            raise TypeError(f"{funcname} requires at least 1 positional argument")
+        return dispatch(args[0].__class__)(*args, **kwargs)
+
+    funcname = getattr(func, "__name__", "interface_dispatch function")
+    registry[object] = func
+    wrapper.register = register  # type: ignore[attr-defined]
+    wrapper.dispatch = dispatch  # type: ignore[attr-defined]
+    wrapper.registry = types.MappingProxyType(registry)  # type: ignore[attr-defined]
+    wrapper.cache_clear = dispatch_cache.clear  # type: ignore[attr-defined]
+    functools.update_wrapper(wrapper, func)
+    return wrapper
+
+
+def interface_multimethod(func: Callable) -> Callable:
+    """Multiple-dispatch generic function decorator that dispatches on the types of all the positional arguments.
+
+    Implementations are registered with the register() attribute of the decorated function, either with the types
+    to match, register(IMesh, IVolume), or as a decorator on a function with annotated positional parameters.
+    The implementation whose signature is most specific for the classes and interfaces of the arguments is called.
+    Where two signatures are equally specific, the one earliest in the MRO of every argument class is chosen and
+    RuntimeError is raised if there is no such signature.  The decorated function is called if no implementation
+    matches.
+
+    Implementations are indexed by the number of arguments, and the implementation chosen for each tuple of argument
+    types is cached, so the call path does not depend on the number of implementations.  The cache keeps the
+    argument types alive until it is cleared, see cache_clear().
+    """
+    index: Dict[int, Dict[Tuple[type, ...], Callable]] = {}
+    # Holds strong references to the argument types, unlike the weak per-class cache of interface_dispatch, as
+    # weak keys for tuples of types cost much more per call.  It is bounded and cleared by cache_clear().
+    dispatch_cache: Dict[Tuple[type, ...], Callable] = {}
+    cache_token: Any = None
+
+    def find_impl(types_: Tuple[type, ...]) -> Callable:
+        signatures = index.get(len(types_), {})
+        matches = [sig for sig in signatures if all(issubclass(cls, t) for cls, t in zip(types_, sig))]
+        best = _most_specific_signature(types_, matches)
+        if best is None:
+            return func
+        return signatures[best]
+
+    def dispatch(*types_: type) -> Callable:
+        """Returns the implementation for arguments of the given types"""
+        nonlocal cache_token
+        current_token = (interface.registry_version, abc.get_cache_token())
+        if cache_token != current_token:
+            dispatch_cache.clear()
+            cache_token = current_token
+        try:
+            return dispatch_cache[types_]
+        except KeyError:
+            impl = find_impl(types_)
+            if not interface.registries_frozen:
+                if len(dispatch_cache) >= _MULTIMETHOD_CACHE_SIZE:
+                    dispatch_cache.clear()
+                dispatch_cache[types_] = impl
+            return impl
+
+    def register(*types_: Any) -> Callable:
+        """Registers an implementation for arguments of the given types.  Used as register(*types, impl),
+        as the decorator register(*types) or as a decorator on a function with annotated positional parameters.
+        """
+        if types_ and callable(types_[-1]) and not isinstance(types_[-1], type):
+            impl = types_[-1]
+            add(types_[:-1] or _signature_types(impl), impl)
+            return impl
+
+        def decorator(impl: Callable) -> Callable:
+            add(types_, impl)
+            return impl
+
+        return decorator
+
+    def add(types_: Tuple[type, ...], impl: Callable) -> None:
+        for cls in types_:
+            if not isinstance(cls, type):
+                raise TypeError(f"Invalid class {cls!r} to register {impl.__qualname__} for")
+        index.setdefault(len(types_), {})[types_] = impl
+        dispatch_cache.clear()
+
+    def wrapper(*args, **kwargs):
+        return dispatch(*map(type, args))(*args, **kwargs)
+
+    wrapper.register = register  # type: ignore[attr-defined]
+    wrapper.dispatch = dispatch  # type: ignore[attr-defined]
+    wrapper.cache_clear = dispatch_cache.clear  # type: ignore[attr-defined]
+    functools.update_wrapper(wrapper, func)
+    return wrapper
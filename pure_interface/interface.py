@@ -26,22 +26,75 @@ from typing import (
     FrozenSet,
     Generic,
     Iterable,
+    Iterator,
     List,
+    NamedTuple,
     Optional,
     Set,
     Tuple,
     Type,
     TypeVar,
+    cast,
 )
 
+from . import _columns, _profiling
 from .errors import AdaptionError, InterfaceError
 
 is_development = not hasattr(sys, "frozen")
-missing_method_warnings: List[str] = []
+strip_signatures: Optional[str] = None
+registries_frozen = False
+registry_version = 0  # incremented when adapters or registrations change
 
 _T = TypeVar("_T")
 
 
+class MissingMethodWarning(NamedTuple):
+    """A concrete class that does not implement an interface method"""
+
+    class_name: str  # module qualified class name
+    method_name: str
+    message: str
+    occurrences: int  # number of times a class with this name was created without the method
+
+
+class _MissingMethodWarnings:
+    """Bounded store of missing method warnings.
+    Warnings are de-duplicated on class name and method name, so that creating many classes with the same name does
+    not grow the store. When the store is full the oldest warnings are discarded.
+    Class names are stored rather than classes so that dynamically created classes are not kept alive.
+    """
+
+    def __init__(self, limit: int = 1000):
+        self.limit = limit
+        self.warn_once = False
+        self.rebuilding: Set["_PIAttributes"] = set()  # _pi of classes being re-created, e.g. by dataclass(slots=True)
+        self._warnings: Dict[Tuple[str, str], MissingMethodWarning] = {}
+
+    def add(self, class_name: str, method_name: str, message: str) -> bool:
+        """Record a warning, returning True if this class and method have not been recorded before."""
+        key = (class_name, method_name)
+        existing = self._warnings.get(key)
+        if existing is not None:
+            self._warnings[key] = existing._replace(occurrences=existing.occurrences + 1)
+            return False
+        self._warnings[key] = MissingMethodWarning(class_name, method_name, message, 1)
+        while len(self._warnings) > self.limit:
+            del self._warnings[next(iter(self._warnings))]
+        return True
+
+    def clear(self) -> None:
+        self._warnings.clear()
+
+    def records(self) -> List[MissingMethodWarning]:
+        return list(self._warnings.values())
+
+    def messages(self) -> List[str]:
+        return [record.message for record in self._warnings.values()]
+
+
+missing_method_warnings = _MissingMethodWarnings()
+
+
 def set_is_development(is_dev: bool) -> None:
     global is_development
     is_development = is_dev
@@ -51,8 +104,89 @@ def get_is_development() -> bool:
     return is_development
 
 
+def set_strip_signatures(strip: Optional[str]) -> None:
+    """Controls which classes keep the inspect.Signature objects of interface methods once the class is created.
+    "never" - all classes keep their signatures.
+    "concrete" - only interface classes keep their signatures.
+    "all" - no class keeps its signatures.
+    None (the default) - "never" if is_development is True and "concrete" otherwise.
+    Stripped signatures are rebuilt from the interface class if they are needed to check a new sub-class.
+    """
+    if strip not in (None, "never", "concrete", "all"):
+        raise ValueError(f'strip must be None, "never", "concrete" or "all" not {strip!r}')
+    global strip_signatures
+    strip_signatures = strip
+
+
+def get_strip_signatures() -> Optional[str]:
+    return strip_signatures
+
+
+def _signatures_are_stripped(type_is_interface: bool) -> bool:
+    strip = strip_signatures
+    if strip is None:
+        strip = "never" if is_development else "concrete"
+    return strip == "all" or (strip == "concrete" and not type_is_interface)
+
+
 def get_missing_method_warnings() -> List[str]:
-    return missing_method_warnings
+    return missing_method_warnings.messages()
+
+
+def get_missing_method_warning_records() -> List[MissingMethodWarning]:
+    return missing_method_warnings.records()
+
+
+def clear_missing_method_warnings() -> None:
+    missing_method_warnings.clear()
+
+
+def set_missing_method_warnings_limit(limit: int) -> None:
+    """Sets the maximum number of distinct missing method warnings that are stored."""
+    if limit < 0:
+        raise ValueError("limit must not be negative")
+    missing_method_warnings.limit = limit
+
+
+def set_warn_missing_methods_once(once: bool) -> None:
+    """If once is True, only issue a warning the first time a class name, method name pair is recorded."""
+    missing_method_warnings.warn_once = once
+
+
+def freeze_registries() -> None:
+    """Stop pure_interface caches from growing and forbid changes to adapter and interface registrations.
+    Intended to be called (via warm_up) in the parent process of a pre-fork server so that child processes
+    do not write to memory pages shared with the parent.  Cache misses are still computed, but not stored.
+
+    The interface_only wrapper type of an interface is still created and stored the first time it is needed, as
+    creating a new type for every call would be slow; warm_up creates them for the interfaces it is given.
+    from_protocol raises InterfaceError for a protocol that has not been converted before freezing, as it
+    stores the new interface for later calls.
+    """
+    global registries_frozen
+    registries_frozen = True
+
+
+def unfreeze_registries() -> None:
+    global registries_frozen
+    registries_frozen = False
+
+
+def get_registries_frozen() -> bool:
+    return registries_frozen
+
+
+def _check_registries_not_frozen(action: str) -> None:
+    if registries_frozen:
+        raise InterfaceError(f"Cannot {action} while registries are frozen")
+
+
+def _registries_changed() -> None:
+    """Called when adapters or interface registrations change, to discard cached lookups"""
+    global registry_version
+    registry_version += 1
+    _adapter_cache.clear()
+    _generic_provided_cache.clear()
 
 
 def no_adaption(obj: _T) -> _T:
@@ -76,6 +210,24 @@ def _unique_list(items: Iterable[Any]) -> List[Any]:
 class _PIAttributes:
     """rather than clutter the class namespace with lots of _pi_XXX attributes, collect them all here"""
 
+    # There is one of these per class, so keep them small.  Containers only used by interfaces are created on demand
+    # and containers that are unchanged from a base class are shared with that base (see share_storage).
+    __slots__ = (
+        "type_is_interface",
+        "abstractproperties",
+        "interface_method_names",
+        "interface_method_signatures",
+        "_interface_attribute_names",
+        "_interface_attribute_name_set",
+        "_interface_names",
+        "_adapters",
+        "_registered_types",
+        "_structural_subclasses",
+        "impl_wrapper_type",
+        "type_interfaces",
+        "type_interface_set",
+    )
+
     def __init__(
         self,
         this_type_is_an_interface: bool,
@@ -89,16 +241,94 @@ class _PIAttributes:
         self.abstractproperties = frozenset(abstract_properties)
         self.interface_method_names = frozenset(interface_method_signatures.keys())
         # keep an ordered list for dataclass
-        self.interface_attribute_names: List[str] = _unique_list(interface_attribute_names)
-        self.interface_method_signatures = interface_method_signatures
-        self.adapters = weakref.WeakKeyDictionary()  # type: ignore
-        self.registered_types = weakref.WeakSet()  # type: ignore
-        self.structural_subclasses: Set[type] = set()
+        self.interface_attribute_names = interface_attribute_names
+        # None if the signatures have been stripped, see set_strip_signatures
+        self.interface_method_signatures: Optional[Dict[str, Signature]] = interface_method_signatures
+        self._adapters: Optional[weakref.WeakKeyDictionary] = None
+        self._registered_types: Optional[weakref.WeakSet] = None
+        self._structural_subclasses: Optional[Set[type]] = None
         self.impl_wrapper_type: Optional[type] = None
+        # populated on first call to get_type_interfaces
+        self.type_interfaces: Optional[Tuple[type, ...]] = None
+        self.type_interface_set: Optional[FrozenSet[type]] = None
+
+    @property
+    def interface_attribute_names(self) -> List[str]:
+        return self._interface_attribute_names
+
+    @interface_attribute_names.setter
+    def interface_attribute_names(self, names: Iterable[str]) -> None:
+        self._interface_attribute_names: List[str] = _unique_list(names)
+        self._interface_attribute_name_set: Optional[FrozenSet[str]] = None
+        self._interface_names: Optional[FrozenSet[str]] = None
+
+    @property
+    def interface_attribute_name_set(self) -> FrozenSet[str]:
+        name_set = self._interface_attribute_name_set
+        if name_set is None:
+            name_set = frozenset(self._interface_attribute_names)
+            if not registries_frozen:
+                self._interface_attribute_name_set = name_set
+        return name_set
 
     @property
     def interface_names(self) -> FrozenSet[str]:
-        return self.interface_method_names.union(self.interface_attribute_names)
+        names = self._interface_names
+        if names is None:
+            names = self.interface_method_names.union(self._interface_attribute_names)
+            if not registries_frozen:
+                self._interface_names = names
+        return names
+
+    @property
+    def adapters(self) -> weakref.WeakKeyDictionary:
+        if self._adapters is None:
+            self._adapters = weakref.WeakKeyDictionary()
+        return self._adapters
+
+    @property
+    def registered_types(self) -> weakref.WeakSet:
+        if self._registered_types is None:
+            self._registered_types = weakref.WeakSet()
+        return self._registered_types
+
+    @property
+    def structural_subclasses(self) -> Set[type]:
+        if self._structural_subclasses is None:
+            self._structural_subclasses = set()
+        return self._structural_subclasses
+
+    def has_adapters(self) -> bool:
+        return bool(self._adapters)
+
+    def iter_registered_types(self) -> Iterable[type]:
+        return () if self._registered_types is None else self._registered_types
+
+    def share_storage(self, others: Iterable["_PIAttributes"]) -> None:
+        """Replace containers that are equal to those of another _PIAttributes (typically from a base class)
+        with the other's instance so that large hierarchies do not keep many copies of the same data.
+        These containers are never mutated once the class is created.
+        """
+        for other in others:
+            if (
+                self.interface_method_signatures is not other.interface_method_signatures
+                and other.interface_method_signatures is not None
+            ):
+                if self.interface_method_signatures == other.interface_method_signatures:
+                    self.interface_method_signatures = other.interface_method_signatures
+                    self.interface_method_names = other.interface_method_names
+            if self._interface_attribute_names is not other._interface_attribute_names:
+                if self._interface_attribute_names == other._interface_attribute_names:
+                    self._interface_attribute_names = other._interface_attribute_names
+                    self._interface_attribute_name_set = other.interface_attribute_name_set
+            if self.abstractproperties is not other.abstractproperties:
+                if self.abstractproperties == other.abstractproperties:
+                    self.abstractproperties = other.abstractproperties
+            if (
+                self.interface_method_names is other.interface_method_names
+                and self._interface_attribute_names is other._interface_attribute_names
+            ):
+                self._interface_names = other.interface_names
 
 
 class _ImplementationWrapper:
@@ -121,6 +351,26 @@ class _ImplementationWrapper:
         else:
             raise AttributeError("'{}' interface has no attribute '{}'".format(self.__interface_name, key))
 
+    def __reduce__(self):
+        # the wrapper type is created at runtime, so pickle the interface and implementation instead.
+        return _restore_interface_only, (self.__interface, self.__impl)
+
+
+def _restore_interface_only(interface: AnInterfaceType, implementation: Any) -> Any:
+    return interface.interface_only(implementation)
+
+
+def _get_impl_wrapper_type(cls: AnInterfaceType) -> type:
+    """Returns the interface_only wrapper type for the interface cls, creating it the first time."""
+    if cls._pi.impl_wrapper_type is None:
+        type_name = "_{}Only".format(cls.__name__)
+        attributes: dict[str, Any] = {"__module__": cls.__module__}
+        if "__call__" in cls._pi.interface_names:
+            attributes["__call__"] = _wrapped_call
+        cls._pi.impl_wrapper_type = type(type_name, (_ImplementationWrapper,), attributes)
+        abc.ABCMeta.register(cls, cls._pi.impl_wrapper_type)
+    return cls._pi.impl_wrapper_type
+
 
 def _wrapped_call(self, *args, **kwargs) -> Any:
     impl = object.__getattribute__(self, "_ImplementationWrapper__impl")
@@ -139,6 +389,7 @@ def _is_builtin_attr(name: str) -> bool:
         "__weakref__",
         "__subclasshook__",
         "__orig_bases__",
+        "__slots__",
         "_abc_cache",
         "_abc_impl",
         "_abc_registry",
@@ -164,6 +415,14 @@ def get_pi_attribute(cls: Type, attr_name: str, default: Any = None) -> Any:
         return default
 
 
+# ABC class -> is an empty ABC class
+_abc_is_interface_cache: "weakref.WeakKeyDictionary[type, bool]" = weakref.WeakKeyDictionary()
+# ABC class -> (abstract properties, abstract method signatures)
+_abc_props_and_funcs_cache: "weakref.WeakKeyDictionary[type, Tuple[FrozenSet[str], Dict[str, Signature]]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
 def _type_is_interface(cls: type) -> bool:
     """Return True if cls is a pure interface or an empty ABC class"""
     if cls is object:
@@ -173,26 +432,51 @@ def _type_is_interface(cls: type) -> bool:
     if cls is Generic:
         return True  # this class is just for type hinting
     if issubclass(type(cls), abc.ABCMeta):
-        for attr, value in cls.__dict__.items():
-            if _is_builtin_attr(attr):
-                continue
-            if callable(value):
-                if not _is_empty_function(value):
-                    return False
-            elif isinstance(value, property):
-                for func in (value.fget, value.fset, value.fdel):
-                    if func is not None and not _is_empty_function(func):
-                        return False
-        return True
+        try:
+            return _abc_is_interface_cache[cls]
+        except KeyError:
+            pass
+        is_interface = _abc_is_empty(cls)
+        if not registries_frozen:
+            _abc_is_interface_cache[cls] = is_interface
+        return is_interface
 
     return False
 
 
-def _get_abc_interface_props_and_funcs(cls: Type[abc.ABC]) -> Tuple[Set[str], Dict[str, Signature]]:
+def _abc_is_empty(cls: type) -> bool:
+    for attr, value in cls.__dict__.items():
+        if _is_builtin_attr(attr):
+            continue
+        if callable(value):
+            if not _is_empty_function(value):
+                return False
+        elif isinstance(value, property):
+            for func in (value.fget, value.fset, value.fdel):
+                if func is not None and not _is_empty_function(func):
+                    return False
+    return True
+
+
+def _get_abc_interface_props_and_funcs(cls: Type[abc.ABC]) -> Tuple[FrozenSet[str], Dict[str, Signature]]:
+    """Returns the abstract properties and abstract method signatures of the ABC class cls.
+    The results are cached, callers must not modify them.
+    """
+    try:
+        return _abc_props_and_funcs_cache[cls]
+    except KeyError:
+        pass
+    props_and_funcs = _find_abc_interface_props_and_funcs(cls)
+    if not registries_frozen:
+        _abc_props_and_funcs_cache[cls] = props_and_funcs
+    return props_and_funcs
+
+
+def _find_abc_interface_props_and_funcs(cls: Type[abc.ABC]) -> Tuple[FrozenSet[str], Dict[str, Signature]]:
     properties: Set[str] = set()
     function_sigs: Dict[str, Signature] = {}
     if not hasattr(cls, "__abstractmethods__"):
-        return properties, function_sigs
+        return frozenset(properties), function_sigs
     for name in cls.__abstractmethods__:
         if _is_builtin_attr(name):
             pass  # shortcut
@@ -205,7 +489,30 @@ def _get_abc_interface_props_and_funcs(cls: Type[abc.ABC]) -> Tuple[Set[str], Di
         elif isinstance(value, property):
             properties.add(name)
 
-    return properties, function_sigs
+    return frozenset(properties), function_sigs
+
+
+def _get_method_signatures(cls: Type, need_signatures: bool = True) -> Dict[str, Any]:
+    """Returns cls._pi.interface_method_signatures, rebuilding them from the interface classes in the mro if they
+    have been stripped.  If need_signatures is False the values of the returned dictionary may be None.
+    """
+    pi_attributes = cls._pi
+    if pi_attributes.interface_method_signatures is not None:
+        return pi_attributes.interface_method_signatures
+    if not need_signatures:
+        return dict.fromkeys(pi_attributes.interface_method_names)
+    method_signatures = {}
+    for name in pi_attributes.interface_method_names:
+        for klass in cls.__mro__:
+            if name in klass.__dict__ and _type_is_interface(klass):
+                value = klass.__dict__[name]
+                if isinstance(value, (staticmethod, classmethod)):
+                    value = value.__func__
+                method_signatures[name] = signature(value)
+                break
+    if not _signatures_are_stripped(pi_attributes.type_is_interface):
+        pi_attributes.interface_method_signatures = method_signatures
+    return method_signatures
 
 
 def _unwrap_function(func: Any) -> Any:
@@ -508,9 +815,10 @@ def _check_method_signatures(attributes, clsname, interface_method_signatures):
             raise InterfaceError(msg)
 
 
-def _do_missing_impl_warnings(cls, clsname):
+def _missing_impl_stacklevel():
+    """Returns the stacklevel for warnings issued by the calling function"""
     stacklevel = 2
-    stack = inspect.stack()
+    stack = inspect.stack()[1:]  # ignore this frame
     # walk up stack until we get out of pure_interface module
     while stacklevel < len(stack) and "pure_interface" in stack[stacklevel][1]:
         stacklevel += 1
@@ -519,10 +827,20 @@ def _do_missing_impl_warnings(cls, clsname):
     while stack and stack[0][0].f_code.co_name == "__new__":
         stacklevel += 1
         stack.pop(0)
-    for method_name in cls.__abstractmethods__:
+    return stacklevel
+
+
+def _do_missing_impl_warnings(cls, clsname):
+    class_name = "{}.{}".format(cls.__module__, cls.__qualname__)
+    stacklevel = None
+    for method_name in sorted(cls.__abstractmethods__):
         message = "Incomplete Implementation: {clsname} does not implement {method_name}"
         message = message.format(clsname=clsname, method_name=method_name)
-        missing_method_warnings.append(message)
+        is_new = missing_method_warnings.add(class_name, method_name, message)
+        if missing_method_warnings.warn_once and not is_new:
+            continue
+        if stacklevel is None:  # inspect.stack() is slow, only do it if we have to.
+            stacklevel = _missing_impl_stacklevel()
         warnings.warn(message, stacklevel=stacklevel)
 
 
@@ -539,7 +857,8 @@ def _structural_type_check(cls, instance):
 
 
 def _class_structural_type_check(cls, subclass):
-    if subclass in cls._pi.structural_subclasses:
+    structural_subclasses = cls._pi._structural_subclasses
+    if structural_subclasses is not None and subclass in structural_subclasses:
         return True
 
     for attr in cls._pi.interface_method_names:
@@ -550,7 +869,8 @@ def _class_structural_type_check(cls, subclass):
         if not hasattr(subclass, attr):
             return False
 
-    cls._pi.structural_subclasses.add(subclass)
+    if not registries_frozen:
+        cls._pi.structural_subclasses.add(subclass)
     if is_development:
         stacklevel = 2
         stack = inspect.stack()
@@ -566,14 +886,38 @@ def _class_structural_type_check(cls, subclass):
     return True
 
 
+# obj_type -> {interface: adapter or None}
+_adapter_cache: "weakref.WeakKeyDictionary[type, Dict[type, Optional[Callable]]]" = weakref.WeakKeyDictionary()
+
+
 def _get_adapter(cls: AnInterfaceType, obj_type: Type) -> Optional[Callable]:
-    """Returns a callable that adapts objects of type obj_type to this interface or None if no adapter exists."""
+    """Returns a callable that adapts objects of type obj_type to this interface or None if no adapter exists.
+    Results are cached until adapters or registrations change.
+    """
+    try:
+        return _adapter_cache[obj_type][cls]
+    except KeyError:
+        pass
+    except TypeError:  # not weak-referencable
+        return _find_adapter(cls, obj_type)
+    adapter = _find_adapter(cls, obj_type)
+    if not registries_frozen:
+        interface_adapters = _adapter_cache.get(obj_type)
+        if interface_adapters is None:
+            interface_adapters = _adapter_cache[obj_type] = {}
+        interface_adapters[cls] = adapter
+    return adapter
+
+
+def _find_adapter(cls: AnInterfaceType, obj_type: Type) -> Optional[Callable]:
+    if isinstance(cls, _GenericInterfaceAlias):
+        return _find_generic_adapter(cls, obj_type)
     adapters = {}  # type: ignore
     # registered interfaces can come from cls.register(AnotherInterface) or @sub_interface_of(AnotherInterface)(cls)
-    candidate_interfaces = [cls] + cls.__subclasses__() + list(cls._pi.registered_types)
+    candidate_interfaces: List[Any] = [cls] + cls.__subclasses__() + list(cls._pi.iter_registered_types())
     candidate_interfaces.reverse()  # prefer this class over sub-class adapters
     for subcls in candidate_interfaces:
-        if type_is_interface(subcls):
+        if type_is_interface(subcls) and subcls._pi.has_adapters():
             adapters.update(subcls._pi.adapters)
     if not adapters:
         return None
@@ -586,6 +930,145 @@ def _get_adapter(cls: AnInterfaceType, obj_type: Type) -> Optional[Callable]:
     return None
 
 
+class _GenericInterfaceAlias(types.GenericAlias):
+    """A parametrised generic interface such as IFoo[int].
+    Provides the adaption methods of the interface, taking the type parameters into account.
+    """
+
+    __origin__: "InterfaceType"
+
+    def __getattribute__(self, name: str) -> Any:
+        method = _generic_alias_methods.get(name)
+        if method is not None:
+            return types.MethodType(method, self)
+        return types.GenericAlias.__getattribute__(self, name)
+
+    def __getitem__(self, params: Any) -> "_GenericInterfaceAlias":
+        alias = super().__getitem__(params)
+        return _GenericInterfaceAlias(cast(InterfaceType, alias.__origin__), alias.__args__)
+
+
+# origin interface -> {args: {from_type: adapter}}
+_generic_adapters: "weakref.WeakKeyDictionary[type, Dict[tuple, weakref.WeakKeyDictionary]]" = (
+    weakref.WeakKeyDictionary()
+)
+# obj_type -> {parametrised interface: whether obj_type nominally provides it, or None if it is not a sub-class}
+_generic_provided_cache: "weakref.WeakKeyDictionary[type, Dict[_GenericInterfaceAlias, Optional[bool]]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_generic_adapters(alias: _GenericInterfaceAlias) -> weakref.WeakKeyDictionary:
+    """Returns the adapters registered for alias, a parametrised generic interface"""
+    interface_adapters = _generic_adapters.get(alias.__origin__)
+    if interface_adapters is None:
+        interface_adapters = _generic_adapters[alias.__origin__] = {}
+    adapters = interface_adapters.get(alias.__args__)
+    if adapters is None:
+        adapters = interface_adapters[alias.__args__] = weakref.WeakKeyDictionary()
+    return adapters
+
+
+def _find_generic_adapter(alias: _GenericInterfaceAlias, obj_type: Type) -> Optional[Callable]:
+    """Adapters registered for this parametrisation are preferred over those registered for the interface itself"""
+    adapters = _generic_adapters.get(alias.__origin__, {}).get(alias.__args__)
+    if adapters:
+        for obj_class in obj_type.__mro__:
+            try:
+                return adapters[obj_class]
+            except KeyError:
+                continue
+    return _find_adapter(alias.__origin__, obj_type)
+
+
+def _substitute_type_vars(arg: Any, substitutions: Dict[Any, Any]) -> Any:
+    """Returns arg with the type variables in substitutions replaced, e.g. List[T] -> List[int]"""
+    if isinstance(arg, TypeVar):
+        return substitutions.get(arg, arg)
+    parameters = getattr(arg, "__parameters__", ())
+    if parameters and not isinstance(arg, type) and all(p in substitutions for p in parameters):
+        try:
+            return arg[tuple(substitutions[p] for p in parameters)]
+        except TypeError:
+            pass
+    return arg
+
+
+def _generic_parametrisations(cls: type, origin: type, substitutions: Dict[Any, Any]) -> Iterator[tuple]:
+    """Yields the arguments that cls and its bases parametrise the generic class origin with.
+    substitutions maps the type variables of cls to the arguments cls is parametrised with by a sub-class, so that
+    arguments passed through intermediate generic classes are resolved.
+    """
+    for base in cls.__dict__.get("__orig_bases__", cls.__bases__):
+        base_origin = getattr(base, "__origin__", None)
+        if base_origin is None:
+            if isinstance(base, type) and base is not object:
+                yield from _generic_parametrisations(base, origin, {})
+            continue
+        if base_origin is Generic or not isinstance(base_origin, type):
+            continue
+        args = tuple(_substitute_type_vars(arg, substitutions) for arg in base.__args__)
+        if base_origin is origin:
+            yield args
+        base_parameters = getattr(base_origin, "__parameters__", ())
+        base_substitutions = dict(zip(base_parameters, args)) if len(base_parameters) == len(args) else {}
+        yield from _generic_parametrisations(base_origin, origin, base_substitutions)
+
+
+def _type_arg_matches(base_arg: Any, arg: Any) -> bool:
+    """Returns True if the type argument base_arg matches arg.  Unresolved type variables match anything."""
+    if isinstance(base_arg, TypeVar) or base_arg == arg:
+        return True
+    if not getattr(base_arg, "__parameters__", ()) or isinstance(base_arg, type):
+        return False
+    base_args, args = getattr(base_arg, "__args__", ()), getattr(arg, "__args__", ())
+    return (
+        getattr(base_arg, "__origin__", None) == getattr(arg, "__origin__", None)
+        and len(base_args) == len(args)
+        and all(_type_arg_matches(b, a) for b, a in zip(base_args, args))
+    )
+
+
+def _generic_args_match(cls: type, alias: _GenericInterfaceAlias) -> bool:
+    """Returns True if cls or a base parametrises the generic interface with arguments matching those of alias, or
+    if none of them parametrise it.  Type variables that are not resolved by a sub-class match any argument.
+    """
+    origin, args = alias.__origin__, alias.__args__
+    parametrisations = list(_generic_parametrisations(cls, cast(type, origin), {}))
+    if not parametrisations:
+        return True  # the interface is inherited without parameters
+    for base_args in parametrisations:
+        if len(base_args) == len(args) and all(_type_arg_matches(b, a) for b, a in zip(base_args, args)):
+            return True
+    return False
+
+
+def _generic_provided_by(alias: _GenericInterfaceAlias, obj: Any, allow_implicit: bool) -> bool:
+    """provided_by for parametrised generic interfaces.
+    Classes that nominally implement the interface must have compatible type parameters.  The type parameters of
+    structural implementations cannot be checked.
+    """
+    obj_type = type(obj)
+    try:
+        provided = _generic_provided_cache[obj_type][alias]
+    except (KeyError, TypeError):
+        provided = _generic_args_match(obj_type, alias) if isinstance(obj, alias.__origin__) else None
+        if not registries_frozen:
+            try:
+                _generic_provided_cache.setdefault(obj_type, {})[alias] = provided
+            except TypeError:  # not weak-referencable
+                pass
+    if provided is not None:
+        return provided
+    return allow_implicit and InterfaceType._provided_by(alias.__origin__, obj, allow_implicit=True)
+
+
+def _generic_first_class_getitem(cls: type, params: Any) -> _GenericInterfaceAlias:
+    """__class_getitem__ for generic interfaces that have Generic before Interface in their bases"""
+    alias = Generic.__dict__["__class_getitem__"].__get__(None, cls)(params)
+    return _GenericInterfaceAlias(alias.__origin__, alias.__args__)
+
+
 class InterfaceType(abc.ABCMeta):
     """
     Meta-Class for Interface.
@@ -610,6 +1093,7 @@ class InterfaceType(abc.ABCMeta):
             cls._pi = _PIAttributes(False, set(), {}, [])
             return cls
 
+        timer = _profiling.class_timer(attributes.get("__module__", ""), attributes.get("__qualname__", clsname))
         base_types = [(cls, _type_is_interface(cls)) for cls in bases]
 
         if clsname == "Interface" and attributes.get("__module__", "") == "pure_interface.interface":
@@ -622,6 +1106,8 @@ class InterfaceType(abc.ABCMeta):
         interface_method_signatures = dict()
         interface_attribute_names = list()
         abstract_properties = set()
+        # base signatures are only used for checking, unless this class keeps them
+        need_signatures = is_development or not _signatures_are_stripped(this_type_is_an_interface)
         for i in range(len(bases) - 1, -1, -1):  # start at back end
             base, base_is_interface = base_types[i]
             if base is object:
@@ -630,7 +1116,7 @@ class InterfaceType(abc.ABCMeta):
             abstract_properties.update(base_abstract_properties)
             if base_is_interface:
                 if hasattr(base, "_pi"):
-                    method_signatures = get_pi_attribute(base, "interface_method_signatures", {})
+                    method_signatures = _get_method_signatures(base, need_signatures)
                     attribute_names = get_pi_attribute(base, "interface_attribute_names", [])
                 else:
                     attribute_names, method_signatures = _get_abc_interface_props_and_funcs(base)
@@ -638,9 +1124,11 @@ class InterfaceType(abc.ABCMeta):
                 interface_attribute_names.extend(attribute_names)
             elif is_development and not issubclass(base, Interface):
                 _check_method_signatures(base.__dict__, base.__name__, interface_method_signatures)
+        timer.mark("bases")
 
         if is_development:
             _check_method_signatures(attributes, clsname, interface_method_signatures)
+        timer.mark("signatures")
 
         if this_type_is_an_interface:
             if clsname == "Interface" and attributes.get("__module__", "") == "pure_interface.interface":
@@ -650,6 +1138,7 @@ class InterfaceType(abc.ABCMeta):
                 attribute_names = []
             else:
                 namespace, functions, method_signatures, attribute_names = _ensure_everything_is_abstract(attributes)
+            timer.mark("abstract")
             partial_implementation = False
             interface_method_signatures.update(method_signatures)
             interface_attribute_names.extend(attribute_names)
@@ -660,6 +1149,7 @@ class InterfaceType(abc.ABCMeta):
                     continue
                 if not _is_empty_function(func, unwrap):
                     raise InterfaceError('Interface method "{}.{}" must be empty.'.format(clsname, func.__name__))
+            timer.mark("empty")
         else:  # concrete sub-type
             namespace = attributes
             class_properties = set()
@@ -677,38 +1167,60 @@ class InterfaceType(abc.ABCMeta):
                         "pi_partial_implementation attribute, not it"
                         "s value"
                     )
+            for base in bases:
+                # lets a base class (e.g. Delegate) add to the namespace, such as __slots__, before the class exists
+                prepare_namespace = getattr(base, "_pi_prepare_namespace", None)
+                if prepare_namespace is not None:
+                    prepare_namespace(bases, namespace)
+                    break
+            timer.mark("properties")
 
         # create class
+        original_pi = namespace.get("_pi")  # the _pi of the original class when a class is re-created
         namespace["_pi"] = pi_attributes = _PIAttributes(
             this_type_is_an_interface, abstract_properties, interface_method_signatures, interface_attribute_names
         )
         cls = super(InterfaceType, mcs).__new__(mcs, clsname, bases, namespace, **kwargs)
+        if this_type_is_an_interface and "__class_getitem__" not in namespace and "Interface" in globals():
+            mro = cls.__mro__
+            if Generic in mro and mro.index(Generic) < mro.index(Interface):
+                # Generic.__class_getitem__ would be found before Interface.__class_getitem__
+                setattr(cls, "__class_getitem__", classmethod(_generic_first_class_getitem))
+        timer.mark("type")
 
         # add annotations after creating the class so that we can use inspect module.
         annotations = inspect.get_annotations(cls)
         interface_attribute_names = [
             a for a in annotations.keys() if not _is_builtin_attr(a)
         ] + interface_attribute_names
-        pi_attributes.interface_attribute_names = _unique_list(interface_attribute_names)
+        pi_attributes.interface_attribute_names = interface_attribute_names
+        pi_attributes.share_storage(base.__dict__["_pi"] for base in bases if "_pi" in base.__dict__)
 
         base_interfaces = [bt for bt, is_interface in base_types if is_interface]
         if interface_attribute_names and base_interfaces:
             # provide interface attributes as annotations so that dataclass decorator creates all attributes
             # defined on base interfaces.
             _ensure_annotations(interface_attribute_names, cls, base_interfaces)
+        timer.mark("annotations")
 
         # warnings
         if not this_type_is_an_interface and is_development and cls.__abstractmethods__ and not partial_implementation:
-            _do_missing_impl_warnings(cls, clsname)
+            if original_pi not in missing_method_warnings.rebuilding:  # the original class was warned about already
+                _do_missing_impl_warnings(cls, clsname)
+        timer.mark("warnings")
+
+        if _signatures_are_stripped(this_type_is_an_interface):
+            pi_attributes.interface_method_signatures = None
 
         return cls
 
     def __call__(cls, *args, **kwargs):
         """Check that abstract properties are created in constructor"""
-        if cls._pi.type_is_interface:
+        pi_attributes = cls._pi
+        if pi_attributes.type_is_interface:
             raise InterfaceError("Interfaces cannot be instantiated")
         self = super(InterfaceType, cls).__call__(*args, **kwargs)
-        for attr in cls._pi.abstractproperties:
+        for attr in pi_attributes.abstractproperties:
             if not (hasattr(cls, attr) or hasattr(self, attr)):
                 # check for attribute on class first so that properties are not run.
                 raise InterfaceError('{}.__init__ does not create required attribute "{}"'.format(cls.__name__, attr))
@@ -721,9 +1233,11 @@ class InterfaceType(abc.ABCMeta):
         return sorted(listing)
 
     def provided_by(cls, obj):
-        return cls._provided_by(obj, allow_implicit=True)
+        return InterfaceType._provided_by(cls, obj, allow_implicit=True)
 
     def _provided_by(cls, obj, allow_implicit=True):
+        if type(cls) is _GenericInterfaceAlias:
+            return _generic_provided_by(cls, obj, allow_implicit)
         if not cls._pi.type_is_interface:
             raise InterfaceError("provided_by() can only be called on interfaces")
         if isinstance(obj, cls):
@@ -735,14 +1249,9 @@ class InterfaceType(abc.ABCMeta):
         return _structural_type_check(cls, obj)
 
     def interface_only(cls, implementation):
-        if cls._pi.impl_wrapper_type is None:
-            type_name = "_{}Only".format(cls.__name__)
-            attributes: dict[str, Any] = {"__module__": cls.__module__}
-            if "__call__" in cls._pi.interface_names:
-                attributes["__call__"] = _wrapped_call
-            cls._pi.impl_wrapper_type = type(type_name, (_ImplementationWrapper,), attributes)
-            abc.ABCMeta.register(cls, cls._pi.impl_wrapper_type)
-        return cls._pi.impl_wrapper_type(implementation, cls)
+        if isinstance(cls, _GenericInterfaceAlias):
+            cls = cls.__origin__
+        return _get_impl_wrapper_type(cls)(implementation, cls)
 
     def adapt(cls, obj, allow_implicit=False, interface_only=None):
         if interface_only is None:
@@ -790,17 +1299,40 @@ class InterfaceType(abc.ABCMeta):
             return None
         return InterfaceType.adapt(cls, obj, allow_implicit=allow_implicit, interface_only=interface_only)
 
+    def to_columns(cls, objects, dtype_map=None):
+        if not cls._pi.type_is_interface:
+            raise InterfaceError("to_columns() can only be called on interfaces")
+        return _columns.to_columns(cls, objects, dtype_map)
+
+    def from_columns(cls, columns):
+        if not cls._pi.type_is_interface:
+            raise InterfaceError("from_columns() can only be called on interfaces")
+        return _columns.from_columns(cls, columns)
+
     def register(cls, subclass: Type[_T]) -> Type[_T]:
         if type_is_interface(cls):
+            _check_registries_not_frozen("register types")
             cls._pi.registered_types.add(subclass)  # type: ignore[attr-defined]
+            _registries_changed()
         return super().register(subclass)
 
 
 class Interface(abc.ABC, metaclass=InterfaceType):
     # These methods don't need to be here, as they would resolve to the meta-class methods anyway.
     # However, including them here means we can add type hints that would otherwise be ambiguous on the meta-class.
+    __slots__ = ()
     _pi: _PIAttributes
 
+    def __class_getitem__(cls, params):
+        """Parametrised generic interfaces, e.g. IFoo[int], support adaption"""
+        class_getitem = getattr(super(), "__class_getitem__", None)
+        if class_getitem is None:
+            raise TypeError(f"type '{cls.__name__}' is not subscriptable")
+        alias = class_getitem(params)
+        if not cls._pi.type_is_interface or isinstance(alias, _GenericInterfaceAlias):
+            return alias
+        return _GenericInterfaceAlias(alias.__origin__, alias.__args__)
+
     @classmethod
     def provided_by(cls, obj) -> bool:
         """Returns True if obj provides this interface (structural type-check)."""
@@ -850,25 +1382,103 @@ class Interface(abc.ABC, metaclass=InterfaceType):
         """Adapt obj to to_interface or return None if adaption fails"""
         return InterfaceType.optional_adapt(cls, obj, allow_implicit=allow_implicit, interface_only=interface_only)
 
+    @classmethod
+    def to_columns(cls, objects: Iterable, dtype_map: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Returns a dictionary of attribute name to a column of the values of that attribute for each of objects.
+        dtype_map maps attribute names to an array.array type code or a NumPy dtype, giving an array.array or
+        NumPy array column.  Columns for attributes not in dtype_map are lists.
+        """
+        return InterfaceType.to_columns(cls, objects, dtype_map)
+
+    @classmethod
+    def from_columns(cls, columns: Dict[str, Any]) -> Iterator[Any]:
+        """Returns an iterator of row views of the columns (as returned by to_columns).
+        Each row view has the interface attributes, reading and writing the corresponding column values.
+        """
+        return InterfaceType.from_columns(cls, columns)
+
+
+# the InterfaceType methods provided by parametrised generic interfaces
+_generic_alias_methods: Dict[str, Callable] = {
+    name: getattr(InterfaceType, name)
+    for name in (
+        "provided_by",
+        "interface_only",
+        "adapt",
+        "adapt_or_none",
+        "can_adapt",
+        "filter_adapt",
+        "optional_adapt",
+    )
+}
+
 
 def type_is_interface(cls: Type) -> bool:  # -> TypeGuard[AnInterfaceType]
     """Return True if cls is a pure interface"""
-    try:
-        if not issubclass(cls, Interface):
-            return False
-    except TypeError:  # handle non-classes
+    # Only classes created by InterfaceType have a _pi attribute, so this is equivalent to issubclass(cls, Interface)
+    # without the cost of the ABCMeta.__subclasscheck__.
+    if not isinstance(cls, InterfaceType):
         return False
-    return get_pi_attribute(cls, "type_is_interface", False)
+    return cls._pi.type_is_interface
 
 
-def get_type_interfaces(cls: Type) -> List[type]:
-    """Returns all interfaces in the cls mro including cls itself if it is an interface"""
+# get_type_interfaces results for classes without their own _PIAttributes
+_type_interfaces_cache: "weakref.WeakKeyDictionary[type, Tuple[type, ...]]" = weakref.WeakKeyDictionary()
+_type_interface_set_cache: "weakref.WeakKeyDictionary[type, FrozenSet[type]]" = weakref.WeakKeyDictionary()
+
+
+def _get_type_interfaces(cls: Type) -> Tuple[type, ...]:
+    """Cached implementation of get_type_interfaces.  Returns an immutable tuple."""
+    pi_attributes = cls.__dict__.get("_pi") if isinstance(cls, type) else None
+    if pi_attributes is not None:
+        if pi_attributes.type_interfaces is None:
+            if registries_frozen:
+                return _scan_type_interfaces(cls)
+            pi_attributes.type_interfaces = _scan_type_interfaces(cls)
+        return pi_attributes.type_interfaces
+    try:
+        return _type_interfaces_cache[cls]
+    except KeyError:
+        interfaces = _scan_type_interfaces(cls)
+        if not registries_frozen:
+            _type_interfaces_cache[cls] = interfaces
+        return interfaces
+    except TypeError:  # handle non-classes and un-hashable types
+        return _scan_type_interfaces(cls)
+
+
+def _get_type_interface_set(cls: Type) -> FrozenSet[type]:
+    """Cached frozenset of get_type_interfaces(cls) for fast subset tests."""
+    pi_attributes = cls.__dict__.get("_pi") if isinstance(cls, type) else None
+    if pi_attributes is not None:
+        if pi_attributes.type_interface_set is None:
+            if registries_frozen:
+                return frozenset(_get_type_interfaces(cls))
+            pi_attributes.type_interface_set = frozenset(_get_type_interfaces(cls))
+        return pi_attributes.type_interface_set
+    try:
+        return _type_interface_set_cache[cls]
+    except KeyError:
+        interfaces = frozenset(_get_type_interfaces(cls))
+        if not registries_frozen:
+            _type_interface_set_cache[cls] = interfaces
+        return interfaces
+    except TypeError:  # handle non-classes and un-hashable types
+        return frozenset(_scan_type_interfaces(cls))
+
+
+def _scan_type_interfaces(cls: Type) -> Tuple[type, ...]:
     try:
-        bases = cls.mro()
+        bases = cls.__mro__
     except AttributeError:  # handle non-classes
-        return []
+        return ()
     # type_is_interface ensures returned types are Interface subclasses by mypy doesn't know this
-    return [base for base in bases if type_is_interface(base) and base is not Interface]
+    return tuple(base for base in bases if type_is_interface(base) and base is not Interface)
+
+
+def get_type_interfaces(cls: Type) -> List[type]:
+    """Returns all interfaces in the cls mro including cls itself if it is an interface"""
+    return list(_get_type_interfaces(cls))
 
 
 def get_interface_names(interface: Type) -> FrozenSet[str]:
@@ -896,6 +1506,6 @@ def get_interface_attribute_names(interface: Type) -> FrozenSet[str]:
     if interface is not a Interface subtype then an empty set is returned
     """
     if type_is_interface(interface):
-        return frozenset(get_pi_attribute(interface, "interface_attribute_names", ()))
+        return get_pi_attribute(interface, "interface_attribute_name_set")
     else:
         return frozenset()
@@ -2,6 +2,7 @@
 #  Copyright (c) 2024 Bentley Systems, Incorporated. All rights reserved.
 # --------------------------------------------------------------------------------------------
 
+import pickle
 import unittest
 import warnings
 from unittest import mock
@@ -244,6 +245,14 @@ class TestAdaption(unittest.TestCase):
             def foo(arg):
                 return None
 
+    def test_adapter_lookup_cache_invalidated(self):
+        class Late:
+            pass
+
+        self.assertIsNone(ISpeaker.adapt_or_none(Late()))
+        pure_interface.register_adapter(lambda obj: TopicSpeaker("late"), Late, ISpeaker)
+        self.assertIsInstance(ISpeaker.adapt(Late(), interface_only=False), TopicSpeaker)
+
     def test_manual_interface_only(self):
         topic_speaker = TopicSpeaker("Python")
         s = ITopicSpeaker.interface_only(topic_speaker)
@@ -251,6 +260,14 @@ class TestAdaption(unittest.TestCase):
         self.assertIsInstance(s, interface._ImplementationWrapper)
         self.assertIsInstance(s, ITopicSpeaker)
 
+    def test_pickle_interface_only(self):
+        s = ITopicSpeaker.interface_only(TopicSpeaker("Python"))
+        t = pickle.loads(pickle.dumps(s))
+
+        self.assertIs(type(s), type(t))
+        self.assertEqual("Python", t.topic)
+        self.assertEqual("speak", t.speak(5))
+
 
 class TestAdaptionToInterfaceOnly(unittest.TestCase):
     @classmethod
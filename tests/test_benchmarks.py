@@ -0,0 +1,65 @@
+# --------------------------------------------------------------------------------------------
+#  Copyright (c) 2024 Bentley Systems, Incorporated. All rights reserved.
+# --------------------------------------------------------------------------------------------
+
+import json
+import unittest
+import warnings
+
+from benchmarks import compare, generate, suite
+
+
+class BenchmarkSmokeTest(unittest.TestCase):
+    def test_run_all(self):
+        config = suite.Config(width=2, depth=2, number=5, repeat=1)
+        results = suite.run(config)
+        self.assertEqual(set(results["results"]), set(suite.benchmark_names()))
+        for result in results["results"].values():
+            self.assertGreaterEqual(result["value"], 0)
+        json.dumps(results)
+
+    def test_compare(self):
+        old = {"results": {"a": {"value": 1.0, "unit": "s"}, "b": {"value": 1.0, "unit": "s"}}}
+        new = {"results": {"a": {"value": 1.5, "unit": "s"}, "b": {"value": 0.5, "unit": "s"}}}
+        comparisons = {c.name: c for c in compare.compare(old, new)}
+        self.assertTrue(comparisons["a"].is_regression(0.1))
+        self.assertFalse(comparisons["b"].is_regression(0.1))
+        self.assertTrue(comparisons["b"].is_improvement(0.1))
+        self.assertIn("REGRESSION", compare.report(list(comparisons.values()), 0.1))
+
+    def test_compare_zero(self):
+        unchanged = compare.Comparison("memory.x", "bytes", 0.0, 0.0)
+        self.assertEqual(1.0, unchanged.ratio)
+        self.assertFalse(unchanged.is_regression(0.1))
+        self.assertFalse(unchanged.is_improvement(0.1))
+        self.assertNotIn("REGRESSION", compare.report([unchanged], 0.1))
+        self.assertFalse(compare.Comparison("memory.x", "bytes", 0.0, 0.05).is_regression(0.1))
+        self.assertTrue(compare.Comparison("memory.x", "bytes", 0.0, 16.0).is_regression(0.1))
+        self.assertTrue(compare.Comparison("memory.x", "bytes", 16.0, 0.0).is_improvement(0.1))
+        self.assertTrue(compare.Comparison("memory.x", "bytes", -8.0, 0.0).is_regression(0.1))
+        self.assertTrue(compare.Comparison("memory.x", "bytes", 0.0, -8.0).is_improvement(0.1))
+
+    def test_generated_source(self):
+        shape = generate.Shape(
+            interfaces=9,
+            implementations=6,
+            methods=2,
+            attributes=1,
+            depth=3,
+            diamond=2,
+            generic_every=2,
+            dataclass_every=2,
+            singledispatch_every=3,
+            async_every=4,
+        )
+        namespace: dict = {}
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")  # no missing methods
+            exec(compile(generate.generate_source(shape), "<generated>", "exec"), namespace)
+        self.assertIn("I8", namespace)
+        for m in range(shape.implementations):
+            impl_type = namespace[f"Impl{m}"]
+            if m % 2 == 0:
+                impl_type(**{name: 0 for name in impl_type.__dataclass_fields__})
+            else:
+                impl_type()
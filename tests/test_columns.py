@@ -0,0 +1,146 @@
+# --------------------------------------------------------------------------------------------
+#  Copyright (c) 2024 Bentley Systems, Incorporated. All rights reserved.
+# --------------------------------------------------------------------------------------------
+
+import array
+import unittest
+import warnings
+
+import pure_interface
+from pure_interface import Interface, InterfaceError
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class IPoint(Interface):
+    x: float
+    y: float
+    name: str
+
+    def length(self):
+        pass
+
+
+class IEmpty(Interface):
+    def method(self):
+        pass
+
+
+class Point(IPoint):
+    def __init__(self, x, y, name):
+        self.x = x
+        self.y = y
+        self.name = name
+
+    def length(self):
+        return (self.x**2 + self.y**2) ** 0.5
+
+
+class PropertyPoint(IPoint):
+    name = "property"
+
+    def __init__(self, x):
+        self.x = x
+
+    @property
+    def y(self):
+        return self.x * 2
+
+    def length(self):
+        return 0
+
+
+def make_points(n):
+    return [Point(float(i), float(-i), f"p{i}") for i in range(n)]
+
+
+class ToColumnsTest(unittest.TestCase):
+    def test_lists(self):
+        columns = IPoint.to_columns(make_points(3))
+        self.assertEqual(["x", "y", "name"], list(columns))
+        self.assertEqual([0.0, 1.0, 2.0], columns["x"])
+        self.assertEqual([0.0, -1.0, -2.0], columns["y"])
+        self.assertEqual(["p0", "p1", "p2"], columns["name"])
+
+    def test_arrays(self):
+        columns = IPoint.to_columns(make_points(3), dtype_map={"x": "d", "y": "f"})
+        self.assertEqual(array.array("d", [0.0, 1.0, 2.0]), columns["x"])
+        self.assertEqual("f", columns["y"].typecode)
+        self.assertIsInstance(columns["name"], list)
+
+    def test_mixed_types_and_iterators(self):
+        objects = iter([Point(1.0, 2.0, "a"), PropertyPoint(3.0), IPoint.interface_only(Point(5.0, 6.0, "c"))])
+        columns = IPoint.to_columns(objects, dtype_map={"x": "d", "y": "d"})
+        self.assertEqual(array.array("d", [1.0, 3.0, 5.0]), columns["x"])
+        self.assertEqual(array.array("d", [2.0, 6.0, 6.0]), columns["y"])
+        self.assertEqual(["a", "property", "c"], columns["name"])
+
+    def test_empty(self):
+        columns = IPoint.to_columns([], dtype_map={"x": "d"})
+        self.assertEqual({"x": array.array("d"), "y": [], "name": []}, columns)
+
+    def test_errors(self):
+        with self.assertRaises(InterfaceError):
+            IEmpty.to_columns([])
+        with self.assertRaises(InterfaceError):
+            IPoint.to_columns([], dtype_map={"z": "d"})
+        with self.assertRaises(InterfaceError):
+            Point.to_columns([])
+        with self.assertRaises(AttributeError):
+            IPoint.to_columns([object()])
+
+    @unittest.skipIf(numpy is not None, "NumPy is installed")
+    def test_numpy_not_installed(self):
+        with self.assertRaises(InterfaceError):
+            IPoint.to_columns(make_points(1), dtype_map={"x": "float64"})
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_numpy(self):
+        columns = IPoint.to_columns(make_points(3), dtype_map={"x": numpy.float32, "y": "d"})
+        self.assertIsInstance(columns["x"], numpy.ndarray)
+        self.assertEqual(numpy.float32, columns["x"].dtype)
+        self.assertEqual([0.0, 1.0, 2.0], columns["x"].tolist())
+
+
+class FromColumnsTest(unittest.TestCase):
+    def test_rows(self):
+        columns = IPoint.to_columns(make_points(3), dtype_map={"x": "d"})
+        rows = list(IPoint.from_columns(columns))
+        self.assertEqual(3, len(rows))
+        self.assertEqual((1.0, -1.0, "p1"), (rows[1].x, rows[1].y, rows[1].name))
+        self.assertEqual("_IPointRow(x=2.0, y=-2.0, name='p2')", repr(rows[2]))
+        self.assertFalse(hasattr(rows[0], "__dict__"))
+
+    def test_rows_write_to_columns(self):
+        columns = IPoint.to_columns(make_points(2), dtype_map={"x": "d"})
+        row = next(IPoint.from_columns(columns))
+        row.x = 7.5
+        self.assertEqual(7.5, columns["x"][0])
+
+    def test_row_type_cached(self):
+        columns = IPoint.to_columns(make_points(1))
+        self.assertIs(type(next(IPoint.from_columns(columns))), type(next(IPoint.from_columns(columns))))
+
+    def test_rows_provide_attribute_only_interfaces(self):
+        class IPair(Interface):
+            a: int
+            b: int
+
+        rows = list(IPair.from_columns({"a": [1, 2], "b": array.array("q", [3, 4])}))
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            self.assertTrue(IPair.provided_by(rows[0]))
+        self.assertEqual([(1, 3), (2, 4)], [(row.a, row.b) for row in rows])
+
+    def test_errors(self):
+        with self.assertRaises(InterfaceError):
+            IPoint.from_columns({"x": [1], "y": [2]})
+        with self.assertRaises(InterfaceError):
+            IPoint.from_columns({"x": [1], "y": [2], "name": []})
+        with self.assertRaises(InterfaceError):
+            IEmpty.from_columns({})
+        with self.assertRaises(InterfaceError):
+            pure_interface.Interface.from_columns({})
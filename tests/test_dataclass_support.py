@@ -2,13 +2,18 @@
 #  Copyright (c) 2024 Bentley Systems, Incorporated. All rights reserved.
 # --------------------------------------------------------------------------------------------
 
+import dataclasses
 import unittest
+import warnings
 from dataclasses import dataclass
+from unittest import mock
 
 from pure_interface import *
+from pure_interface import interface
 
 
 class IFoo(Interface):
+    __slots__ = ()
     a: int
     b: str
 
@@ -115,3 +120,119 @@ class TestDataClasses(unittest.TestCase):
             e: str
 
         self.assertEqual({"e": str}, Baz.__annotations__)
+
+
+class TestImplementationDataclass(unittest.TestCase):
+    def test_slots(self):
+        @implementation_dataclass
+        class SlotFoo(IFoo):
+            c: float = 12.0
+
+            def foo(self):
+                return "a={}, b={}, c={}".format(self.a, self.b, self.c)
+
+        f = SlotFoo(1, "two")
+        self.assertEqual(("a", "b", "c"), SlotFoo.__slots__)
+        self.assertFalse(hasattr(f, "__dict__"))
+        self.assertEqual("a=1, b=two, c=12.0", f.foo())
+        self.assertTrue(IFoo.provided_by(f))
+        self.assertEqual([IFoo], get_type_interfaces(SlotFoo))
+
+    def test_no_slots(self):
+        @implementation_dataclass(slots=False)
+        class DictFoo(IFoo):
+            def foo(self):
+                pass
+
+        self.assertTrue(hasattr(DictFoo(1, "two"), "__dict__"))
+
+    def test_frozen(self):
+        @implementation_dataclass(frozen=True, order=True)
+        class FrozenFoo(IFoo):
+            def foo(self):
+                pass
+
+        f = FrozenFoo(1, "two")
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            f.a = 2
+        self.assertLess(f, FrozenFoo(2, "two"))
+        self.assertEqual(hash(f), hash(FrozenFoo(1, "two")))
+
+    def test_attributes_not_checked(self):
+        @implementation_dataclass
+        class SlotFoo(IFoo):
+            def foo(self):
+                pass
+
+        self.assertEqual(frozenset(), SlotFoo._pi.abstractproperties)
+
+    def test_non_init_field_checked(self):
+        @implementation_dataclass(slots=False)
+        class NoInitFoo(IFoo):
+            b: str = dataclasses.field(init=False)
+
+            def foo(self):
+                pass
+
+        self.assertEqual(frozenset(["b"]), NoInitFoo._pi.abstractproperties)
+        with self.assertRaises(InterfaceError):
+            NoInitFoo(1)
+
+    def test_not_implementation(self):
+        class Plain:
+            pass
+
+        for cls in (IFoo, Plain):
+            with self.assertRaises(InterfaceError):
+                implementation_dataclass(cls)
+
+    def test_missing_method_warned_once(self):
+        clear_missing_method_warnings()
+        is_dev = get_is_development()
+        set_is_development(True)
+        try:
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter("always")
+
+                @implementation_dataclass
+                class PartialFoo(IFoo):
+                    pass
+
+        finally:
+            set_is_development(is_dev)
+        records = get_missing_method_warning_records()
+        self.assertEqual(1, len(caught))
+        self.assertEqual(1, len(records))
+        self.assertEqual("foo", records[0].method_name)
+        self.assertEqual(1, records[0].occurrences)
+        clear_missing_method_warnings()
+
+    def test_other_classes_warned_during_rebuild(self):
+        """only the re-created class is not warned about, not classes created elsewhere (e.g. by other threads)"""
+        real_dataclass = dataclasses.dataclass
+
+        def dataclass_creating_another_class(*args, **kwargs):
+            class OtherFoo(IFoo):
+                pass
+
+            return real_dataclass(*args, **kwargs)
+
+        clear_missing_method_warnings()
+        is_dev = get_is_development()
+        set_is_development(True)
+        try:
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter("always")
+                with mock.patch.object(dataclasses, "dataclass", dataclass_creating_another_class):
+
+                    @implementation_dataclass
+                    class PartialFoo(IFoo):
+                        pass
+
+        finally:
+            set_is_development(is_dev)
+        class_names = sorted(record.class_name.rsplit(".", 1)[-1] for record in get_missing_method_warning_records())
+        self.assertEqual(2, len(caught))
+        self.assertEqual(["OtherFoo", "PartialFoo"], class_names)
+        self.assertEqual([], list(interface.missing_method_warnings.rebuilding))
+        clear_missing_method_warnings()
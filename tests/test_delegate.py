@@ -2,8 +2,14 @@
 #  Copyright (c) 2024 Bentley Systems, Incorporated. All rights reserved.
 # --------------------------------------------------------------------------------------------
 
+import asyncio
 import dataclasses
+import gc
+import pickle
+import threading
+import time
 import unittest
+from concurrent import futures
 from unittest import mock
 
 import pure_interface
@@ -11,6 +17,8 @@ from pure_interface import Interface, delegation
 
 
 class ITalker(Interface):
+    __slots__ = ()
+
     def talk(self):
         pass
 
@@ -39,6 +47,7 @@ class Talker(ITalker):
 
 
 class IPoint(Interface):
+    __slots__ = ()
     x: int
     y: int
 
@@ -169,6 +178,59 @@ class ScaledPoint3(ScaledPoint, IPoint3):
     pi_attr_fallback = "_p"
 
 
+class CachingDelegate(delegation.Delegate, IPoint):
+    pi_attr_fallback = "impl"
+    pi_cache_methods = True
+
+    def __init__(self, impl):
+        self.impl = impl
+
+
+class CachingSubDelegate(CachingDelegate, ITalker):
+    pi_attr_delegates = {"talker": ITalker}
+
+    def __init__(self, impl, talker):
+        super().__init__(impl)
+        self.talker = talker
+
+
+class SlotsDelegate(delegation.Delegate, IPoint):
+    pi_attr_fallback = "impl"
+    pi_slots = True
+
+    def __init__(self, impl):
+        self.impl = impl
+
+
+class SlotsSubDelegate(SlotsDelegate, ITalker):
+    pi_attr_delegates = {"talker": ITalker}
+    pi_slots = True
+
+    def __init__(self, impl, talker):
+        super().__init__(impl)
+        self.talker = talker
+
+
+class LazyDelegate(delegation.Delegate, IPoint, ITalker):
+    pi_attr_fallback = "point"
+    pi_attr_delegates = {"talker": ITalker}
+    point = delegation.lazy_delegate(lambda self: self._make_point())
+    talker = delegation.lazy_delegate(lambda self: Talker())
+
+    def __init__(self, x, y):
+        self.created = 0
+        self.args = x, y
+
+    def _make_point(self):
+        self.created += 1
+        time.sleep(0.01)
+        return Point(*self.args)
+
+
+class ComposedSubclass(delegation.composed_type(IPoint, ITalker)):
+    pass
+
+
 class DelegateTest(unittest.TestCase):
     def test_descriptor_get_class(self):
         d = pure_interface.delegation._Delegated("foo.bar")
@@ -195,6 +257,22 @@ class DelegateTest(unittest.TestCase):
         self.assertIs(v, m.foo.bar.baz)
         self.assertIs(v, w)
 
+    def test_descriptor_set_single_level(self):
+        m = mock.Mock()
+        v = mock.Mock()
+        d = pure_interface.delegation._Delegated("foo.bar")
+
+        d.__set__(m, v)
+
+        self.assertIs(v, m.foo.bar)
+        self.assertIs(v, d.__get__(m, type(m)))
+
+    def test_descriptor_doc(self):
+        d = pure_interface.delegation._Delegated("foo.bar")
+
+        self.assertEqual("foo.bar", d.__doc__)
+        self.assertEqual("a.x", DDelegateList.x.__doc__)
+
     def test_fallback(self):
         d = DFallback(Talker())
 
@@ -304,6 +382,161 @@ class DelegateTest(unittest.TestCase):
         d = DSubFallback2(Talker())
         self.assertEqual("chat", d.chat())
 
+    def test_cache_methods(self):
+        p = Point(1, 2)
+        d = CachingDelegate(p)
+        self.assertNotIn("to_str", d.__dict__)
+        self.assertEqual("1, 2", d.to_str())
+        self.assertIn("to_str", d.__dict__)
+        self.assertIs(d.to_str.__self__, p)
+        self.assertNotIn("x", d.__dict__)  # attributes are not cached
+        d.x = 5
+        self.assertEqual(5, p.x)
+
+    def test_cache_methods_invalidated(self):
+        d = CachingDelegate(Point(1, 2))
+        d.to_str()
+        q = Point(3, 4)
+        d.impl = q
+        self.assertNotIn("to_str", d.__dict__)
+        self.assertEqual("3, 4", d.to_str())
+        self.assertIs(d.to_str.__self__, q)
+        del d.impl
+        self.assertNotIn("to_str", d.__dict__)
+
+    def test_cache_methods_subclass(self):
+        d = CachingSubDelegate(Point(1, 2), Talker())
+        self.assertEqual("talk", d.talk())
+        self.assertEqual("1, 2", d.to_str())
+        d.talker = Talker()
+        self.assertNotIn("talk", d.__dict__)
+        self.assertIn("to_str", d.__dict__)
+        self.assertEqual(CachingSubDelegate._pi_cached_methods, {"impl": ("to_str",), "talker": ("talk",)})
+
+    def test_cache_methods_own_setattr(self):
+        class SetAttrDelegate(delegation.Delegate, IPoint):
+            pi_attr_fallback = "impl"
+            pi_cache_methods = True
+
+            def __init__(self, impl):
+                self.impl = impl
+
+            def __setattr__(self, name, value):
+                self.__dict__["last_set"] = name
+                object.__setattr__(self, name, value)
+
+            def __delattr__(self, name):
+                self.__dict__["last_del"] = name
+                object.__delattr__(self, name)
+
+        d = SetAttrDelegate(Point(1, 2))
+        d.to_str()
+        d.impl = Point(3, 4)
+        self.assertEqual("impl", d.last_set)
+        self.assertEqual("3, 4", d.to_str())
+        del d.impl
+        self.assertEqual("impl", d.last_del)
+        self.assertNotIn("to_str", d.__dict__)
+
+    def test_cache_methods_subclass_own_setattr(self):
+        class SetAttrSubDelegate(CachingDelegate):
+            def __setattr__(self, name, value):
+                object.__setattr__(self, name, value)
+
+        d = SetAttrSubDelegate(Point(1, 2))
+        d.to_str()
+        d.impl = Point(3, 4)
+        self.assertEqual("3, 4", d.to_str())
+
+    def test_slots(self):
+        p = Point(1, 2)
+        d = SlotsDelegate(p)
+        self.assertEqual(("impl", "__weakref__"), SlotsDelegate.__slots__)
+        self.assertFalse(hasattr(d, "__dict__"))
+        self.assertEqual(1, d.x)
+        d.y = 5
+        self.assertEqual(5, p.y)
+        self.assertEqual("1, 5", d.to_str())
+        with self.assertRaises(AttributeError):
+            d.other = 1
+
+    def test_slots_subclass(self):
+        d = SlotsSubDelegate(Point(1, 2), Talker())
+        self.assertEqual(("talker",), SlotsSubDelegate.__slots__)
+        self.assertFalse(hasattr(d, "__dict__"))
+        self.assertEqual("talk", d.talk())
+        self.assertEqual(2, d.y)
+
+    def test_slots_requires_interface(self):
+        with self.assertRaises(pure_interface.InterfaceError):
+
+            class NoInterfaceDelegate(delegation.Delegate):
+                pi_attr_fallback = "impl"
+                pi_slots = True
+
+    def test_slots_and_cache_methods(self):
+        with self.assertRaises(pure_interface.InterfaceError):
+
+            class SlotsCachingDelegate(delegation.Delegate, IPoint):
+                pi_attr_fallback = "impl"
+                pi_slots = True
+                pi_cache_methods = True
+
+    def test_lazy_delegate(self):
+        d = LazyDelegate(1, 2)
+        self.assertNotIn("point", d.__dict__)
+        self.assertEqual("talk", d.talk())
+        self.assertNotIn("point", d.__dict__)
+        self.assertEqual(1, d.x)
+        self.assertEqual("1, 2", d.to_str())
+        self.assertEqual(1, d.created)
+        self.assertIs(d.point, d.__dict__["point"])
+
+    def test_lazy_delegate_assign(self):
+        d = LazyDelegate(1, 2)
+        d.point = Point(3, 4)
+        self.assertEqual(3, d.x)
+        del d.point
+        self.assertEqual(1, d.x)
+        self.assertEqual(1, d.created)
+
+    def test_lazy_delegate_threads(self):
+        d = LazyDelegate(1, 2)
+        barrier = threading.Barrier(8)
+        results = []
+
+        def access():
+            barrier.wait()
+            results.append(d.point)
+
+        threads = [threading.Thread(target=access) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(1, d.created)
+        self.assertEqual(8, len(results))
+        self.assertTrue(all(r is results[0] for r in results))
+
+    def test_lazy_delegate_retries_after_error(self):
+        calls = []
+
+        def factory(delegate):
+            calls.append(delegate)
+            if len(calls) == 1:
+                raise RuntimeError("not yet")
+            return Talker()
+
+        class Lazy(delegation.Delegate, ITalker):
+            pi_attr_fallback = "impl"
+            impl = delegation.lazy_delegate(factory)
+
+        d = Lazy()
+        with self.assertRaises(RuntimeError):
+            d.talk()
+        self.assertEqual("talk", d.talk())
+        self.assertEqual(2, len(calls))
+
     def test_delegate_provides_fails(self):
         with self.assertRaises(pure_interface.InterfaceError):
             DFallback.provided_by(ITalker)
@@ -326,6 +559,34 @@ class CompositionTest(unittest.TestCase):
         self.assertEqual(2, t.y)
         self.assertEqual("talk", t.talk())
 
+    def test_type_composition_slots(self):
+        a = Point(1, 2)
+        b = Talker()
+        T = delegation.composed_type(IPoint, ITalker, slots=True)
+        t = T(a, b)
+
+        self.assertIs(T, delegation.composed_type(IPoint, ITalker, slots=True))
+        self.assertIsNot(T, delegation.composed_type(IPoint, ITalker))
+        self.assertFalse(hasattr(t, "__dict__"))
+        self.assertEqual(1, t.x)
+        self.assertEqual("talk", t.talk())
+        self.assertTrue(T.provided_by(t))
+        with self.assertRaises(ValueError):
+            T(b, a)
+
+    def test_type_composition_pickle(self):
+        for kwargs in ({}, {"slots": True}, {"check": False}):
+            T = delegation.composed_type(IPoint, ITalker, **kwargs)
+            t = pickle.loads(pickle.dumps(T(Point(1, 2), Talker())))
+            self.assertIs(T, type(t))
+            self.assertEqual(2, t.y)
+            self.assertEqual("talk", t.talk())
+
+    def test_type_composition_subclass_pickle(self):
+        t = pickle.loads(pickle.dumps(ComposedSubclass(Point(1, 2), Talker())))
+        self.assertIs(ComposedSubclass, type(t))
+        self.assertEqual(1, t.x)
+
     def test_type_composition_checks(self):
         with self.assertRaises(ValueError):
             delegation.composed_type(IPoint)
@@ -344,6 +605,25 @@ class CompositionTest(unittest.TestCase):
         with self.assertRaises(ValueError):
             T(b, a)
 
+    def test_type_composition_init_arity(self):
+        T = delegation.composed_type(IPoint, ITalker)
+        with self.assertRaises(TypeError):
+            T(Point(1, 2))
+        with self.assertRaises(TypeError):
+            T(Point(1, 2), Talker(), Talker())
+
+    def test_type_composition_unchecked(self):
+        a = Point(1, 2)
+        b = Talker()
+        T = delegation.composed_type(IPoint, ITalker, check=False)
+        self.assertIsNot(T, delegation.composed_type(IPoint, ITalker))
+        self.assertIs(T, delegation.composed_type(IPoint, ITalker, check=False))
+        t = T(b, a)  # not checked
+        self.assertIs(t._a, b)
+        t = T(a, b)
+        self.assertEqual(1, t.x)
+        self.assertEqual("talk", t.talk())
+
     def test_type_composition_commutative(self):
         a = Point(1, 2)
         b = Talker()
@@ -355,6 +635,24 @@ class CompositionTest(unittest.TestCase):
         self.assertTrue(T.provided_by(s))
         self.assertTrue(S.provided_by(t))
 
+    def test_type_composition_provided_by_structural(self):
+        class PointTalker(IPoint, ITalker):
+            def __init__(self):
+                self.x = 1
+                self.y = 2
+
+            def to_str(self):
+                return ""
+
+            def talk(self):
+                return "talk"
+
+        T = delegation.composed_type(IPoint, ITalker)
+        self.assertTrue(T.provided_by(PointTalker()))
+        self.assertFalse(T.provided_by(Point()))
+        self.assertFalse(T.provided_by(object()))
+        self.assertEqual(frozenset([IPoint, ITalker]), T._pi.type_interface_set)
+
     def test_type_composition_chain(self):
         a = Point(1, 2)
         b = Talker()
@@ -388,7 +686,99 @@ class CompositionTest(unittest.TestCase):
         with self.assertRaises(ValueError):
             delegation.composed_type(str, int)
 
-    def test_too_many_interfaces(self):
+    def test_many_interfaces(self):
         with mock.patch("pure_interface.delegation._letters", "a"):
-            with self.assertRaises(ValueError):
-                delegation.composed_type(ITalker, IPoint)
+            T = delegation.composed_type(ITalker, IPoint)
+        t = T(Talker(), Point(1, 2))
+        self.assertEqual("talk", t.talk())
+        self.assertEqual(1, t._i1.x)
+        self.assertEqual(2, t.y)
+
+    def test_more_than_52_interfaces(self):
+        interfaces = [type(Interface)(f"IMany{i}", (Interface,), {f"m{i}": lambda self: None}) for i in range(60)]
+        impls = [
+            type(interface)(f"Many{i}", (interface,), {f"m{i}": lambda self, i=i: i})
+            for i, interface in enumerate(interfaces)
+        ]
+        T = delegation.composed_type(*interfaces)
+        t = T(*[impl() for impl in impls])
+        self.assertEqual(0, t.m0())
+        self.assertEqual(59, t.m59())
+
+    def test_composed_types_not_retained(self):
+        class ITemp(Interface):
+            def temp(self):
+                pass
+
+        T = delegation.composed_type(ITalker, ITemp)
+        key = ((ITalker, ITemp), False, True)
+        self.assertIs(T, delegation._composed_types_map[key])
+        del T
+        gc.collect()
+        self.assertNotIn(key, delegation._composed_types_map)
+
+
+class IListener(Interface):
+    count: int
+
+    def notify(self, event):
+        pass
+
+    async def notify_async(self, event):
+        pass
+
+
+class Listener(IListener):
+    def __init__(self, count):
+        self.count = count
+        self.thread = None
+
+    def notify(self, event):
+        self.thread = threading.get_ident()
+        return event * self.count
+
+    async def notify_async(self, event):
+        await asyncio.sleep(0)
+        return event + self.count
+
+
+class BroadcastTest(unittest.TestCase):
+    def test_broadcast(self):
+        B = delegation.broadcast_type(IListener)
+        b = B([Listener(1), Listener(2)])
+        self.assertIs(B, delegation.broadcast_type(IListener))
+        self.assertIsInstance(b, IListener)
+        self.assertEqual([3, 6], b.notify(3))
+        self.assertEqual([1, 2], b.count)
+        self.assertEqual([], B([]).notify(1))
+
+    def test_broadcast_set_attribute(self):
+        listeners = [Listener(1), Listener(2)]
+        b = delegation.broadcast_type(IListener)(listeners)
+        b.count = 5
+        self.assertEqual([5, 5], [listener.count for listener in listeners])
+
+    def test_broadcast_reduce(self):
+        B = delegation.broadcast_type(IListener, reduce=sum)
+        self.assertIsNot(B, delegation.broadcast_type(IListener))
+        b = B([Listener(1), Listener(2)])
+        self.assertEqual(9, b.notify(3))
+        self.assertEqual(3, b.count)
+
+    def test_broadcast_async(self):
+        b = delegation.broadcast_type(IListener)([Listener(1), Listener(2)])
+        self.assertEqual([4, 5], asyncio.run(b.notify_async(3)))
+
+    def test_broadcast_executor(self):
+        listeners = [Listener(1), Listener(2)]
+        with futures.ThreadPoolExecutor(2) as executor:
+            b = delegation.broadcast_type(IListener)(listeners, executor=executor)
+            self.assertEqual([3, 6], b.notify(3))
+        self.assertNotIn(threading.get_ident(), [listener.thread for listener in listeners])
+
+    def test_broadcast_checks(self):
+        B = delegation.broadcast_type(IListener)
+        with self.assertRaises(ValueError):
+            B([Listener(1), Talker()])
+        with self.assertRaises(ValueError):
+            delegation.broadcast_type(Listener)
@@ -0,0 +1,261 @@
+# --------------------------------------------------------------------------------------------
+#  Copyright (c) 2024 Bentley Systems, Incorporated. All rights reserved.
+# --------------------------------------------------------------------------------------------
+
+import abc
+import unittest
+import warnings
+
+import pure_interface
+from pure_interface import Interface, interface_dispatch, interface_multimethod
+
+
+class IShape(Interface):
+    def area(self):
+        pass
+
+
+class ICircle(IShape, Interface):
+    radius: float
+
+
+class IPolygon(IShape, Interface):
+    sides: int
+
+
+class Square(IShape):
+    def area(self):
+        return 4
+
+
+class Circle(ICircle):
+    def __init__(self):
+        self.radius = 1
+
+    def area(self):
+        return 3
+
+
+class CirclePolygon(ICircle, IPolygon):
+    def __init__(self):
+        self.radius = 1
+        self.sides = 0
+
+    def area(self):
+        return 3
+
+
+class StructuralShape:
+    def area(self):
+        return 9
+
+
+class Blob:
+    pass
+
+
+class Unrelated:
+    pass
+
+
+pure_interface.register_adapter(lambda obj: Square(), Blob, IShape)
+
+
+def make_describe(**kwargs):
+    @interface_dispatch(**kwargs)
+    def describe(obj, suffix=""):
+        return "unknown" + suffix
+
+    @describe.register
+    def _(shape: IShape, suffix=""):
+        return f"shape {shape.area()}{suffix}"
+
+    @describe.register(ICircle)
+    def _(circle, suffix=""):
+        return "circle" + suffix
+
+    return describe
+
+
+class DispatchTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pure_interface.set_is_development(True)
+
+    def test_nominal(self):
+        describe = make_describe()
+        self.assertEqual("shape 4", describe(Square()))
+        self.assertEqual("circle", describe(Circle()))
+        self.assertEqual("circle!", describe(Circle(), suffix="!"))
+        self.assertEqual("unknown", describe(1))
+        self.assertEqual("unknown", describe(StructuralShape()))
+        self.assertEqual("unknown", describe(Blob()))
+
+    def test_function_attributes(self):
+        describe = make_describe()
+        self.assertEqual("describe", describe.__name__)
+        self.assertEqual({object, IShape, ICircle}, set(describe.registry))
+        self.assertIs(describe.registry[ICircle], describe.dispatch(Circle))
+        with self.assertRaises(TypeError):
+            describe()
+
+    def test_register_errors(self):
+        describe = make_describe()
+        with self.assertRaises(TypeError):
+            describe.register(lambda x: x)
+        with self.assertRaises(TypeError):
+            describe.register("IShape", lambda x: x)
+
+    def test_most_specific(self):
+        describe = make_describe()
+        describe.register(IPolygon, lambda obj: "polygon")
+        self.assertEqual("circle", describe(CirclePolygon()))  # ICircle is first in the MRO
+        describe.register(CirclePolygon, lambda obj: "circle polygon")
+        self.assertEqual("circle polygon", describe(CirclePolygon()))
+
+    def test_allow_implicit(self):
+        describe = make_describe(allow_implicit=True)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            self.assertEqual("shape 9", describe(StructuralShape()))
+        self.assertEqual("unknown", describe(Blob()))
+        self.assertEqual("unknown", describe(1))
+
+    def test_allow_adapt(self):
+        describe = make_describe(allow_adapt=True)
+        self.assertEqual("shape 4", describe(Blob()))
+        self.assertEqual("shape 4!", describe(Blob(), "!"))
+        self.assertEqual("unknown", describe(StructuralShape()))
+
+    def test_cache_invalidated_by_adapter(self):
+        describe = make_describe(allow_adapt=True)
+        self.assertEqual("unknown", describe(Unrelated()))
+        pure_interface.register_adapter(lambda obj: Circle(), Unrelated, ICircle)
+        self.assertEqual("circle", describe(Unrelated()))
+
+    def test_cache_invalidated_by_registration(self):
+        class Registered:
+            def area(self):
+                return 5
+
+        describe = make_describe()
+        self.assertEqual("unknown", describe(Registered()))
+        IShape.register(Registered)
+        self.assertEqual("shape 5", describe(Registered()))
+        describe.register(Registered, lambda obj: "registered")
+        self.assertEqual("registered", describe(Registered()))
+
+    def test_abc_registration(self):
+        class IAbc(abc.ABC):
+            pass
+
+        class Thing:
+            pass
+
+        describe = make_describe()
+        describe.register(IAbc, lambda obj: "abc")
+        self.assertEqual("unknown", describe(Thing()))
+        IAbc.register(Thing)
+        self.assertEqual("abc", describe(Thing()))
+
+    def test_ambiguous(self):
+        class ISized(Interface):
+            def size(self):
+                pass
+
+        class Both:
+            def area(self):
+                return 1
+
+            def size(self):
+                return 2
+
+        describe = make_describe(allow_implicit=True)
+        describe.register(ISized, lambda obj: "sized")
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            with self.assertRaises(RuntimeError):
+                describe(Both())
+
+
+def make_combine():
+    @interface_multimethod
+    def combine(a, b):
+        return "default"
+
+    @combine.register
+    def _(a: IShape, b: IShape):
+        return "shapes"
+
+    @combine.register
+    def _(a: ICircle, b: IShape):
+        return "circle shape"
+
+    @combine.register(IShape, ICircle)
+    def _(a, b):
+        return "shape circle"
+
+    return combine
+
+
+class MultimethodTest(unittest.TestCase):
+    def test_dispatch(self):
+        combine = make_combine()
+        self.assertEqual("shapes", combine(Square(), Square()))
+        self.assertEqual("circle shape", combine(Circle(), Square()))
+        self.assertEqual("shape circle", combine(Square(), Circle()))
+        self.assertEqual("default", combine(1, Square()))
+        self.assertEqual("default", combine(1, 2))
+        self.assertEqual("combine", combine.__name__)
+
+    def test_arity(self):
+        combine = make_combine()
+        combine.register(IShape, lambda a: "one")
+        combine.register(IShape, IShape, IShape, lambda a, b, c: "three")
+        self.assertEqual("one", combine(Square()))
+        self.assertEqual("three", combine(Square(), Square(), Square()))
+        with self.assertRaises(TypeError):
+            combine()  # default called with too few arguments
+
+    def test_unannotated_and_optional_parameters(self):
+        @interface_multimethod
+        def combine(a, b):
+            return "default"
+
+        @combine.register
+        def _(a: ICircle, b, c=None):
+            return "circle any"
+
+        self.assertEqual("circle any", combine(Circle(), 1))
+        self.assertEqual("default", combine(Square(), 1))
+
+    def test_ambiguous(self):
+        combine = make_combine()
+        with self.assertRaises(RuntimeError):
+            combine(Circle(), Circle())
+        combine.register(ICircle, ICircle, lambda a, b: "circles")
+        self.assertEqual("circles", combine(Circle(), Circle()))
+
+    def test_mro_order(self):
+        combine = make_combine()
+        combine.register(IPolygon, IShape, lambda a, b: "polygon shape")
+        self.assertEqual("circle shape", combine(CirclePolygon(), Square()))  # ICircle is first in the MRO
+
+    def test_register_errors(self):
+        combine = make_combine()
+        with self.assertRaises(TypeError):
+            combine.register(lambda a, b: None)
+        with self.assertRaises(TypeError):
+            combine.register(IShape, "ICircle")(lambda a, b: None)
+
+    def test_cache_invalidated_by_registration(self):
+        class Registered:
+            def area(self):
+                return 5
+
+        combine = make_combine()
+        self.assertEqual("default", combine(Registered(), Square()))
+        IShape.register(Registered)
+        self.assertEqual("shapes", combine(Registered(), Square()))
+        combine.register(Registered, IShape, lambda a, b: "registered")
+        self.assertEqual("registered", combine(Registered(), Square()))
@@ -365,3 +365,69 @@ class TestDisableFunctionSignatureChecks(unittest.TestCase):
             a = Animal()
         except pure_interface.InterfaceError as exc:
             self.fail("Unexpected error {}".format(exc))
+
+
+class TestStripSignatures(unittest.TestCase):
+    def tearDown(self):
+        pure_interface.set_strip_signatures(None)
+        pure_interface.set_is_development(True)
+
+    def test_concrete_signatures_stripped_in_production(self):
+        pure_interface.set_is_development(False)
+
+        class Animal(IAnimal):
+            def speak(self, volume):
+                pass
+
+        self.assertIsNone(Animal._pi.interface_method_signatures)
+        self.assertIsNotNone(IAnimal._pi.interface_method_signatures)
+        self.assertEqual(Animal._pi.interface_method_names, {"speak"})
+
+    def test_signatures_kept_in_development(self):
+        pure_interface.set_is_development(True)
+
+        class Animal(IAnimal):
+            def speak(self, volume):
+                pass
+
+        self.assertIsNotNone(Animal._pi.interface_method_signatures)
+
+    def test_stripped_interface_checked_lazily(self):
+        pure_interface.set_strip_signatures("all")
+
+        class IStripped(pure_interface.Interface):
+            def speak(self, volume):
+                pass
+
+            @staticmethod
+            def static(a):
+                pass
+
+        class IStrippedSub(IStripped, pure_interface.Interface):
+            def shout(self, volume):
+                pass
+
+        self.assertIsNone(IStripped._pi.interface_method_signatures)
+        self.assertIsNone(IStrippedSub._pi.interface_method_signatures)
+        pure_interface.set_strip_signatures(None)
+        pure_interface.set_is_development(True)
+        with self.assertRaises(pure_interface.InterfaceError):
+
+            class Animal(IStrippedSub):
+                def speak(self, loudness):
+                    pass
+
+        with self.assertRaises(pure_interface.InterfaceError):
+
+            class Static(IStrippedSub):
+                @staticmethod
+                def static(b):
+                    pass
+
+        self.assertEqual(set(IStrippedSub._pi.interface_method_signatures), {"speak", "shout", "static"})
+
+    def test_strip_signatures_values(self):
+        with self.assertRaises(ValueError):
+            pure_interface.set_strip_signatures("sometimes")
+        pure_interface.set_strip_signatures("concrete")
+        self.assertEqual(pure_interface.get_strip_signatures(), "concrete")
@@ -2,12 +2,16 @@
 #  Copyright (c) 2024 Bentley Systems, Incorporated. All rights reserved.
 # --------------------------------------------------------------------------------------------
 
+import pickle
 import unittest
-from typing import Iterable, List, TypeVar
+import warnings
+from typing import Generic, Iterable, List, Optional, TypeVar
 
 import pure_interface
+from pure_interface import interface
 
 T = TypeVar("T")
+U = TypeVar("U")
 
 
 class IMyInterface(pure_interface.Interface, Iterable[str]):
@@ -35,6 +39,44 @@ class GenericImpl(List[T], IMyGenericInterface[T]):
         return T("foo")
 
 
+class IBox(pure_interface.Interface, Generic[T]):
+    def get(self) -> T:
+        pass
+
+
+class IntBox(IBox[int]):
+    def get(self):
+        return 1
+
+
+class StrBox(IBox[str]):
+    def get(self):
+        return "one"
+
+
+class AnyBox(IBox[T]):
+    def get(self):
+        return None
+
+
+class StructuralBox:
+    def get(self):
+        return 2.0
+
+
+class Number:
+    pass
+
+
+class Text:
+    pass
+
+
+pure_interface.register_adapter(lambda obj: IntBox(), Number, IBox[int])
+pure_interface.register_adapter(lambda obj: StrBox(), Text, IBox[str])
+pure_interface.register_adapter(lambda obj: IntBox(), Text, IBox)
+
+
 class TestGenericSupport(unittest.TestCase):
     def test_generics_are_interfaces(self):
         self.assertTrue(pure_interface.type_is_interface(IMyInterface))
@@ -47,3 +89,106 @@ class TestGenericSupport(unittest.TestCase):
         imp.append("hello")
         imp = GenericImpl[int]()
         imp.append(34)
+
+    def test_subscripted_interfaces_are_equal(self):
+        self.assertEqual(IBox[int], IBox[int])
+        self.assertEqual(hash(IBox[int]), hash(IBox[int]))
+        self.assertNotEqual(IBox[int], IBox[str])
+        self.assertEqual(IBox[int], IBox[T][int])
+        self.assertIsInstance(IBox[T][int], interface._GenericInterfaceAlias)
+
+    def test_subscripted_concrete_class(self):
+        self.assertNotIsInstance(AnyBox[int], interface._GenericInterfaceAlias)
+
+    def test_not_subscriptable(self):
+        class IPlain(pure_interface.Interface):
+            pass
+
+        with self.assertRaises(TypeError):
+            IPlain[int]
+
+    def test_provided_by(self):
+        self.assertTrue(IBox[int].provided_by(IntBox()))
+        self.assertFalse(IBox[str].provided_by(IntBox()))
+        self.assertTrue(IBox[str].provided_by(AnyBox()))
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            self.assertTrue(IBox[float].provided_by(StructuralBox()))
+        self.assertTrue(IBox.provided_by(IntBox()))
+
+    def test_provided_by_through_generic_sub_class(self):
+        class IntSub(AnyBox[int]):
+            pass
+
+        class Pair(IBox[List[T]], Generic[U, T]):
+            def get(self):
+                return []
+
+        class StrIntPair(Pair[str, int]):
+            pass
+
+        self.assertTrue(IBox[int].provided_by(IntSub()))
+        self.assertFalse(IBox[str].provided_by(IntSub()))
+        self.assertTrue(IBox[List[int]].provided_by(StrIntPair()))
+        self.assertFalse(IBox[List[str]].provided_by(StrIntPair()))
+        self.assertTrue(IBox[List[float]].provided_by(Pair()))
+
+    def test_generic_before_interface(self):
+        class IGenericFirst(Generic[T], pure_interface.Interface):
+            def get(self) -> T:
+                pass
+
+        class IntGenericFirst(IGenericFirst[int]):
+            def get(self):
+                return 1
+
+        self.assertIsInstance(IGenericFirst[int], interface._GenericInterfaceAlias)
+        self.assertTrue(IGenericFirst[int].provided_by(IntGenericFirst()))
+        self.assertFalse(IGenericFirst[str].provided_by(IntGenericFirst()))
+
+    def test_adapt(self):
+        pure_interface.set_is_development(True)
+        box = IntBox()
+        self.assertIs(box, IBox[int].adapt(box, interface_only=False))
+        self.assertIsInstance(IBox[int].adapt(Number(), interface_only=False), IntBox)
+        self.assertIsInstance(IBox[str].adapt(Text(), interface_only=False), StrBox)
+        self.assertEqual(1, IBox[int].adapt(Text()).get())  # falls back to the IBox adapter
+        self.assertIsNone(IBox[str].adapt_or_none(Number()))
+        with self.assertRaises(pure_interface.AdaptionError):
+            IBox[str].adapt(box)
+        self.assertFalse(IBox[float].can_adapt(Text()))
+        self.assertEqual([box], list(IBox[int].filter_adapt([box, StrBox()], interface_only=False)))
+        self.assertIsNone(IBox[int].optional_adapt(None))
+        self.assertIsNone(IBox.adapt_or_none(Number()))  # only adapters for IBox itself are used
+
+    def test_adapt_interface_only(self):
+        pure_interface.set_is_development(True)
+        wrapper = IBox[int].adapt(Number(), interface_only=True)
+        self.assertIs(IBox._pi.impl_wrapper_type, type(wrapper))
+        self.assertEqual(1, pickle.loads(pickle.dumps(wrapper)).get())
+
+    def test_lookups_are_cached(self):
+        IBox[int].adapt(Number())
+        self.assertIn(IBox[int], interface._adapter_cache[Number])
+        IBox[int].provided_by(IntBox())
+        self.assertTrue(interface._generic_provided_cache[IntBox][IBox[int]])
+
+    def test_register_adapter(self):
+        class Other:
+            pass
+
+        pure_interface.register_adapter(lambda obj: StrBox(), Other, IBox[str])
+        self.assertEqual("one", IBox[str].adapt(Other()).get())
+        with self.assertRaises(pure_interface.AdaptionError):
+            pure_interface.register_adapter(lambda obj: StrBox(), Other, IBox[str])
+        with self.assertRaises(pure_interface.AdaptionError):
+            pure_interface.register_adapter(lambda obj: StrBox(), Other, List[str])
+
+    def test_adapt_args(self):
+        @pure_interface.adapt_args
+        def func(box: IBox[int], other: Optional[IBox[str]] = None):
+            return box, other
+
+        box, other = func(Number(), Text())
+        self.assertEqual(1, box.get())
+        self.assertEqual("one", other.get())
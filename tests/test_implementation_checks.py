@@ -5,6 +5,7 @@
 import abc
 import unittest
 import warnings
+import weakref
 from unittest import mock
 
 from pure_interface import *
@@ -90,6 +91,13 @@ class ISimple(Interface):
         pass
 
 
+class ISlotted(Interface):
+    __slots__ = ()
+
+    def foo(self):
+        pass
+
+
 class ICrossImplementation(Interface):
     """interface to test class attributes implemented as properties and vice versa"""
 
@@ -176,6 +184,41 @@ class TestImplementationChecks(unittest.TestCase):
         with self.assertRaises(InterfaceError):
             PIEmptyABC()
 
+    def test_abc_analysis_cached(self):
+        class IABC(metaclass=abc.ABCMeta):
+            @abc.abstractmethod
+            def foo(self):
+                pass
+
+        class IFirst(IABC, Interface):
+            pass
+
+        self.assertTrue(interface._abc_is_interface_cache[IABC])
+        self.assertIn(IABC, interface._abc_props_and_funcs_cache)
+        with (
+            mock.patch.object(interface, "_is_empty_function") as is_empty,
+            mock.patch.object(interface, "signature") as sig,
+        ):
+
+            class ISecond(IABC, Interface):
+                pass
+
+        is_empty.assert_not_called()
+        sig.assert_not_called()
+        self.assertIn("foo", ISecond._pi.interface_method_names)
+
+    def test_abc_analysis_not_cached_when_frozen(self):
+        class B(metaclass=abc.ABCMeta):
+            def foo(self):
+                return 1
+
+        freeze_registries()
+        try:
+            self.assertFalse(interface._type_is_interface(B))
+        finally:
+            unfreeze_registries()
+        self.assertNotIn(B, interface._abc_is_interface_cache)
+
     def test_can_use_type_methods(self):
         try:
 
@@ -226,7 +269,7 @@ class TestImplementationChecks(unittest.TestCase):
     def test_missing_methods_warning(self):
         # assemble
         set_is_development(True)
-        interface.missing_method_warnings = []
+        clear_missing_method_warnings()
         # act
 
         with warnings.catch_warnings():
@@ -236,11 +279,59 @@ class TestImplementationChecks(unittest.TestCase):
                 pass
 
         # assert
-        self.assertEqual(len(interface.missing_method_warnings), 1)
-        msg = interface.missing_method_warnings[0]
+        self.assertEqual(len(get_missing_method_warnings()), 1)
+        msg = get_missing_method_warnings()[0]
         self.assertIn("SimpleSimon", msg)
         self.assertIn("foo", msg)
 
+    def test_missing_methods_warnings_deduplicated(self):
+        set_is_development(True)
+        clear_missing_method_warnings()
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            for i in range(3):
+
+                class SimpleSimon(ISimple):
+                    pass
+
+        records = get_missing_method_warning_records()
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0].class_name, __name__ + "." + SimpleSimon.__qualname__)
+        self.assertEqual(records[0].method_name, "foo")
+        self.assertEqual(records[0].occurrences, 3)
+
+    def test_missing_methods_warnings_limit(self):
+        set_is_development(True)
+        clear_missing_method_warnings()
+        set_missing_method_warnings_limit(2)
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                for name in "ABC":
+                    type(name, (ISimple,), {})
+        finally:
+            set_missing_method_warnings_limit(1000)
+
+        records = get_missing_method_warning_records()
+        self.assertEqual([r.class_name.split(".")[-1] for r in records], ["B", "C"])
+
+    def test_missing_methods_warn_once(self):
+        set_is_development(True)
+        clear_missing_method_warnings()
+        set_warn_missing_methods_once(True)
+        warn = mock.MagicMock()
+        try:
+            with mock.patch("warnings.warn", warn):
+                for i in range(3):
+
+                    class SimpleSimon(ISimple):
+                        pass
+
+        finally:
+            set_warn_missing_methods_once(False)
+        self.assertEqual(warn.call_count, 1)
+        self.assertEqual(get_missing_method_warning_records()[0].occurrences, 3)
+
     def test_is_development_flag_stops_warnings(self):
         interface.is_development = False
 
@@ -284,6 +375,28 @@ class TestImplementationChecks(unittest.TestCase):
 
         self.assertEqual(frozenset([]), Test._pi.abstractproperties)
 
+    def test_pi_attributes_shared_with_base(self):
+        class Simple(ISimple):
+            def foo(self):
+                pass
+
+        self.assertIs(Simple._pi.interface_method_signatures, ISimple._pi.interface_method_signatures)
+        self.assertIs(Simple._pi.interface_method_names, ISimple._pi.interface_method_names)
+        self.assertIs(Simple._pi.interface_attribute_names, ISimple._pi.interface_attribute_names)
+        self.assertIs(Simple._pi.interface_names, ISimple._pi.interface_names)
+        self.assertFalse(hasattr(Simple._pi, "__dict__"))
+
+    def test_pi_attributes_containers_are_lazy(self):
+        class Simple(ISimple):
+            def foo(self):
+                pass
+
+        self.assertIsNone(Simple._pi._adapters)
+        self.assertIsNone(Simple._pi._registered_types)
+        self.assertIsNone(Simple._pi._structural_subclasses)
+        self.assertEqual(len(Simple._pi.adapters), 0)
+        self.assertIsNotNone(Simple._pi._adapters)
+
     def test_set_development(self):
         for value in True, False:
             set_is_development(value)
@@ -636,3 +749,59 @@ class TestAnnoationChecks(unittest.TestCase):
             pass
 
         self.assertEqual(saved_kwargs, dict(x=1, y=2, z=3))
+
+
+class TestSlots(unittest.TestCase):
+    def test_interfaces_have_no_slots(self):
+        self.assertNotIn("__slots__", ISimple.__dict__)
+        self.assertEqual((), ISlotted.__dict__["__slots__"])
+        self.assertEqual((), Interface.__dict__["__slots__"])
+
+    def test_implementation_without_slots(self):
+        class Simple(ISimple):
+            def foo(self):
+                pass
+
+        s = Simple()
+        s.other = 2
+        self.assertEqual({"other": 2}, s.__dict__)
+        self.assertIs(s, weakref.ref(s)())
+
+    def test_implementation_with_slots(self):
+        class SlotSimple(ISimple):
+            __slots__ = ("x",)
+
+            def foo(self):
+                pass
+
+        s = SlotSimple()
+        s.x = 1
+        s.other = 2
+        self.assertEqual({"other": 2}, s.__dict__)
+        self.assertIs(s, weakref.ref(s)())
+
+    def test_slotted_interface(self):
+        class SlotSimple(ISlotted):
+            __slots__ = ("x",)
+
+            def foo(self):
+                pass
+
+        s = SlotSimple()
+        s.x = 1
+        self.assertFalse(hasattr(s, "__dict__"))
+        with self.assertRaises(AttributeError):
+            s.other = 2
+        with self.assertRaises(TypeError):
+            weakref.ref(s)
+
+    def test_implementation_with_weakref_slot(self):
+        class WeakSlotSimple(ISlotted):
+            __slots__ = ("x", "__weakref__")
+
+            def foo(self):
+                pass
+
+        s = WeakSlotSimple()
+        self.assertIs(s, weakref.ref(s)())
+        self.assertFalse(hasattr(s, "__dict__"))
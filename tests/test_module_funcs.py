@@ -5,6 +5,7 @@
 import unittest
 
 from pure_interface import *
+from pure_interface import interface
 
 
 class IAnimal(Interface):
@@ -93,3 +94,17 @@ class TestModuleFunctions(unittest.TestCase):
         self.assertEqual(get_type_interfaces(Car), [])
         self.assertEqual(get_type_interfaces(len), [])
         self.assertEqual(get_type_interfaces("hello"), [])
+
+    def test_interface_names_are_cached(self):
+        self.assertIs(get_interface_names(ILandAnimal), get_interface_names(ILandAnimal))
+        self.assertIs(get_interface_attribute_names(ILandAnimal), get_interface_attribute_names(ILandAnimal))
+        self.assertIs(get_interface_method_names(ILandAnimal), get_interface_method_names(ILandAnimal))
+
+    def test_get_type_interfaces_is_cached(self):
+        get_type_interfaces(Dog)
+        self.assertEqual(Dog._pi.type_interfaces, (ILandAnimal, IAnimal))
+        interfaces = get_type_interfaces(Dog)
+        interfaces.append(Car)  # result is a copy, cache is unaffected
+        self.assertEqual(get_type_interfaces(Dog), [ILandAnimal, IAnimal])
+        get_type_interfaces(Car)
+        self.assertEqual(interface._type_interfaces_cache[Car], ())
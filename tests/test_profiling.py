@@ -0,0 +1,87 @@
+# --------------------------------------------------------------------------------------------
+#  Copyright (c) 2024 Bentley Systems, Incorporated. All rights reserved.
+# --------------------------------------------------------------------------------------------
+
+import os
+import pstats
+import subprocess
+import sys
+import tempfile
+import unittest
+
+import pure_interface
+from pure_interface import Interface, _profiling
+
+
+class IProfiled(Interface):
+    def foo(self):
+        pass
+
+
+class ProfileTest(unittest.TestCase):
+    def setUp(self):
+        pure_interface.clear_profile()
+        pure_interface.enable_profiling()
+
+    def tearDown(self):
+        pure_interface.disable_profiling()
+        pure_interface.clear_profile()
+
+    def test_records_phases(self):
+        class IFoo(Interface):
+            def foo(self):
+                pass
+
+        class Foo(IFoo):
+            def foo(self):
+                pass
+
+        interface_record = _profiling._records[(__name__, IFoo.__qualname__)]
+        concrete_record = _profiling._records[(__name__, Foo.__qualname__)]
+        self.assertEqual(interface_record.count, 1)
+        self.assertIn("abstract", interface_record.phases)
+        self.assertIn("empty", interface_record.phases)
+        self.assertNotIn("properties", interface_record.phases)
+        self.assertIn("properties", concrete_record.phases)
+        self.assertEqual(set(concrete_record.phases).difference(_profiling.PHASES), set())
+
+    def test_disabled(self):
+        pure_interface.disable_profiling()
+
+        class Foo(IProfiled):
+            def foo(self):
+                pass
+
+        self.assertEqual(_profiling._records, {})
+
+    def test_report(self):
+        for i in range(2):
+
+            class Foo(IProfiled):
+                def foo(self):
+                    pass
+
+        report = pure_interface.get_profile_report()
+        self.assertIn("1 classes", report)
+        line = report.splitlines()[-1]
+        self.assertTrue(line.endswith(Foo.__qualname__))
+        self.assertEqual(line.split()[-2], "2")
+
+    def test_dump_stats(self):
+        class Foo(IProfiled):
+            def foo(self):
+                pass
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filename = os.path.join(tmp_dir, "classes.prof")
+            pure_interface.dump_profile_stats(filename)
+            stats = pstats.Stats(filename)
+        self.assertIn((__name__, 0, Foo.__qualname__), stats.stats)
+        self.assertIn((__name__, 0, Foo.__qualname__ + " [type]"), stats.stats)
+
+    def test_environment_variable(self):
+        code = "import pure_interface\nclass IBar(pure_interface.Interface):\n    x: int\n"
+        env = dict(os.environ, PURE_INTERFACE_PROFILE="1")
+        result = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True)
+        self.assertIn("pure_interface class creation profile", result.stderr)
+        self.assertIn("__main__.IBar", result.stderr)
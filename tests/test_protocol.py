@@ -0,0 +1,177 @@
+# --------------------------------------------------------------------------------------------
+#  Copyright (c) 2024 Bentley Systems, Incorporated. All rights reserved.
+# --------------------------------------------------------------------------------------------
+
+import inspect
+import unittest
+import warnings
+from typing import Protocol, SupportsInt, TypeVar, runtime_checkable
+
+import pure_interface
+from pure_interface import Interface, from_protocol, interface
+
+T = TypeVar("T")
+
+
+@runtime_checkable
+class Speaker(Protocol):
+    """Speaks"""
+
+    volume: int
+
+    def speak(self, text: str) -> str: ...
+
+    @property
+    def name(self) -> str: ...
+
+    @staticmethod
+    def languages() -> list: ...
+
+
+class Shouter(Speaker, Protocol):
+    def shout(self, text: str) -> str: ...
+
+
+class Box(Protocol[T]):
+    def get(self) -> T: ...
+
+
+class IntBox(Box[int]):
+    def get(self) -> int:
+        return 1
+
+
+class Integral(SupportsInt):
+    def __int__(self) -> int:
+        return 1
+
+
+class StructuralSpeaker:
+    volume = 5
+    name = "structural"
+
+    def speak(self, text: str) -> str:
+        return text
+
+    @staticmethod
+    def languages() -> list:
+        return ["en"]
+
+
+class NominalSpeaker(Speaker):
+    volume = 5
+    name = "nominal"
+
+    def speak(self, text: str) -> str:
+        return text.upper()
+
+    @staticmethod
+    def languages() -> list:
+        return ["en"]
+
+
+class Mute:
+    pass
+
+
+class ProtocolTest(unittest.TestCase):
+    def test_interface(self):
+        ISpeaker = from_protocol(Speaker)
+        self.assertTrue(pure_interface.type_is_interface(ISpeaker))
+        self.assertEqual("Speaker", ISpeaker.__name__)
+        self.assertEqual(__name__, ISpeaker.__module__)
+        self.assertEqual("Speaks", ISpeaker.__doc__)
+        self.assertEqual(frozenset(("speak", "languages")), pure_interface.get_interface_method_names(ISpeaker))
+        self.assertEqual(frozenset(("volume", "name")), pure_interface.get_interface_attribute_names(ISpeaker))
+        self.assertEqual({"volume": int, "name": str}, ISpeaker.__annotations__)
+
+    def test_signatures(self):
+        ISpeaker = from_protocol(Speaker)
+        signatures = ISpeaker._pi.interface_method_signatures
+        self.assertEqual(inspect.signature(Speaker.speak), signatures["speak"])
+        self.assertEqual(inspect.signature(Speaker.languages), signatures["languages"])
+        self.assertEqual(inspect.signature(Speaker.speak), inspect.signature(ISpeaker.speak))
+
+    def test_cached(self):
+        self.assertIs(from_protocol(Speaker), from_protocol(Speaker))
+
+    def test_inherited_protocol(self):
+        IShouter = from_protocol(Shouter)
+        expected = frozenset(("speak", "languages", "shout"))
+        self.assertEqual(expected, pure_interface.get_interface_method_names(IShouter))
+        self.assertEqual(frozenset(("volume", "name")), pure_interface.get_interface_attribute_names(IShouter))
+
+    def test_generic_protocol(self):
+        IBox = from_protocol(Box)
+        self.assertEqual((T,), IBox.__parameters__)
+        self.assertIsInstance(IBox[int], interface._GenericInterfaceAlias)
+
+    def test_provided_by(self):
+        ISpeaker = from_protocol(Speaker)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            self.assertTrue(ISpeaker.provided_by(StructuralSpeaker()))
+        self.assertIn(StructuralSpeaker, ISpeaker._pi.structural_subclasses)
+        self.assertFalse(ISpeaker.provided_by(Mute()))
+
+    def test_protocol_sub_classes_are_nominal(self):
+        ISpeaker = from_protocol(Speaker)
+        speaker = NominalSpeaker()
+        self.assertIsInstance(speaker, ISpeaker)
+        self.assertEqual("HI", ISpeaker.adapt(speaker).speak("hi"))
+
+    def test_protocol_not_registered(self):
+        ISpeaker = from_protocol(Speaker)
+        self.assertNotIn(Speaker, list(ISpeaker._pi.iter_registered_types()))
+
+        class ISubSpeaker(ISpeaker, Interface):
+            pass
+
+        self.assertNotIsInstance(NominalSpeaker(), ISubSpeaker)
+
+    def test_method_only_protocol(self):
+        ISupportsInt = from_protocol(SupportsInt)
+        self.assertEqual(frozenset(("__int__",)), pure_interface.get_interface_method_names(ISupportsInt))
+        self.assertIsInstance(Integral(), ISupportsInt)
+        self.assertNotIsInstance(1, ISupportsInt)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            self.assertTrue(ISupportsInt.provided_by(1))
+        self.assertFalse(ISupportsInt.provided_by(Mute()))
+
+    def test_generic_protocol_sub_class(self):
+        IBox = from_protocol(Box)
+        self.assertIsInstance(IntBox(), IBox)
+        self.assertTrue(IBox[int].provided_by(IntBox()))
+        self.assertFalse(IBox.provided_by(Mute()))
+
+    def test_adaption(self):
+        ISpeaker = from_protocol(Speaker)
+        pure_interface.register_adapter(lambda obj: NominalSpeaker(), Mute, ISpeaker)
+        self.assertEqual("HI", ISpeaker.adapt(Mute()).speak("hi"))
+
+    def test_implementation(self):
+        ISpeaker = from_protocol(Speaker)
+
+        class Impl(ISpeaker):
+            def __init__(self):
+                self.volume = 1
+                self.name = "impl"
+
+            def speak(self, text):
+                return text
+
+            @staticmethod
+            def languages():
+                return []
+
+        self.assertTrue(ISpeaker.provided_by(Impl()))
+        self.assertEqual([ISpeaker], pure_interface.get_type_interfaces(Impl))
+
+    def test_not_protocol(self):
+        class IFoo(Interface):
+            pass
+
+        for not_protocol in (IFoo, Mute, Protocol, 1):
+            with self.assertRaises(pure_interface.InterfaceError):
+                from_protocol(not_protocol)  # type: ignore[arg-type]
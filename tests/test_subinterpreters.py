@@ -0,0 +1,120 @@
+# --------------------------------------------------------------------------------------------
+#  Copyright (c) 2024 Bentley Systems, Incorporated. All rights reserved.
+# --------------------------------------------------------------------------------------------
+
+import os
+import sys
+import threading
+import unittest
+
+import pure_interface
+
+try:
+    from concurrent import interpreters  # type: ignore[attr-defined]  # Python 3.14+
+except ImportError:
+    interpreters = None
+try:
+    import _interpreters  # type: ignore[import-not-found]  # Python 3.13
+except ImportError:
+    _interpreters = None
+try:
+    import _xxsubinterpreters  # type: ignore[import-not-found]  # Python 3.11 & 3.12
+except ImportError:
+    _xxsubinterpreters = None
+
+
+def _run_in_subinterpreter(code: str) -> None:
+    """Runs code in a new sub-interpreter, raising RuntimeError if the code raises."""
+    if interpreters is not None:
+        interp = interpreters.create()
+        try:
+            interp.exec(code)
+        except interpreters.ExecutionFailed as exc:
+            raise RuntimeError(str(exc)) from None
+        finally:
+            interp.close()
+    elif _interpreters is not None:
+        interp_id = _interpreters.create()
+        try:
+            failure = _interpreters.exec(interp_id, code)  # returns a description of the exception, if any
+        finally:
+            _interpreters.destroy(interp_id)
+        if failure is not None:
+            raise RuntimeError(getattr(failure, "formatted", None) or str(failure))
+    else:
+        interp_id = _xxsubinterpreters.create()
+        try:
+            _xxsubinterpreters.run_string(interp_id, code)
+        except _xxsubinterpreters.RunFailedError as exc:
+            raise RuntimeError(str(exc)) from None
+        finally:
+            _xxsubinterpreters.destroy(interp_id)
+
+
+_SCRIPT = """
+import sys
+sys.path.insert(0, {path!r})
+import pure_interface
+from pure_interface import Interface
+
+# a new interpreter gets its own copy of the module state
+assert pure_interface.get_is_development() is True, "state shared with another interpreter"
+assert not pure_interface.get_registries_frozen()
+pure_interface.set_is_development({development!r})
+
+class IGreeter(Interface):
+    def greet(self):
+        pass
+
+class Greeter(IGreeter):
+    def greet(self):
+        return {n!r}
+
+class Other:
+    pass
+
+pure_interface.register_adapter(lambda obj: Greeter(), Other, IGreeter)
+for _ in range(200):
+    assert IGreeter.adapt(Other()).greet() == {n!r}
+assert pure_interface.get_is_development() is {development!r}
+if {development!r}:
+    assert type(IGreeter.adapt(Greeter())).__name__ == "_IGreeterOnly"
+"""
+
+
+@unittest.skipIf(
+    interpreters is None and _interpreters is None and _xxsubinterpreters is None, "sub-interpreters are not supported"
+)
+class SubInterpreterTest(unittest.TestCase):
+    def test_concurrent_subinterpreters(self):
+        path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        errors = []
+
+        def run(n):
+            try:
+                _run_in_subinterpreter(_SCRIPT.format(path=path, n=n, development=n % 2 == 0))
+            except Exception as exc:
+                errors.append(exc)
+
+        was_development = pure_interface.get_is_development()
+        pure_interface.set_is_development(True)
+        try:
+            threads = [threading.Thread(target=run, args=(n,)) for n in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            self.assertEqual([], errors)
+            self.assertTrue(pure_interface.get_is_development())  # not changed by the sub-interpreters
+        finally:
+            pure_interface.set_is_development(was_development)
+
+    def test_module_not_shared(self):
+        self.assertIn("pure_interface", sys.modules)
+        path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        pure_interface.set_is_development(True)
+        pure_interface.freeze_registries()
+        try:
+            _run_in_subinterpreter(_SCRIPT.format(path=path, n=0, development=False))
+        finally:
+            pure_interface.unfreeze_registries()
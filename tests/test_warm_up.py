@@ -0,0 +1,134 @@
+# --------------------------------------------------------------------------------------------
+#  Copyright (c) 2024 Bentley Systems, Incorporated. All rights reserved.
+# --------------------------------------------------------------------------------------------
+
+import gc
+import unittest
+import warnings
+from typing import Protocol
+
+import pure_interface
+from pure_interface import Interface, _columns, delegation, interface
+
+
+class IGreeter(Interface):
+    name: str
+
+    def greet(self):
+        pass
+
+
+class IFarewell(Interface):
+    def bye(self):
+        pass
+
+
+class Greeter(IGreeter):
+    def __init__(self):
+        self.name = "greeter"
+
+    def greet(self):
+        return "hello"
+
+
+class StructuralGreeter:
+    name = "structural"
+
+    def greet(self):
+        return "hi"
+
+
+class Adaptee:
+    pass
+
+
+@pure_interface.adapts(Adaptee, IGreeter)
+def adapt_greeter(obj):
+    return Greeter()
+
+
+class WarmUpTest(unittest.TestCase):
+    def setUp(self):
+        pure_interface.set_is_development(True)
+
+    def tearDown(self):
+        pure_interface.unfreeze_registries()
+        gc.unfreeze()
+
+    def test_warm_up(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            pure_interface.warm_up(
+                interfaces=[IGreeter, IFarewell],
+                types=[Greeter, StructuralGreeter, Adaptee],
+                composed=[(IGreeter, IFarewell)],
+            )
+
+        self.assertIsNotNone(IGreeter._pi._interface_names)
+        self.assertIsNotNone(IGreeter._pi.impl_wrapper_type)
+        self.assertEqual((IGreeter,), Greeter._pi.type_interfaces)
+        self.assertIn(StructuralGreeter, IGreeter._pi.structural_subclasses)
+        self.assertIs(adapt_greeter, interface._adapter_cache[Adaptee][IGreeter])
+        self.assertIsNone(interface._adapter_cache[Adaptee][IFarewell])
+        self.assertIn(((IGreeter, IFarewell), False, True), delegation._composed_types_map)
+
+    def test_warm_up_checks_interfaces(self):
+        with self.assertRaises(pure_interface.InterfaceError):
+            pure_interface.warm_up(interfaces=[Greeter])
+
+    def test_freeze(self):
+        pure_interface.warm_up(interfaces=[IGreeter], types=[Greeter], freeze=True)
+        self.assertTrue(pure_interface.get_registries_frozen())
+
+        class Other:
+            pass
+
+        with self.assertRaises(pure_interface.InterfaceError):
+            pure_interface.register_adapter(adapt_greeter, Other, IGreeter)
+        with self.assertRaises(pure_interface.InterfaceError):
+            IGreeter.register(Other)
+        # lookups still work, but are not cached
+        self.assertEqual([], pure_interface.get_type_interfaces(Other))
+        self.assertNotIn(Other, interface._type_interfaces_cache)
+        self.assertIsNone(interface._get_adapter(IGreeter, Other))
+        self.assertNotIn(Other, interface._adapter_cache)
+
+        pure_interface.unfreeze_registries()
+        pure_interface.register_adapter(adapt_greeter, Other, IGreeter)
+        self.assertIsInstance(IGreeter.adapt(Other(), interface_only=False), Greeter)
+
+    def test_frozen_lazy_state_not_stored(self):
+        class IPoint(Interface):
+            x: int
+
+        class Point:
+            def __init__(self, x):
+                self.x = x
+
+        @pure_interface.interface_dispatch
+        def describe(obj):
+            return "object"
+
+        pure_interface.freeze_registries()
+        self.assertEqual(frozenset(["x"]), IPoint._pi.interface_names)
+        self.assertIsNone(IPoint._pi._interface_names)
+        self.assertEqual([1], IPoint.to_columns([Point(1)])["x"])
+        self.assertEqual([1], [row.x for row in IPoint.from_columns({"x": [1]})])
+        self.assertNotIn(IPoint, _columns._extractors)
+        self.assertNotIn(IPoint, _columns._row_view_types)
+        self.assertEqual("object", describe(Point(1)))
+        self.assertEqual(0, len(describe.cache_clear.__self__))  # the dispatch cache
+
+    def test_from_protocol_frozen(self):
+        class Named(Protocol):
+            name: str
+
+        INamed = pure_interface.from_protocol(Named)
+
+        class Sized(Protocol):
+            size: int
+
+        pure_interface.freeze_registries()
+        self.assertIs(INamed, pure_interface.from_protocol(Named))
+        with self.assertRaises(pure_interface.InterfaceError):
+            pure_interface.from_protocol(Sized)